@@ -0,0 +1,119 @@
+"""
+Local OSRM stand-in serving /route/v1 and /table/v1 with Manhattan distances
+(1 degree == 1000 m at 10 m/s), used by the tests and the benchmarks.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+def _stub_leg(a: tuple[float, float], b: tuple[float, float]) -> tuple[float, float]:
+    # Manhattan distance in degrees, 1 degree == 1000 m, 10 m/s
+    meters = (abs(a[0] - b[0]) + abs(a[1] - b[1])) * 1000.0
+    return meters, meters / 10.0
+
+
+class OsrmStubHandler(BaseHTTPRequestHandler):
+    server: OsrmStubServer
+    # Keep-alive, so tests can count how many TCP connections a client opens
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def log_message(self, format, *args):  # noqa: A002
+        return None
+
+    def do_GET(self):  # noqa: N802
+        parsed = urlsplit(self.path)
+        parts = parsed.path.strip("/").split("/")
+        query = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+        with self.server.lock:
+            self.server.requests.append((parsed.path, query))
+            status = self.server.fail_next.pop(0) if self.server.fail_next else None
+        if self.server.latency_seconds:
+            time.sleep(self.server.latency_seconds)
+        if status is not None:
+            self._send(status, {"code": "Error"})
+            return
+
+        service = parts[0]
+        coords = [tuple(map(float, c.split(","))) for c in parts[3].split(";")]
+
+        if service == "route":
+            meters, seconds = _stub_leg(coords[0], coords[1])
+            body = {"code": "Ok", "routes": [{"distance": meters, "duration": seconds}]}
+        elif service == "table":
+            if len(coords) > self.server.max_table_size:
+                self._send(400, {"code": "TooBig"})
+                return
+            sources = [int(i) for i in query["sources"].split(";")] if "sources" in query else None
+            dests = (
+                [int(i) for i in query["destinations"].split(";")]
+                if "destinations" in query
+                else None
+            )
+            sources = sources if sources is not None else list(range(len(coords)))
+            dests = dests if dests is not None else list(range(len(coords)))
+            distances = [[_stub_leg(coords[s], coords[d])[0] for d in dests] for s in sources]
+            durations = [[_stub_leg(coords[s], coords[d])[1] for d in dests] for s in sources]
+            body = {"code": "Ok", "distances": distances, "durations": durations}
+        else:
+            self._send(404, {"code": "InvalidService"})
+            return
+
+        self._send(200, body)
+
+    def _send(self, status: int, body: dict) -> None:
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class OsrmStubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, max_table_size: int = 100, latency_seconds: float = 0.0) -> None:
+        super().__init__(("127.0.0.1", 0), OsrmStubHandler)
+        self.max_table_size = max_table_size
+        self.requests: list[tuple[str, dict[str, str]]] = []
+        self.connections = 0
+        # Statuses to answer the next requests with, e.g. [503, 502]
+        self.fail_next: list[int] = []
+        # Added to every response, to mimic a remote or loaded server
+        self.latency_seconds = latency_seconds
+        self.lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        if isinstance(host, bytes):
+            host = host.decode()
+        return f"http://{host}:{port}"
+
+
+@contextmanager
+def serve_osrm_stub(
+    *, max_table_size: int = 100, latency_seconds: float = 0.0
+) -> Iterator[OsrmStubServer]:
+    """Run an OsrmStubServer on a free localhost port for the duration of the block."""
+    server = OsrmStubServer(max_table_size=max_table_size, latency_seconds=latency_seconds)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
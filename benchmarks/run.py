@@ -0,0 +1,397 @@
+"""
+Benchmark harness: times planners, distance providers and the cache on seeded
+synthetic trips and writes machine-readable results.
+
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --baseline results.json   # exit 1 on regression
+
+Every result records wall time (best of --repeat runs), provider calls and
+peak traced memory. Calls are deterministic, so any increase over the
+baseline is a regression; time is compared against --max-slowdown.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from gotrippee.distance.cache import cached_distance_fn
+from gotrippee.distance.haversine import haversine_distance_fn, haversine_matrix_fn
+from gotrippee.distance.matrix import SymmetricDistanceMatrix
+from gotrippee.distance.osrm import async_osrm_distance_fn, osrm_matrix_fn
+from gotrippee.domain.models import Location
+from gotrippee.domain.table import LocationTable
+from gotrippee.planner import plan_route, plan_route_async
+from gotrippee.planner.exact import plan_route_exact_round_trip
+from gotrippee.planner.local_search import plan_route_local_search_round_trip
+from gotrippee.planner.naive import (
+    order_stops_nearest_neighbour,
+    plan_route_naive_round_trip,
+    plan_route_naive_round_trip_indexed,
+)
+from gotrippee.planner.spatial import order_stops_nearest_neighbour_spatial
+
+from .osrm_stub import OsrmStubServer, serve_osrm_stub
+from .synthetic import synthetic_stops
+
+DEFAULT_SIZES = (10, 100, 1_000, 10_000, 50_000)
+
+DistanceFn = Callable[[Location, Location], tuple[float, float]]
+
+
+@dataclass
+class Context:
+    seed: int
+    server: OsrmStubServer
+    tmp_dir: Path
+
+
+@dataclass(frozen=True, slots=True)
+class Scenario:
+    """
+    setup(n, ctx) builds the inputs outside the timed region and returns a
+    zero-argument callable; calling it runs one timed iteration and returns
+    the number of provider calls it made.
+    """
+
+    name: str
+    max_n: int
+    setup: Callable[[int, Context], Callable[[], int]]
+
+
+class _Counting:
+    """Distance fn wrapper that counts calls to the wrapped provider."""
+
+    def __init__(self, distance_fn: DistanceFn) -> None:
+        self.distance_fn = distance_fn
+        self.calls = 0
+
+    def __call__(self, a: Location, b: Location) -> tuple[float, float]:
+        self.calls += 1
+        return self.distance_fn(a, b)
+
+
+def _stops(n: int, ctx: Context) -> list[Location]:
+    return list(synthetic_stops(n, seed=ctx.seed))
+
+
+def _nn_order(n: int, ctx: Context) -> Callable[[], int]:
+    stops = _stops(n, ctx)
+
+    def run() -> int:
+        fn = _Counting(haversine_distance_fn())
+        order_stops_nearest_neighbour(stops=stops, distance_fn=fn)
+        return fn.calls
+
+    return run
+
+
+def _nn_order_spatial(n: int, ctx: Context) -> Callable[[], int]:
+    stops = _stops(n, ctx)
+
+    def run() -> int:
+        fn = _Counting(haversine_distance_fn())
+        order_stops_nearest_neighbour_spatial(stops=stops, distance_fn=fn)
+        return fn.calls
+
+    return run
+
+
+def _haversine_matrix(n: int, ctx: Context) -> Callable[[], int]:
+    table = synthetic_stops(n, seed=ctx.seed)
+    matrix_fn = haversine_matrix_fn()
+
+    def run() -> int:
+        matrix_fn(table)
+        return 1
+
+    return run
+
+
+def _indexed_planner(
+    planner: Callable[..., Any], *, packed: str | None = None
+) -> Callable[[int, Context], Callable[[], int]]:
+    def setup(n: int, ctx: Context) -> Callable[[], int]:
+        matrix: Any = haversine_matrix_fn()(synthetic_stops(n, seed=ctx.seed))
+        if packed is not None:
+            matrix = SymmetricDistanceMatrix.from_matrix(matrix, dtype=packed)
+
+        def run() -> int:
+            planner(start=0, stops=range(1, n), matrix=matrix)
+            return 0
+
+        return run
+
+    return setup
+
+
+def _cached_round_trip(n: int, ctx: Context) -> Callable[[], int]:
+    stops = _stops(n, ctx)
+
+    def run() -> int:
+        # Second pass is answered from the cache
+        fn = _Counting(haversine_distance_fn())
+        cached = cached_distance_fn(fn)
+        for _ in range(2):
+            plan_route_naive_round_trip(start=stops[0], stops=stops[1:], distance_fn=cached)
+        return fn.calls
+
+    return run
+
+
+def _cached_jittered(precision: int | None) -> Callable[[int, Context], Callable[[], int]]:
+    def setup(n: int, ctx: Context) -> Callable[[], int]:
+        # The same stops as returned by a second geocoder: ~1e-7 degrees off
+        stops = _stops(n, ctx)
+        rng = random.Random(ctx.seed)
+        twins = [
+            Location(
+                name=s.name,
+                latitude=s.latitude + rng.uniform(-1e-7, 1e-7),
+                longitude=s.longitude + rng.uniform(-1e-7, 1e-7),
+            )
+            for s in stops
+        ]
+
+        def run() -> int:
+            fn = _Counting(haversine_distance_fn())
+            cached = cached_distance_fn(fn, precision=precision)
+            plan_route(stops=stops, distance_fn=cached)
+            plan_route(stops=twins, distance_fn=cached)
+            return fn.calls
+
+        return run
+
+    return setup
+
+
+def _osrm_matrix(n: int, ctx: Context) -> Callable[[], int]:
+    table = synthetic_stops(n, seed=ctx.seed)
+    matrix_fn = osrm_matrix_fn(base_url=ctx.server.base_url)
+
+    def run() -> int:
+        before = len(ctx.server.requests)
+        matrix_fn(table)
+        return len(ctx.server.requests) - before
+
+    return run
+
+
+def _osrm_route_async(n: int, ctx: Context) -> Callable[[], int]:
+    stops = _stops(n, ctx)
+    distance_fn = async_osrm_distance_fn(base_url=ctx.server.base_url, max_concurrency=10)
+
+    def run() -> int:
+        before = len(ctx.server.requests)
+        asyncio.run(plan_route_async(stops=stops, distance_fn=distance_fn))
+        return len(ctx.server.requests) - before
+
+    return run
+
+
+def _plan_route(n: int, ctx: Context) -> Callable[[], int]:
+    stops = _stops(n, ctx)
+
+    def run() -> int:
+        fn = _Counting(haversine_distance_fn())
+        plan_route(stops=stops, distance_fn=fn)
+        return fn.calls
+
+    return run
+
+
+def _csv_ingest(n: int, ctx: Context) -> Callable[[], int]:
+    table = synthetic_stops(n, seed=ctx.seed)
+    path = ctx.tmp_dir / f"stops-{n}.csv"
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("name,latitude,longitude\n")
+        for loc in table:
+            f.write(f"{loc.name},{loc.latitude},{loc.longitude}\n")
+
+    def run() -> int:
+        LocationTable.from_csv(path)
+        return 0
+
+    return run
+
+
+SCENARIOS: tuple[Scenario, ...] = (
+    Scenario("nn_order", 1_000, _nn_order),
+    Scenario("nn_order_spatial", 10_000, _nn_order_spatial),
+    Scenario("haversine_matrix", 1_000, _haversine_matrix),
+    Scenario(
+        "naive_indexed_round_trip", 1_000, _indexed_planner(plan_route_naive_round_trip_indexed)
+    ),
+    Scenario(
+        "naive_indexed_round_trip_packed_float32",
+        1_000,
+        _indexed_planner(plan_route_naive_round_trip_indexed, packed="float32"),
+    ),
+    Scenario(
+        "local_search_round_trip", 1_000, _indexed_planner(plan_route_local_search_round_trip)
+    ),
+    Scenario("exact_round_trip", 10, _indexed_planner(plan_route_exact_round_trip)),
+    Scenario("cached_naive_round_trip", 1_000, _cached_round_trip),
+    Scenario("cached_jittered_exact_keys", 50_000, _cached_jittered(None)),
+    Scenario("cached_jittered_quantized_keys", 50_000, _cached_jittered(5)),
+    Scenario("osrm_matrix", 1_000, _osrm_matrix),
+    Scenario("osrm_route_async", 100, _osrm_route_async),
+    Scenario("plan_route", 50_000, _plan_route),
+    Scenario("csv_ingest", 50_000, _csv_ingest),
+)
+
+
+def run_benchmarks(
+    *,
+    scenarios: Sequence[str] | None = None,
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    repeat: int = 3,
+    seed: int = 0,
+    latency_seconds: float = 0.0,
+    measure_memory: bool = True,
+) -> dict[str, Any]:
+    """Run the selected scenarios at every size up to their max_n."""
+    if repeat < 1:
+        raise ValueError(f"repeat must be >= 1, got {repeat}")
+    known = {s.name: s for s in SCENARIOS}
+    unknown = sorted(set(scenarios or ()) - set(known))
+    if unknown:
+        raise ValueError(f"unknown scenarios: {', '.join(unknown)}")
+    selected = [known[name] for name in scenarios] if scenarios else list(SCENARIOS)
+
+    results: list[dict[str, Any]] = []
+    with serve_osrm_stub(
+        max_table_size=100, latency_seconds=latency_seconds
+    ) as server, tempfile.TemporaryDirectory() as tmp:
+        ctx = Context(seed=seed, server=server, tmp_dir=Path(tmp))
+        for scenario in selected:
+            for n in sorted(sizes):
+                if n > scenario.max_n:
+                    continue
+                run = scenario.setup(n, ctx)
+                timings = []
+                for _ in range(repeat):
+                    started = time.perf_counter()
+                    calls = run()
+                    timings.append(time.perf_counter() - started)
+                result = {
+                    "scenario": scenario.name,
+                    "n": n,
+                    "seconds": min(timings),
+                    "calls": calls,
+                }
+                if measure_memory:
+                    with _traced() as peak:
+                        run()
+                    result["peak_bytes"] = peak[0]
+                results.append(result)
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": seed,
+            "repeat": repeat,
+            "latency_seconds": latency_seconds,
+        },
+        "results": results,
+    }
+
+
+@contextmanager
+def _traced() -> Iterator[list[int]]:
+    peak = [0]
+    tracemalloc.start()
+    try:
+        yield peak
+        peak[0] = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def find_regressions(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    *,
+    max_slowdown: float = 1.25,
+) -> list[str]:
+    """Describe every (scenario, n) that got slower than allowed or made more calls."""
+    before = {(r["scenario"], r["n"]): r for r in baseline["results"]}
+    problems = []
+    for r in current["results"]:
+        old = before.get((r["scenario"], r["n"]))
+        if old is None:
+            continue
+        label = f"{r['scenario']} n={r['n']}"
+        if r["calls"] > old["calls"]:
+            problems.append(f"{label}: calls {old['calls']} -> {r['calls']}")
+        if r["seconds"] > old["seconds"] * max_slowdown:
+            problems.append(f"{label}: {old['seconds']:.4f}s -> {r['seconds']:.4f}s")
+    return problems
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        dest="scenarios",
+        choices=[s.name for s in SCENARIOS],
+        help="run only these (repeatable)",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=lambda s: [int(x) for x in s.split(",")],
+        default=list(DEFAULT_SIZES),
+        help="comma-separated stop counts",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--latency-ms", type=float, default=0.0, help="added to every stub OSRM response"
+    )
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    parser.add_argument("--output", type=Path, help="write JSON here instead of stdout")
+    parser.add_argument("--baseline", type=Path, help="compare against an earlier --output")
+    parser.add_argument("--max-slowdown", type=float, default=1.25)
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(
+        scenarios=args.scenarios,
+        sizes=args.sizes,
+        repeat=args.repeat,
+        seed=args.seed,
+        latency_seconds=args.latency_ms / 1000.0,
+        measure_memory=not args.no_memory,
+    )
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        problems = find_regressions(
+            report, json.loads(args.baseline.read_text()), max_slowdown=args.max_slowdown
+        )
+        for problem in problems:
+            print(f"REGRESSION {problem}", file=sys.stderr)
+        return 1 if problems else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
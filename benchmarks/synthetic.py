@@ -0,0 +1,51 @@
+"""Seeded synthetic stop sets for the benchmarks."""
+
+from __future__ import annotations
+
+import random
+from array import array
+
+from gotrippee.domain.table import LocationTable
+
+# Roughly Great Britain, so great-circle and Manhattan stub distances stay sane
+DEFAULT_BBOX = (50.0, -6.0, 58.0, 2.0)
+
+
+def synthetic_stops(
+    n: int,
+    *,
+    seed: int = 0,
+    clustered: bool = False,
+    bbox: tuple[float, float, float, float] = DEFAULT_BBOX,
+) -> LocationTable:
+    """
+    n stops named S0..S{n-1} inside bbox (min_lat, min_lon, max_lat, max_lon).
+
+    Uniform by default; clustered=True scatters them around n // 100 + 1 town
+    centres, which is closer to real delivery or POI data. The same (n, seed,
+    clustered, bbox) always gives the same stops.
+    """
+    if n < 0:
+        raise ValueError(f"n must be >= 0, got {n}")
+    min_lat, min_lon, max_lat, max_lon = bbox
+    rng = random.Random(seed)
+
+    if not clustered:
+        lats = [rng.uniform(min_lat, max_lat) for _ in range(n)]
+        lons = [rng.uniform(min_lon, max_lon) for _ in range(n)]
+    else:
+        centres = [
+            (rng.uniform(min_lat, max_lat), rng.uniform(min_lon, max_lon))
+            for _ in range(n // 100 + 1)
+        ]
+        lats, lons = [], []
+        for _ in range(n):
+            lat, lon = rng.choice(centres)
+            lats.append(min(max(rng.gauss(lat, 0.05), min_lat), max_lat))
+            lons.append(min(max(rng.gauss(lon, 0.08), min_lon), max_lon))
+
+    return LocationTable(
+        names=[f"S{i}" for i in range(n)],
+        latitudes=array("d", lats),
+        longitudes=array("d", lons),
+    )
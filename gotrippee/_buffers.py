@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import os
+import struct
+import sys
+from array import array
+from typing import Any, Literal
+
+PathLike = str | os.PathLike[str]
+
+# Typecodes the on-disk and shared-memory layouts use
+Typecode = Literal["d", "f", "I"]
+
+
+class SectionReader:
+    """
+    Reads consecutive sections of a little-endian buffer (an mmap or a
+    shared-memory block) in place.
+
+    Sections come back as zero-copy memoryviews; big-endian hosts get
+    byteswapped array copies instead. Call release() before closing the
+    buffer, which refuses to close while views into it are alive.
+    """
+
+    def __init__(self, buffer: Any, offset: int = 0) -> None:
+        self._buffer = buffer
+        self.offset = offset
+        self._views: list[memoryview[Any]] = []
+
+    def take(self, fmt: Typecode, count: int) -> Any:
+        """The next `count` values of array typecode `fmt`."""
+        start = self.offset
+        self.offset += struct.calcsize(fmt) * count
+        raw = memoryview(self._buffer)[start : self.offset]
+        if sys.byteorder != "little":
+            values = array(fmt, raw.tobytes())
+            values.byteswap()
+            raw.release()
+            return values
+        view = raw.cast(fmt)
+        self._views += [raw, view]
+        return view
+
+    def take_bytes(self, size: int) -> bytes:
+        """The next `size` bytes, copied."""
+        start = self.offset
+        self.offset += size
+        return bytes(self._buffer[start : self.offset])
+
+    def release(self) -> None:
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
@@ -1 +1,23 @@
-from .cache import cached_distance_fn
\ No newline at end of file
+from .aio import AsyncDistanceFn, async_distance_fn
+from .cache import CacheInfo, cached_distance_fn, quantization_error_km
+from .haversine import great_circle_km, haversine_distance_fn, haversine_matrix_fn
+from .matrix import DistanceMatrix, MatrixFn, SymmetricDistanceMatrix
+from .persistent import SQLiteDistanceStore, persistent_distance_fn
+from .shared import SharedDistanceMatrix
+
+__all__ = [
+    "AsyncDistanceFn",
+    "CacheInfo",
+    "DistanceMatrix",
+    "MatrixFn",
+    "SQLiteDistanceStore",
+    "SharedDistanceMatrix",
+    "SymmetricDistanceMatrix",
+    "async_distance_fn",
+    "cached_distance_fn",
+    "great_circle_km",
+    "haversine_distance_fn",
+    "haversine_matrix_fn",
+    "persistent_distance_fn",
+    "quantization_error_km",
+]
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import weakref
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from gotrippee.domain.models import Location
+
+DistanceFn = Callable[[Location, Location], tuple[float, float]]
+AsyncDistanceFn = Callable[[Location, Location], Awaitable[tuple[float, float]]]
+
+
+def async_distance_fn(distance_fn: DistanceFn, *, max_concurrency: int = 10) -> AsyncDistanceFn:
+    """
+    Adapt a blocking DistanceFn to asyncio by running calls in worker threads.
+
+    Calls run on a dedicated pool of max_concurrency threads rather than the
+    loop's default executor, which caps at min(32, cpu_count + 4) workers.
+    At most max_concurrency calls are in flight per event loop; the rest
+    wait on a semaphore. Provider attributes (symmetric, cache_namespace) are
+    carried over.
+    """
+    if max_concurrency < 1:
+        raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+
+    executor = ThreadPoolExecutor(
+        max_workers=max_concurrency, thread_name_prefix="gotrippee-distance"
+    )
+    # One semaphore per running loop (asyncio primitives are loop-bound)
+    semaphores: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+        weakref.WeakKeyDictionary()
+    )
+
+    async def _distance(a: Location, b: Location) -> tuple[float, float]:
+        loop = asyncio.get_running_loop()
+        semaphore = semaphores.get(loop)
+        if semaphore is None:
+            semaphore = semaphores[loop] = asyncio.Semaphore(max_concurrency)
+        # Like asyncio.to_thread, run in a copy of the caller's context
+        call = functools.partial(contextvars.copy_context().run, distance_fn, a, b)
+        async with semaphore:
+            return await loop.run_in_executor(executor, call)
+
+    for attr in ("symmetric", "cache_namespace"):
+        if hasattr(distance_fn, attr):
+            setattr(_distance, attr, getattr(distance_fn, attr))
+    return _distance
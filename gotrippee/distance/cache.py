@@ -1,30 +1,232 @@
 from __future__ import annotations
 
+import math
+import sys
+import threading
+import time
+from collections import OrderedDict
 from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass
 
 from gotrippee.domain.models import Location
+from gotrippee.instrumentation import current_instrumentation
+
+from .haversine import EARTH_RADIUS_KM
 
 DistanceFN = Callable[[Location, Location], tuple[float, float]]
 
+CacheKey = tuple[str, tuple[float, float], tuple[float, float]]
+
+
+@dataclass(frozen=True, slots=True)
+class CacheInfo:
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    estimates: int
+    coalesced: int
+    size: int
+    max_entries: int | None
+    approx_bytes: int
+    max_error_km: float = 0.0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Share of lookups answered without a new provider call."""
+        lookups = self.hits + self.coalesced + self.misses
+        return (self.hits + self.coalesced) / lookups if lookups else 0.0
+
+
+def quantization_error_km(precision: int) -> float:
+    """
+    Worst-case error a `precision`-decimal coordinate grid adds to a cached
+    distance. A cell answers with the distance computed for the first point
+    seen in it, and another point can lie a full cell diagonal away from it,
+    at both endpoints (largest at the equator). 5 => ~3.1 m, 4 => ~31 m.
+    """
+    if precision < 0:
+        raise ValueError(f"precision must be >= 0, got {precision}")
+    diagonal_degrees = math.sqrt(2) * 10.0**-precision
+    return 2 * math.radians(diagonal_degrees) * EARTH_RADIUS_KM
+
+
+def _entry_bytes(key: CacheKey, entry: object) -> int:
+    # Rough per-entry footprint: key + value objects plus the OrderedDict slot
+    # (hash table entry + linked-list node)
+    points = key[1:]
+    size = sys.getsizeof(key) + sum(sys.getsizeof(p) for p in points)
+    size += sum(sys.getsizeof(c) for p in points for c in p)
+    size += sys.getsizeof(entry)
+    if isinstance(entry, tuple):
+        size += sum(sys.getsizeof(v) for v in entry)
+    return size + 100
+
+
+def cached_distance_fn(
+    distance_fn: DistanceFN,
+    *,
+    max_entries: int | None = None,
+    ttl_seconds: float | None = None,
+    clock: Callable[[], float] = time.monotonic,
+    symmetric: bool | None = None,
+    namespace: str | None = None,
+    reverse_estimates: bool = False,
+    precision: int | None = None,
+) -> DistanceFN:
+    """
+    Memoize distance_fn.
+
+    - Keys are directional: (a, b) and (b, a) are separate entries, because
+      road routing is asymmetric. symmetric=True shares them; by default it
+      follows distance_fn.symmetric if the provider declares it.
+    - Keys are namespaced per provider/profile, from namespace or
+      distance_fn.cache_namespace.
+    - precision=p snaps key coordinates to a p-decimal grid, so stops that
+      differ only by geocoder noise share entries. Any two stops in the same
+      cell are treated as one, so answers may be off by up to
+      quantization_error_km(p) (also reported as cache_info().max_error_km).
+    - reverse_estimates=True answers a missing (a, b) from a cached (b, a)
+      without calling distance_fn; those are counted as estimates.
+    - max_entries bounds the cache; the least recently used entry is evicted.
+    - ttl_seconds expires entries that old, so road times get refreshed.
+    - Safe to share between threads. Concurrent misses for the same key make
+      one provider call; the other callers wait for it (counted as coalesced).
+    - The returned function has cache_info() -> CacheInfo and cache_clear().
+    """
+    if max_entries is not None and max_entries < 1:
+        raise ValueError(f"max_entries must be >= 1, got {max_entries}")
+    if ttl_seconds is not None and ttl_seconds <= 0:
+        raise ValueError(f"ttl_seconds must be > 0, got {ttl_seconds}")
+    max_error_km = 0.0 if precision is None else quantization_error_km(precision)
+
+    # value, or (value, expires_at) when a TTL is set
+    cache: OrderedDict[CacheKey, tuple] = OrderedDict()
+    in_flight: dict[CacheKey, Future[tuple[float, float]]] = {}
+    lock = threading.Lock()
+    stats = {
+        "hits": 0,
+        "misses": 0,
+        "evictions": 0,
+        "expirations": 0,
+        "estimates": 0,
+        "coalesced": 0,
+        "entry_bytes": 0,
+    }
 
-def cached_distance_fn(distance_fn: DistanceFN) -> DistanceFN:
-    cache: dict[
-        tuple[tuple[float, float], tuple[float, float]],
-        tuple[float, float],
-    ] = {}
+    if symmetric is None:
+        symmetric = bool(getattr(distance_fn, "symmetric", False))
+    if namespace is None:
+        namespace = getattr(distance_fn, "cache_namespace", "")
+    scale = 10**precision if precision is not None else 1
+
+    def key_for(a: Location, b: Location) -> CacheKey:
+        if precision is None:
+            p1 = (a.latitude, a.longitude)
+            p2 = (b.latitude, b.longitude)
+        else:
+            p1 = (round(a.latitude * scale), round(a.longitude * scale))
+            p2 = (round(b.latitude * scale), round(b.longitude * scale))
+        if symmetric and p2 < p1:
+            #symmetry: (a,b) == (b,a)
+            return (namespace, p2, p1)
+        return (namespace, p1, p2)
+
+    def _lookup(key: CacheKey) -> tuple[float, float] | None:
+        entry = cache.get(key)
+        if entry is None:
+            return None
+        value: tuple[float, float]
+        if ttl_seconds is not None:
+            value, expires_at = entry
+            if clock() >= expires_at:
+                del cache[key]
+                stats["expirations"] += 1
+                return None
+        else:
+            value = entry
+        if max_entries is not None:
+            cache.move_to_end(key)
+        return value
+
+    def _store(key: CacheKey, value: tuple[float, float]) -> None:
+        entry = value if ttl_seconds is None else (value, clock() + ttl_seconds)
+        cache[key] = entry
+        if not stats["entry_bytes"]:
+            stats["entry_bytes"] = _entry_bytes(key, entry)
+        if max_entries is not None and len(cache) > max_entries:
+            cache.popitem(last=False)
+            stats["evictions"] += 1
 
-    def key_for(a: Location, b: Location) -> tuple[tuple[float, float], tuple[float, float]]:
-        p1 = (a.latitude, a.longitude)
-        p2 = (b.latitude, b.longitude)
-        #symmetry: (a,b) == (b,a)
-        return (p1, p2) if p1 <= p2 else (p2, p1)
-    
     def _distance(a: Location, b: Location) -> tuple[float, float]:
         key = key_for(a, b)
-        if key in cache:
-            return cache[key]
-        value = distance_fn(a, b)
-        cache[key] = value
+        recorder = current_instrumentation()
+        with lock:
+            value = _lookup(key)
+            if value is not None:
+                stats["hits"] += 1
+                if recorder is not None:
+                    recorder.count("cache.hits")
+                return value
+            if reverse_estimates and not symmetric:
+                value = _lookup(key_for(b, a))
+                if value is not None:
+                    stats["estimates"] += 1
+                    if recorder is not None:
+                        recorder.count("cache.estimates")
+                    return value
+
+            waiting = in_flight.get(key)
+            if waiting is None:
+                stats["misses"] += 1
+                if recorder is not None:
+                    recorder.count("cache.misses")
+                future: Future[tuple[float, float]] = Future()
+                in_flight[key] = future
+            else:
+                stats["coalesced"] += 1
+                if recorder is not None:
+                    recorder.count("cache.coalesced")
+
+        if waiting is not None:
+            return waiting.result()
+
+        try:
+            value = distance_fn(a, b)
+        except BaseException as exc:
+            with lock:
+                del in_flight[key]
+            future.set_exception(exc)
+            raise
+
+        with lock:
+            _store(key, value)
+            del in_flight[key]
+        future.set_result(value)
         return value
-    
-    return _distance
\ No newline at end of file
+
+    def cache_info() -> CacheInfo:
+        return CacheInfo(
+            hits=stats["hits"],
+            misses=stats["misses"],
+            evictions=stats["evictions"],
+            expirations=stats["expirations"],
+            estimates=stats["estimates"],
+            coalesced=stats["coalesced"],
+            size=len(cache),
+            max_entries=max_entries,
+            approx_bytes=len(cache) * stats["entry_bytes"],
+            max_error_km=max_error_km,
+        )
+
+    def cache_clear() -> None:
+        with lock:
+            cache.clear()
+            for name in stats:
+                if name != "entry_bytes":
+                    stats[name] = 0
+
+    _distance.cache_info = cache_info  # type: ignore[attr-defined]
+    _distance.cache_clear = cache_clear  # type: ignore[attr-defined]
+    return _distance
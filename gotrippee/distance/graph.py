@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import heapq
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any
+
+from gotrippee._buffers import PathLike, SectionReader, Typecode
+from gotrippee.domain.models import Location
+from gotrippee.domain.table import coordinate_columns, snapshot_locations
+from gotrippee.spatial import SpatialIndex
+
+from .haversine import great_circle_km
+from .matrix import DistanceMatrix, MatrixFn
+
+DistanceFn = Callable[[Location, Location], tuple[float, float]]
+
+# magic, version, node count, edge count
+_HEADER = struct.Struct("<4sIII")
+_MAGIC = b"GTRG"
+_VERSION = 1
+
+_INF = float("inf")
+
+# (seconds, meters) of the quickest path, or None when there is none
+PathCost = tuple[float, float] | None
+
+
+def write_road_graph(
+    path: PathLike,
+    *,
+    latitudes: Sequence[float],
+    longitudes: Sequence[float],
+    edges: Iterable[tuple[int, int, float, float]],
+) -> None:
+    """
+    Write a road graph file that RoadGraph can open.
+
+    edges are directed (from_node, to_node, length_m, speed_kmh); add both
+    directions for two-way roads. The file is little-endian and stores
+    node coordinates plus forward and reverse adjacency (CSR) with per-edge
+    length and travel time, so it can be memory-mapped as-is.
+    """
+    n = len(latitudes)
+    if len(longitudes) != n:
+        raise ValueError(f"longitudes must have {n} entries, got {len(longitudes)}")
+
+    src, dst, meters, seconds = array("I"), array("I"), array("f"), array("f")
+    for u, v, length_m, speed_kmh in edges:
+        if not (0 <= u < n and 0 <= v < n):
+            raise ValueError(f"edge nodes must be between 0 and {n - 1}, got ({u}, {v})")
+        if length_m < 0:
+            raise ValueError(f"length_m must be >= 0, got {length_m}")
+        if speed_kmh <= 0:
+            raise ValueError(f"speed_kmh must be > 0, got {speed_kmh}")
+        src.append(u)
+        dst.append(v)
+        meters.append(length_m)
+        seconds.append(length_m / (speed_kmh / 3.6))
+
+    sections: list[array[Any]] = [array("d", latitudes), array("d", longitudes)]
+    for heads, tails in ((src, dst), (dst, src)):
+        order = sorted(range(len(heads)), key=heads.__getitem__)
+        offsets = array("I", bytes(4 * (n + 1)))
+        for u in heads:
+            offsets[u + 1] += 1
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+        sections += [
+            offsets,
+            array("I", (tails[k] for k in order)),
+            array("f", (meters[k] for k in order)),
+            array("f", (seconds[k] for k in order)),
+        ]
+
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION, n, len(src)))
+        for section in sections:
+            if sys.byteorder != "little":
+                section.byteswap()
+            section.tofile(f)
+
+
+class _Adjacency:
+    __slots__ = ("offsets", "nodes", "meters", "seconds")
+
+    def __init__(self, offsets: Any, nodes: Any, meters: Any, seconds: Any) -> None:
+        self.offsets = offsets
+        self.nodes = nodes
+        self.meters = meters
+        self.seconds = seconds
+
+
+class RoadGraph:
+    """
+    Directed road graph loaded from a write_road_graph file.
+
+    The file is memory-mapped and read in place, so opening it is O(1) and
+    pages are shared between processes. Searches minimize travel time (like
+    OSRM) and report the length of that path too.
+    """
+
+    def __init__(self, path: PathLike) -> None:
+        self.path = os.fspath(path)
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._reader = SectionReader(self._mmap, _HEADER.size)
+        try:
+            magic, version, n, m = _HEADER.unpack_from(self._mmap, 0)
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError(f"{self.path} is not a version {_VERSION} road graph file")
+            self.latitudes = self._reader.take("d", n)
+            self.longitudes = self._reader.take("d", n)
+            # offsets, neighbour nodes, meters, seconds; forward then reverse
+            adjacency: list[tuple[Typecode, int]] = [("I", n + 1), ("I", m), ("f", m), ("f", m)]
+            self._forward, self._backward = (
+                _Adjacency(*(self._reader.take(fmt, count) for fmt, count in adjacency))
+                for _ in range(2)
+            )
+        except BaseException:
+            self.close()
+            raise
+        self.n_nodes = n
+        self.n_edges = m
+        self._index: SpatialIndex | None = None
+
+    def close(self) -> None:
+        self._reader.release()
+        self._mmap.close()
+
+    def __enter__(self) -> RoadGraph:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def snap(self, latitude: float, longitude: float) -> tuple[int, float]:
+        """Nearest node to a coordinate and its great-circle distance in km."""
+        if self._index is None:
+            if not self.n_nodes:
+                raise ValueError("road graph has no nodes")
+            self._index = SpatialIndex(list(zip(self.latitudes, self.longitudes, strict=True)))
+        km, node = next(self._index.nearest(latitude, longitude))
+        return node, km
+
+    def route(self, source: int, target: int) -> PathCost:
+        """Quickest source -> target path by bidirectional Dijkstra."""
+        if source == target:
+            return (0.0, 0.0)
+        sides = (self._forward, self._backward)
+        # Per side: node -> (seconds, meters), heap of (seconds, meters, node)
+        labels = ({source: (0.0, 0.0)}, {target: (0.0, 0.0)})
+        heaps = ([(0.0, 0.0, source)], [(0.0, 0.0, target)])
+        settled: tuple[set[int], set[int]] = (set(), set())
+        best, best_meters = _INF, _INF
+
+        while heaps[0] and heaps[1]:
+            if heaps[0][0][0] + heaps[1][0][0] >= best:
+                break
+            # Grow the smaller frontier
+            side = 0 if len(heaps[0]) <= len(heaps[1]) else 1
+            secs, meters, u = heapq.heappop(heaps[side])
+            if u in settled[side]:
+                continue
+            settled[side].add(u)
+            adj, mine, other = sides[side], labels[side], labels[1 - side]
+            for k in range(adj.offsets[u], adj.offsets[u + 1]):
+                v = adj.nodes[k]
+                s = secs + adj.seconds[k]
+                if s < mine.get(v, (_INF,))[0]:
+                    m = meters + adj.meters[k]
+                    mine[v] = (s, m)
+                    heapq.heappush(heaps[side], (s, m, v))
+                    met = other.get(v)
+                    if met is not None and s + met[0] < best:
+                        best, best_meters = s + met[0], m + met[1]
+
+        return None if best == _INF else (best, best_meters)
+
+    def routes_from(self, source: int, targets: Iterable[int]) -> dict[int, tuple[float, float]]:
+        """
+        Quickest paths from source to every reachable target (one-to-many
+        Dijkstra that stops once all targets are settled).
+        """
+        pending = set(targets)
+        found: dict[int, tuple[float, float]] = {}
+        adj = self._forward
+        labels = {source: 0.0}
+        heap = [(0.0, 0.0, source)]
+        while heap and pending:
+            secs, meters, u = heapq.heappop(heap)
+            if secs > labels[u]:
+                continue
+            if u in pending:
+                pending.discard(u)
+                found[u] = (secs, meters)
+            for k in range(adj.offsets[u], adj.offsets[u + 1]):
+                v = adj.nodes[k]
+                s = secs + adj.seconds[k]
+                if s < labels.get(v, _INF):
+                    labels[v] = s
+                    heapq.heappush(heap, (s, meters + adj.meters[k], v))
+        return found
+
+
+def _check_access_speed(access_speed_kmh: float) -> float:
+    if access_speed_kmh <= 0:
+        raise ValueError(f"access_speed_kmh must be > 0, got {access_speed_kmh}")
+    return 60.0 / access_speed_kmh
+
+
+def road_graph_distance_fn(graph: RoadGraph, *, access_speed_kmh: float = 20.0) -> DistanceFn:
+    """
+    Distance provider answering from a local RoadGraph instead of a server.
+
+    Each location is snapped to its nearest node (snaps are memoized); the
+    straight-line gap to that node is added at access_speed_kmh. Raises
+    ValueError when no road path connects the two nodes.
+    """
+    minutes_per_access_km = _check_access_speed(access_speed_kmh)
+    snaps: dict[tuple[float, float], tuple[int, float]] = {}
+
+    def _snap(loc: Location) -> tuple[int, float]:
+        key = (loc.latitude, loc.longitude)
+        snapped = snaps.get(key)
+        if snapped is None:
+            snapped = snaps[key] = graph.snap(*key)
+        return snapped
+
+    def _distance(a: Location, b: Location) -> tuple[float, float]:
+        (u, access_a), (v, access_b) = _snap(a), _snap(b)
+        if u == v:
+            # Both off the same node: go direct rather than via the node
+            km = great_circle_km(a.latitude, a.longitude, b.latitude, b.longitude)
+            return (km, km * minutes_per_access_km)
+        cost = graph.route(u, v)
+        if cost is None:
+            raise ValueError(f"road graph has no route from {a.name} to {b.name}")
+        seconds, meters = cost
+        access_km = access_a + access_b
+        return (meters / 1000.0 + access_km, seconds / 60.0 + access_km * minutes_per_access_km)
+
+    _distance.cache_namespace = (  # type: ignore[attr-defined]
+        f"graph:{graph.path}:{access_speed_kmh}"
+    )
+    return _distance
+
+
+def road_graph_matrix_fn(graph: RoadGraph, *, access_speed_kmh: float = 20.0) -> MatrixFn:
+    """Matrix provider over a RoadGraph: one one-to-many search per source."""
+    minutes_per_access_km = _check_access_speed(access_speed_kmh)
+
+    def _snap_all(
+        locs: Sequence[Location],
+    ) -> tuple[list[tuple[float, float]], list[tuple[int, float]]]:
+        points = list(zip(*coordinate_columns(locs), strict=True))
+        return points, [graph.snap(lat, lon) for lat, lon in points]
+
+    def _matrix(
+        sources: Sequence[Location],
+        targets: Sequence[Location] | None = None,
+    ) -> DistanceMatrix:
+        sources = snapshot_locations(sources)
+        square = targets is None
+        targets = sources if targets is None else snapshot_locations(targets)
+        n_tgt = len(targets)
+        s_points, s_snaps = _snap_all(sources)
+        t_points, t_snaps = (s_points, s_snaps) if square else _snap_all(targets)
+        target_nodes = {node for node, _ in t_snaps}
+
+        km = array("d", bytes(8 * len(sources) * n_tgt))
+        minutes = array("d", bytes(8 * len(sources) * n_tgt))
+        for i, (u, access_a) in enumerate(s_snaps):
+            found = graph.routes_from(u, target_nodes)
+            for j, (v, access_b) in enumerate(t_snaps):
+                if u == v:
+                    d = great_circle_km(*s_points[i], *t_points[j])
+                    km[i * n_tgt + j] = d
+                    minutes[i * n_tgt + j] = d * minutes_per_access_km
+                    continue
+                cost = found.get(v)
+                if cost is None:
+                    raise ValueError(
+                        f"road graph has no route from {sources[i].name} to {targets[j].name}"
+                    )
+                seconds, meters = cost
+                access_km = access_a + access_b
+                km[i * n_tgt + j] = meters / 1000.0 + access_km
+                minutes[i * n_tgt + j] = seconds / 60.0 + access_km * minutes_per_access_km
+
+        return DistanceMatrix(sources=sources, targets=targets, km=km, minutes=minutes)
+
+    return _matrix
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import math
+from array import array
+from collections.abc import Callable, Sequence
+
+from gotrippee.domain.models import Location
+from gotrippee.domain.table import coordinate_columns, snapshot_locations
+
+from .matrix import DistanceMatrix, MatrixFn
+
+try:  # optional: pip install gotrippee[fast]
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
+
+DistanceFn = Callable[[Location, Location], tuple[float, float]]
+
+# Mean Earth radius (IUGG)
+EARTH_RADIUS_KM = 6371.0088
+
+# Rough average door-to-door speeds, keyed like OSRM profiles
+SPEED_PROFILES_KMH: dict[str, float] = {
+    "driving": 50.0,
+    "cycling": 15.0,
+    "walking": 5.0,
+}
+
+# Rows per NumPy block, keeping each temporary to ~8 MB however wide the matrix
+_BLOCK_CELLS = 1 << 20
+
+
+def great_circle_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Haversine distance in km between two (lat, lon) points given in degrees."""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    dphi = phi2 - phi1
+    dlam = math.radians(lon2 - lon1)
+
+    h = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlam / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(h, 1.0)))
+
+
+def _resolve_speed(profile: str, speed_kmh: float | None) -> float:
+    if speed_kmh is None:
+        if profile not in SPEED_PROFILES_KMH:
+            raise ValueError(
+                f"unknown profile {profile!r}, expected one of {sorted(SPEED_PROFILES_KMH)} "
+                f"or an explicit speed_kmh"
+            )
+        speed_kmh = SPEED_PROFILES_KMH[profile]
+    if speed_kmh <= 0:
+        raise ValueError(f"speed_kmh must be > 0, got {speed_kmh}")
+    return speed_kmh
+
+
+def haversine_distance_fn(
+        *,
+        profile: str = "driving",
+        speed_kmh: float | None = None,
+        detour_factor: float = 1.0,
+) -> DistanceFn:
+    """
+    Offline DistanceFn: great-circle km (scaled by detour_factor) and minutes at
+    the profile's average speed. No I/O.
+    """
+    speed_kmh = _resolve_speed(profile, speed_kmh)
+    if detour_factor < 1.0:
+        raise ValueError(f"detour_factor must be >= 1, got {detour_factor}")
+    minutes_per_km = 60.0 / speed_kmh
+
+    def _distance(a: Location, b: Location) -> tuple[float, float]:
+        km = great_circle_km(a.latitude, a.longitude, b.latitude, b.longitude) * detour_factor
+        return (km, km * minutes_per_km)
+
+    _distance.symmetric = True  # type: ignore[attr-defined]
+    _distance.cache_namespace = (  # type: ignore[attr-defined]
+        f"haversine:{speed_kmh}:{detour_factor}"
+    )
+    return _distance
+
+
+def _numpy_rows(
+        source: tuple[list[float], list[float], list[float]],
+        target: tuple[list[float], list[float], list[float]],
+        scale: float,
+        minutes_per_km: float,
+) -> tuple[array[float], array[float]]:
+    """Row-major km and minutes computed in vectorized blocks of rows."""
+    s_phi, s_lam, s_cos = (np.asarray(c, dtype=np.float64)[:, None] for c in source)
+    t_phi, t_lam, t_cos = (np.asarray(c, dtype=np.float64) for c in target)
+    block = max(1, _BLOCK_CELLS // max(1, len(t_phi)))
+
+    km = np.empty((len(s_phi), len(t_phi)))
+    for lo in range(0, len(s_phi), block):
+        hi = lo + block
+        h = np.sin((t_phi - s_phi[lo:hi]) / 2) ** 2
+        h += s_cos[lo:hi] * t_cos * np.sin((t_lam - s_lam[lo:hi]) / 2) ** 2
+        np.minimum(h, 1.0, out=h)
+        np.sqrt(h, out=h)
+        np.arcsin(h, out=h)
+        h *= scale
+        km[lo:hi] = h
+
+    km_values, minute_values = array("d"), array("d")
+    km_values.frombytes(km.tobytes())
+    km *= minutes_per_km
+    minute_values.frombytes(km.tobytes())
+    return km_values, minute_values
+
+
+def haversine_matrix_fn(
+        *,
+        profile: str = "driving",
+        speed_kmh: float | None = None,
+        detour_factor: float = 1.0,
+) -> MatrixFn:
+    """
+    Matrix provider computing all great-circle distances in one pass.
+
+    Trigonometry is done once per location up front. With NumPy installed
+    the cells are computed in vectorized blocks; otherwise square matrices
+    only compute the upper triangle and copy each lower row from the
+    columns above it.
+    """
+    speed_kmh = _resolve_speed(profile, speed_kmh)
+    if detour_factor < 1.0:
+        raise ValueError(f"detour_factor must be >= 1, got {detour_factor}")
+    minutes_per_km = 60.0 / speed_kmh
+    scale = 2 * EARTH_RADIUS_KM * detour_factor
+
+    def _prepare(locs: Sequence[Location]) -> tuple[list[float], list[float], list[float]]:
+        latitudes, longitudes = coordinate_columns(locs)
+        phi = list(map(math.radians, latitudes))
+        lam = list(map(math.radians, longitudes))
+        return phi, lam, list(map(math.cos, phi))
+
+    def _matrix(
+        sources: Sequence[Location],
+        targets: Sequence[Location] | None = None,
+    ) -> DistanceMatrix:
+        sources = snapshot_locations(sources)
+        square = targets is None
+        targets = sources if targets is None else snapshot_locations(targets)
+        n_src, n_tgt = len(sources), len(targets)
+
+        source = _prepare(sources)
+        target = source if square else _prepare(targets)
+        if np is not None:
+            km, minutes = _numpy_rows(source, target, scale, minutes_per_km)
+            return DistanceMatrix(sources=sources, targets=targets, km=km, minutes=minutes)
+
+        s_phi, s_lam, s_cos = source
+        t_phi, t_lam, t_cos = target
+        sin, asin, sqrt = math.sin, math.asin, math.sqrt
+        km = array("d", bytes(8 * n_src * n_tgt))
+        minutes = array("d", bytes(8 * n_src * n_tgt))
+
+        for i in range(n_src):
+            phi1, lam1, cos1 = s_phi[i], s_lam[i], s_cos[i]
+            first = i + 1 if square else 0
+            row = [
+                scale * asin(sqrt(min(
+                    sin((phi2 - phi1) / 2) ** 2 + cos1 * cos2 * sin((lam2 - lam1) / 2) ** 2,
+                    1.0,
+                )))
+                for phi2, lam2, cos2 in zip(
+                    t_phi[first:], t_lam[first:], t_cos[first:], strict=True
+                )
+            ]
+            base = i * n_tgt
+            if square:
+                # Cells left of the diagonal are column i of the rows above
+                km[base : base + i] = km[i:base:n_tgt]
+                minutes[base : base + i] = minutes[i:base:n_tgt]
+            km[base + first : base + n_tgt] = array("d", row)
+            minutes[base + first : base + n_tgt] = array("d", [d * minutes_per_km for d in row])
+
+        return DistanceMatrix(sources=sources, targets=targets, km=km, minutes=minutes)
+
+    return _matrix
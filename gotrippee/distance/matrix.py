@@ -0,0 +1,328 @@
+from __future__ import annotations
+
+import struct
+from array import array
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, Protocol
+
+from gotrippee.domain.models import Location
+
+DistanceFn = Callable[[Location, Location], tuple[float, float]]
+
+
+@dataclass(frozen=True, slots=True)
+class DistanceMatrix:
+    """
+    Dense sources x targets matrix of (km, minutes), stored row-major in two
+    contiguous float arrays and addressed by index.
+    """
+
+    sources: Sequence[Location]
+    targets: Sequence[Location]
+    km: Sequence[float]
+    minutes: Sequence[float]
+
+    def __post_init__(self) -> None:
+        # Keep storage contiguous so rows can be sliced without copying
+        if not isinstance(self.km, array | memoryview):
+            object.__setattr__(self, "km", array("d", self.km))
+        if not isinstance(self.minutes, array | memoryview):
+            object.__setattr__(self, "minutes", array("d", self.minutes))
+
+        expected = len(self.sources) * len(self.targets)
+        if len(self.km) != expected:
+            raise ValueError(f"km must have {expected} entries, got {len(self.km)}")
+        if len(self.minutes) != expected:
+            raise ValueError(f"minutes must have {expected} entries, got {len(self.minutes)}")
+
+    @property
+    def n_rows(self) -> int:
+        return len(self.sources)
+
+    @property
+    def n_cols(self) -> int:
+        return len(self.targets)
+
+    @property
+    def is_square(self) -> bool:
+        return self.sources is self.targets or list(self.sources) == list(self.targets)
+
+    def distance_km(self, i: int, j: int) -> float:
+        return self.km[i * len(self.targets) + j]
+
+    def duration_minutes(self, i: int, j: int) -> float:
+        return self.minutes[i * len(self.targets) + j]
+
+    def get(self, i: int, j: int) -> tuple[float, float]:
+        k = i * len(self.targets) + j
+        return (self.km[k], self.minutes[k])
+
+    def row_km(self, i: int) -> memoryview:
+        """Zero-copy view of the km row for source i, indexed by target."""
+        return _row_view(self.km, i, len(self.targets))
+
+    def row_minutes(self, i: int) -> memoryview:
+        return _row_view(self.minutes, i, len(self.targets))
+
+    def leg_values(self, stops: Sequence[int]) -> tuple[list[float], list[float]]:
+        """(km, minutes) of each consecutive leg along the row/column indices in stops."""
+        km = self.km
+        minutes = self.minutes
+        n = len(self.targets)
+        keys = [start * n + end for start, end in zip(stops, stops[1:], strict=False)]
+        return [km[k] for k in keys], [minutes[k] for k in keys]
+
+    @classmethod
+    def from_distance_fn(
+        cls,
+        sources: Sequence[Location],
+        targets: Sequence[Location] | None = None,
+        *,
+        distance_fn: DistanceFn,
+    ) -> DistanceMatrix:
+        """Fill a matrix by calling distance_fn once per (source, target) pair."""
+        sources = list(sources)
+        targets = sources if targets is None else list(targets)
+
+        km = array("d")
+        minutes = array("d")
+        for a in sources:
+            for b in targets:
+                d, t = distance_fn(a, b)
+                km.append(d)
+                minutes.append(t)
+
+        return cls(sources=sources, targets=targets, km=km, minutes=minutes)
+
+    def as_distance_fn(self) -> DistanceFn:
+        """Adapt the matrix to the Location-based DistanceFn used by the planners."""
+        rows = {loc: i for i, loc in enumerate(self.sources)}
+        cols = {loc: j for j, loc in enumerate(self.targets)}
+
+        def _distance(a: Location, b: Location) -> tuple[float, float]:
+            return self.get(rows[a], cols[b])
+
+        return _distance
+
+
+def _row_view(values: Sequence[float], i: int, n: int) -> memoryview:
+    # DistanceMatrix.__post_init__ stores km/minutes as an array or memoryview
+    if not isinstance(values, array | memoryview):
+        raise TypeError(f"expected contiguous storage, got {type(values).__name__}")
+    return memoryview(values)[i * n : (i + 1) * n]
+
+
+_HALF = struct.Struct("<e")
+_DTYPES = {"float64": "d", "float32": "f", "float16": "e"}
+
+
+class _Float16Array(Sequence[float]):
+    """Half-precision float storage; array has no typecode for it."""
+
+    __slots__ = ("_buf",)
+
+    typecode = "e"
+    itemsize = 2
+
+    def __init__(self, values: Iterable[float] = ()) -> None:
+        self._buf = bytearray()
+        self.extend(values)
+
+    def append(self, value: float) -> None:
+        self._buf += _HALF.pack(value)
+
+    def extend(self, values: Iterable[float]) -> None:
+        # Packed in chunks, so no full-precision copy of values is ever held
+        it = iter(values)
+        while chunk := list(islice(it, 4096)):
+            self._buf += struct.pack(f"<{len(chunk)}e", *chunk)
+
+    def __len__(self) -> int:
+        return len(self._buf) // 2
+
+    def __getitem__(self, k: Any) -> Any:
+        if isinstance(k, slice):
+            start, stop, step = k.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            count = max(stop - start, 0)
+            return list(struct.unpack_from(f"<{count}e", self._buf, 2 * start))
+        if k < 0:
+            k += len(self)
+        if not 0 <= k < len(self):
+            raise IndexError("_Float16Array index out of range")
+        return _HALF.unpack_from(self._buf, 2 * k)[0]
+
+    def __iter__(self) -> Iterator[float]:
+        return (v for (v,) in _HALF.iter_unpack(self._buf))
+
+
+def _typecode(dtype: str) -> str:
+    code = _DTYPES.get(dtype)
+    if code is None:
+        raise ValueError(f"dtype must be one of {', '.join(_DTYPES)}, got {dtype!r}")
+    return code
+
+
+def _new_values(dtype: str) -> array[float] | _Float16Array:
+    code = _typecode(dtype)
+    return _Float16Array() if code == "e" else array(code)
+
+
+@dataclass(frozen=True, slots=True)
+class SymmetricDistanceMatrix:
+    """
+    Square matrix for symmetric providers, where (i, j) == (j, i).
+
+    Only the strict upper triangle is stored, packed row by row, so it takes
+    about half the memory of a DistanceMatrix; the diagonal is always zero.
+    km and minutes can be stored as float64 (default), float32 or float16
+    (~3 significant digits, at most 65504). It offers the accessors the
+    indexed planners use (row_km, leg_values, get, ...).
+    """
+
+    locations: Sequence[Location]
+    km: Sequence[float]
+    minutes: Sequence[float]
+    # _offsets[i] + j is the position of (i, j) for i < j
+    _offsets: list[int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.km, array | memoryview | _Float16Array):
+            object.__setattr__(self, "km", array("d", self.km))
+        if not isinstance(self.minutes, array | memoryview | _Float16Array):
+            object.__setattr__(self, "minutes", array("d", self.minutes))
+
+        n = len(self.locations)
+        expected = n * (n - 1) // 2
+        if len(self.km) != expected:
+            raise ValueError(f"km must have {expected} entries, got {len(self.km)}")
+        if len(self.minutes) != expected:
+            raise ValueError(f"minutes must have {expected} entries, got {len(self.minutes)}")
+        # Rows 0..i-1 hold n-1, n-2, ... entries
+        offsets = [i * n - i * (i + 1) // 2 - i - 1 for i in range(n)]
+        object.__setattr__(self, "_offsets", offsets)
+
+    @property
+    def sources(self) -> Sequence[Location]:
+        return self.locations
+
+    @property
+    def targets(self) -> Sequence[Location]:
+        return self.locations
+
+    @property
+    def n_rows(self) -> int:
+        return len(self.locations)
+
+    @property
+    def n_cols(self) -> int:
+        return len(self.locations)
+
+    @property
+    def is_square(self) -> bool:
+        return True
+
+    def _key(self, i: int, j: int) -> int:
+        return self._offsets[i] + j if i < j else self._offsets[j] + i
+
+    def distance_km(self, i: int, j: int) -> float:
+        return 0.0 if i == j else self.km[self._key(i, j)]
+
+    def duration_minutes(self, i: int, j: int) -> float:
+        return 0.0 if i == j else self.minutes[self._key(i, j)]
+
+    def get(self, i: int, j: int) -> tuple[float, float]:
+        if i == j:
+            return (0.0, 0.0)
+        k = self._key(i, j)
+        return (self.km[k], self.minutes[k])
+
+    def _row(self, values: Sequence[float], i: int) -> list[float]:
+        n = len(self.locations)
+        # Column i of the rows above, then the contiguous rest of row i
+        row = [values[k + i] for k in self._offsets[:i]]
+        row.append(0.0)
+        start = self._offsets[i] + i + 1
+        row += values[start : start + n - i - 1]
+        return row
+
+    def row_km(self, i: int) -> list[float]:
+        """The km row for i, indexed by column (a copy; rows are not contiguous)."""
+        return self._row(self.km, i)
+
+    def row_minutes(self, i: int) -> list[float]:
+        return self._row(self.minutes, i)
+
+    def leg_values(self, stops: Sequence[int]) -> tuple[list[float], list[float]]:
+        """(km, minutes) of each consecutive leg along the indices in stops."""
+        km = self.km
+        minutes = self.minutes
+        keys = [
+            -1 if start == end else self._key(start, end)
+            for start, end in zip(stops, stops[1:], strict=False)
+        ]
+        return (
+            [0.0 if k < 0 else km[k] for k in keys],
+            [0.0 if k < 0 else minutes[k] for k in keys],
+        )
+
+    @classmethod
+    def from_distance_fn(
+        cls,
+        locations: Sequence[Location],
+        *,
+        distance_fn: DistanceFn,
+        dtype: str = "float64",
+    ) -> SymmetricDistanceMatrix:
+        """Fill a matrix with one distance_fn call per unordered pair."""
+        locations = list(locations)
+        # Filled at the target precision, so peak memory is the final footprint
+        km = _new_values(dtype)
+        minutes = _new_values(dtype)
+        for i, a in enumerate(locations):
+            for b in locations[i + 1 :]:
+                d, t = distance_fn(a, b)
+                km.append(d)
+                minutes.append(t)
+
+        return cls(locations=locations, km=km, minutes=minutes)
+
+    @classmethod
+    def from_matrix(
+        cls,
+        matrix: DistanceMatrix,
+        *,
+        dtype: str = "float64",
+    ) -> SymmetricDistanceMatrix:
+        """Pack the upper triangle of a square DistanceMatrix; the rest is ignored."""
+        if not matrix.is_square:
+            raise ValueError("matrix must be square (sources == targets)")
+        km = _new_values(dtype)
+        minutes = _new_values(dtype)
+        for i in range(matrix.n_rows):
+            km.extend(matrix.row_km(i)[i + 1 :])
+            minutes.extend(matrix.row_minutes(i)[i + 1 :])
+
+        return cls(locations=matrix.sources, km=km, minutes=minutes)
+
+    def as_distance_fn(self) -> DistanceFn:
+        """Adapt the matrix to the Location-based DistanceFn used by the planners."""
+        index = {loc: i for i, loc in enumerate(self.locations)}
+
+        def _distance(a: Location, b: Location) -> tuple[float, float]:
+            return self.get(index[a], index[b])
+
+        return _distance
+
+
+class MatrixFn(Protocol):
+    """Matrix provider: sources x targets, or sources x sources when targets is omitted."""
+
+    def __call__(
+        self,
+        sources: Sequence[Location],
+        targets: Sequence[Location] | None = None,
+    ) -> DistanceMatrix: ...
@@ -1,31 +1,146 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+import random
+import time
+from array import array
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from gotrippee.domain.models import Location
+from gotrippee.domain.table import coordinate_columns, snapshot_locations
+from gotrippee.instrumentation import current_instrumentation
+
+from .aio import AsyncDistanceFn, async_distance_fn
+from .matrix import DistanceMatrix, MatrixFn
 
 DistanceFn = Callable[[Location, Location], tuple[float,float]]
 
 
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """Bounded retries with full-jitter exponential backoff."""
+
+    max_retries: int = 3
+    backoff_seconds: float = 0.1
+    max_backoff_seconds: float = 2.0
+    retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+
+    def __post_init__(self) -> None:
+        if self.max_retries < 0:
+            raise ValueError(f"max_retries must be >= 0, got {self.max_retries}")
+        if self.backoff_seconds < 0:
+            raise ValueError(f"backoff_seconds must be >= 0, got {self.backoff_seconds}")
+
+    def delay(self, attempt: int) -> float:
+        cap = min(self.max_backoff_seconds, self.backoff_seconds * 2**attempt)
+        return random.uniform(0.0, cap)
+
+
+def osrm_session(*, pool_size: int = 10) -> requests.Session:
+    """A keep-alive Session whose connection pool holds up to pool_size sockets per host."""
+    if pool_size < 1:
+        raise ValueError(f"pool_size must be >= 1, got {pool_size}")
+    session = requests.Session()
+    # Retries are done by _get_json so they share the per-call latency budget
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _get_json(
+        session: requests.Session,
+        url: str,
+        params: dict[str, str],
+        *,
+        timeout_seconds: float,
+        retry: RetryPolicy,
+        latency_budget_seconds: float | None,
+        metric: str,
+) -> Any:
+    # Each attempt's latency goes to the `metric` histogram when instrumented
+    recorder = current_instrumentation()
+    deadline = None if latency_budget_seconds is None else time.monotonic() + latency_budget_seconds
+
+    attempt = 0
+    while True:
+        timeout = timeout_seconds
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(
+                    f"OSRM request exceeded latency budget of {latency_budget_seconds}s"
+                )
+            timeout = min(timeout, remaining)
+
+        started = time.perf_counter()
+        try:
+            resp = session.get(url, params=params, timeout=timeout)
+        except (requests.ConnectionError, requests.Timeout):
+            if recorder is not None:
+                recorder.observe(metric, time.perf_counter() - started)
+                recorder.count(f"{metric}.errors")
+            if attempt >= retry.max_retries:
+                raise
+        else:
+            if recorder is not None:
+                recorder.observe(metric, time.perf_counter() - started)
+                if resp.status_code >= 400:
+                    recorder.count(f"{metric}.errors")
+            if resp.status_code not in retry.retry_statuses or attempt >= retry.max_retries:
+                resp.raise_for_status()
+                return resp.json()
+
+        pause = retry.delay(attempt)
+        if deadline is not None:
+            pause = min(pause, max(deadline - time.monotonic(), 0.0))
+        time.sleep(pause)
+        attempt += 1
+        if recorder is not None:
+            recorder.count(f"{metric}.retries")
+
+
 def osrm_distance_fn(
         *,
         base_url: str = "https://router.project-osrm.org",
         profile: str = "driving",
         timeout_seconds: float = 10.0,
+        session: requests.Session | None = None,
+        pool_size: int = 10,
+        retry: RetryPolicy | None = None,
+        latency_budget_seconds: float | None = None,
 ) -> DistanceFn:
+    """
+    DistanceFn backed by OSRM /route/v1.
+
+    Requests go through a pooled keep-alive session (pass session= to share
+    one between providers). Connection errors and retryable statuses are
+    retried per `retry`; latency_budget_seconds caps the total time of one
+    call including retries.
+    """
     base_url = base_url.rstrip("/")
+    session = session or osrm_session(pool_size=pool_size)
+    retry = retry or RetryPolicy()
 
     def _distance(a: Location, b: Location) -> tuple[float, float]:
         url = (
-            f"{base_url}/route/v1/{profile}"
+            f"{base_url}/route/v1/{profile}/"
             f"{a.longitude},{a.latitude};{b.longitude},{b.latitude}"
         )
 
-        resp = requests.get(url, params={"overview": "false"}, timeout=timeout_seconds)
-        resp.raise_for_status()
-        data = resp.json()
+        data = _get_json(
+            session,
+            url,
+            {"overview": "false"},
+            timeout_seconds=timeout_seconds,
+            retry=retry,
+            latency_budget_seconds=latency_budget_seconds,
+            metric="osrm.route",
+        )
 
         routes = data.get("routes") or []
         if not routes:
@@ -38,4 +153,145 @@ def osrm_distance_fn(
         minutes = seconds / 60.0
         return (km, minutes)
     
-    return _distance
\ No newline at end of file
+    _distance.cache_namespace = f"osrm:{base_url}:{profile}"  # type: ignore[attr-defined]
+    return _distance
+
+
+def async_osrm_distance_fn(
+        *,
+        base_url: str = "https://router.project-osrm.org",
+        profile: str = "driving",
+        timeout_seconds: float = 10.0,
+        max_concurrency: int = 10,
+        session: requests.Session | None = None,
+        retry: RetryPolicy | None = None,
+        latency_budget_seconds: float | None = None,
+) -> AsyncDistanceFn:
+    """
+    Async osrm_distance_fn: up to max_concurrency /route/v1 calls in flight,
+    sharing one connection pool sized to match.
+    """
+    distance_fn = osrm_distance_fn(
+        base_url=base_url,
+        profile=profile,
+        timeout_seconds=timeout_seconds,
+        session=session,
+        pool_size=max_concurrency,
+        retry=retry,
+        latency_budget_seconds=latency_budget_seconds,
+    )
+    return async_distance_fn(distance_fn, max_concurrency=max_concurrency)
+
+
+def _coordinate_strings(locations: Sequence[Location]) -> list[str]:
+    latitudes, longitudes = coordinate_columns(locations)
+    return [f"{lon},{lat}" for lat, lon in zip(latitudes, longitudes, strict=True)]
+
+
+def _chunks(n: int, size: int) -> list[range]:
+    return [range(i, min(i + size, n)) for i in range(0, n, size)]
+
+
+def osrm_matrix_fn(
+        *,
+        base_url: str = "https://router.project-osrm.org",
+        profile: str = "driving",
+        timeout_seconds: float = 10.0,
+        max_coordinates: int = 100,
+        session: requests.Session | None = None,
+        pool_size: int = 10,
+        retry: RetryPolicy | None = None,
+        latency_budget_seconds: float | None = None,
+) -> MatrixFn:
+    """
+    Matrix provider backed by the OSRM Table API (/table/v1).
+
+    Fetches km and minutes for every (source, target) pair. Requests that would
+    send more than max_coordinates coordinates (the server's --max-table-size)
+    are tiled into source x target blocks. HTTP options are as for
+    osrm_distance_fn; the latency budget applies per table request.
+    """
+    if max_coordinates < 2:
+        raise ValueError(f"max_coordinates must be >= 2, got {max_coordinates}")
+
+    base_url = base_url.rstrip("/")
+    session = session or osrm_session(pool_size=pool_size)
+    retry = retry or RetryPolicy()
+
+    def _table(
+        coords: Sequence[str],
+        sources: Sequence[int] | None,
+        destinations: Sequence[int] | None,
+    ) -> tuple[list[list[float | None]], list[list[float | None]]]:
+        url = f"{base_url}/table/v1/{profile}/" + ";".join(coords)
+        params = {"annotations": "distance,duration"}
+        if sources is not None:
+            params["sources"] = ";".join(map(str, sources))
+        if destinations is not None:
+            params["destinations"] = ";".join(map(str, destinations))
+
+        data = _get_json(
+            session,
+            url,
+            params,
+            timeout_seconds=timeout_seconds,
+            retry=retry,
+            latency_budget_seconds=latency_budget_seconds,
+            metric="osrm.table",
+        )
+
+        if data.get("code", "Ok") != "Ok":
+            raise ValueError(f"OSRM table request failed: {data.get('code')}")
+        distances = data.get("distances")
+        durations = data.get("durations")
+        if distances is None or durations is None:
+            raise ValueError("OSRM returned no table")
+        return distances, durations
+
+    def _matrix(
+        sources: Sequence[Location],
+        targets: Sequence[Location] | None = None,
+    ) -> DistanceMatrix:
+        sources = snapshot_locations(sources)
+        square = targets is None
+        targets = sources if targets is None else snapshot_locations(targets)
+        n_src, n_tgt = len(sources), len(targets)
+        s_coords = _coordinate_strings(sources)
+        t_coords = s_coords if square else _coordinate_strings(targets)
+
+        km = array("d", bytes(8 * n_src * n_tgt))
+        minutes = array("d", bytes(8 * n_src * n_tgt))
+
+        def _store(rows: range, cols: range, distances, durations) -> None:
+            for r, i in enumerate(rows):
+                for c, j in enumerate(cols):
+                    meters, seconds = distances[r][c], durations[r][c]
+                    if meters is None or seconds is None:
+                        raise ValueError(
+                            f"OSRM returned no route from {sources[i].name} "
+                            f"to {targets[j].name}"
+                        )
+                    km[i * n_tgt + j] = float(meters) / 1000.0
+                    minutes[i * n_tgt + j] = float(seconds) / 60.0
+
+        if n_src and n_tgt:
+            if square and n_src <= max_coordinates:
+                # Everything fits: send each coordinate once, OSRM defaults to all x all.
+                distances, durations = _table(s_coords, None, None)
+                _store(range(n_src), range(n_tgt), distances, durations)
+            else:
+                src_size = min(n_src, max(max_coordinates // 2, max_coordinates - n_tgt))
+                tgt_size = max_coordinates - src_size
+                for rows in _chunks(n_src, src_size):
+                    for cols in _chunks(n_tgt, tgt_size):
+                        coords = [s_coords[i] for i in rows] + [t_coords[j] for j in cols]
+                        distances, durations = _table(
+                            coords,
+                            range(len(rows)),
+                            range(len(rows), len(coords)),
+                        )
+                        _store(rows, cols, distances, durations)
+
+        return DistanceMatrix(sources=sources, targets=targets, km=km, minutes=minutes)
+
+    return _matrix
@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+
+from gotrippee._buffers import PathLike
+from gotrippee.domain.models import Location
+
+DistanceFn = Callable[[Location, Location], tuple[float, float]]
+
+StoreKey = tuple[str, int, int, int, int]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS distances (
+    profile TEXT NOT NULL,
+    a_lat INTEGER NOT NULL,
+    a_lon INTEGER NOT NULL,
+    b_lat INTEGER NOT NULL,
+    b_lon INTEGER NOT NULL,
+    km REAL NOT NULL,
+    minutes REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (profile, a_lat, a_lon, b_lat, b_lon)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS distances_hot ON distances (profile, hits DESC);
+"""
+
+
+class SQLiteDistanceStore:
+    """
+    On-disk (km, minutes) store shared across runs and worker processes.
+
+    Keys are (profile, quantized a, quantized b); coordinates are rounded to
+    `precision` decimal places (6 => ~0.1 m). The database runs in WAL mode so
+    readers never block the single writer, and each process should open its
+    own store on the same path.
+    """
+
+    def __init__(
+        self,
+        path: PathLike,
+        *,
+        precision: int = 6,
+        timeout_seconds: float = 30.0,
+    ) -> None:
+        if precision < 0:
+            raise ValueError(f"precision must be >= 0, got {precision}")
+        self.path = path
+        self.precision = precision
+        self._scale = 10**precision
+        self._lock = threading.Lock()
+        self._pending_hits: dict[StoreKey, int] = {}
+
+        self._conn = sqlite3.connect(
+            path,
+            timeout=timeout_seconds,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def key_for(self, profile: str, a: Location, b: Location) -> StoreKey:
+        s = self._scale
+        return (
+            profile,
+            round(a.latitude * s),
+            round(a.longitude * s),
+            round(b.latitude * s),
+            round(b.longitude * s),
+        )
+
+    def get_many(self, keys: Iterable[StoreKey]) -> dict[StoreKey, tuple[float, float]]:
+        """Batched lookup; missing keys are simply absent from the result."""
+        keys = list(dict.fromkeys(keys))
+        found: dict[StoreKey, tuple[float, float]] = {}
+        if not keys:
+            return found
+
+        # Stay well under SQLite's bound-parameter limit
+        chunk = 150
+        with self._lock:
+            for i in range(0, len(keys), chunk):
+                batch = keys[i : i + chunk]
+                where = " OR ".join(
+                    ["(profile=? AND a_lat=? AND a_lon=? AND b_lat=? AND b_lon=?)"] * len(batch)
+                )
+                params = [v for key in batch for v in key]
+                rows = self._conn.execute(
+                    "SELECT profile, a_lat, a_lon, b_lat, b_lon, km, minutes "
+                    f"FROM distances WHERE {where}",
+                    params,
+                )
+                for profile, a_lat, a_lon, b_lat, b_lon, km, minutes in rows:
+                    key = (profile, a_lat, a_lon, b_lat, b_lon)
+                    found[key] = (km, minutes)
+                    self._pending_hits[key] = self._pending_hits.get(key, 0) + 1
+        return found
+
+    def touch(self, key: StoreKey) -> None:
+        """Count a read served from a caller's in-memory copy towards hotness."""
+        with self._lock:
+            self._pending_hits[key] = self._pending_hits.get(key, 0) + 1
+
+    def put_many(self, items: Iterable[tuple[StoreKey, tuple[float, float]]]) -> None:
+        """Batched upsert in a single transaction; also flushes pending hit counts."""
+        now = time.time()
+        rows = [(*key, km, minutes, now) for key, (km, minutes) in items]
+        with self._lock:
+            hits = [(n, *key) for key, n in self._pending_hits.items()]
+            self._pending_hits.clear()
+            if not rows and not hits:
+                return
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT INTO distances "
+                    "(profile, a_lat, a_lon, b_lat, b_lon, km, minutes, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT (profile, a_lat, a_lon, b_lat, b_lon) DO UPDATE SET "
+                    "km=excluded.km, minutes=excluded.minutes, updated_at=excluded.updated_at",
+                    rows,
+                )
+                self._conn.executemany(
+                    "UPDATE distances SET hits = hits + ? "
+                    "WHERE profile=? AND a_lat=? AND a_lon=? AND b_lat=? AND b_lon=?",
+                    hits,
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def hot_entries(
+        self,
+        *,
+        profile: str,
+        limit: int,
+    ) -> dict[StoreKey, tuple[float, float]]:
+        """The `limit` most frequently read entries for profile, for warm starts."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT profile, a_lat, a_lon, b_lat, b_lon, km, minutes FROM distances "
+                "WHERE profile=? ORDER BY hits DESC LIMIT ?",
+                (profile, limit),
+            )
+            return {tuple(row[:5]): (row[5], row[6]) for row in rows}
+
+    def __len__(self) -> int:
+        with self._lock:
+            count: int = self._conn.execute("SELECT COUNT(*) FROM distances").fetchone()[0]
+            return count
+
+    def flush(self) -> None:
+        self.put_many(())
+
+    def close(self) -> None:
+        self.flush()
+        self._conn.close()
+
+    def __enter__(self) -> SQLiteDistanceStore:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def persistent_distance_fn(
+    distance_fn: DistanceFn,
+    *,
+    store: SQLiteDistanceStore,
+    profile: str | None = None,
+    warm_start: int = 0,
+    write_batch_size: int = 64,
+    max_entries: int = 100_000,
+) -> DistanceFn:
+    """
+    Wrap distance_fn with a read-through SQLiteDistanceStore.
+
+    Results are kept in a process-local LRU of max_entries in front of the
+    store; new results are written back in batches of write_batch_size (call
+    the returned function's flush() before exiting). Rows are keyed on
+    profile, which defaults to distance_fn.cache_namespace so different
+    providers never share rows. warm_start preloads that many of the hottest
+    entries for profile. prefetch(pairs) loads many pairs with one batched
+    read. Safe to share between threads.
+    """
+    if max_entries < 1:
+        raise ValueError(f"max_entries must be >= 1, got {max_entries}")
+    if profile is None:
+        profile = getattr(distance_fn, "cache_namespace", "default")
+    key_profile: str = profile
+
+    # memory and pending are guarded by lock; provider and store calls run outside it
+    memory: OrderedDict[StoreKey, tuple[float, float]] = OrderedDict()
+    pending: list[tuple[StoreKey, tuple[float, float]]] = []
+    lock = threading.Lock()
+
+    def remember(key: StoreKey, value: tuple[float, float]) -> None:
+        # Caller holds lock
+        memory[key] = value
+        memory.move_to_end(key)
+        if len(memory) > max_entries:
+            memory.popitem(last=False)
+
+    if warm_start > 0:
+        for key, value in store.hot_entries(profile=key_profile, limit=warm_start).items():
+            remember(key, value)
+
+    def flush() -> None:
+        with lock:
+            batch = pending[:]
+            pending.clear()
+        store.put_many(batch)
+
+    def prefetch(pairs: Iterable[tuple[Location, Location]]) -> None:
+        keys = [store.key_for(key_profile, a, b) for a, b in pairs]
+        with lock:
+            missing = [k for k in keys if k not in memory]
+        found = store.get_many(missing)
+        with lock:
+            for key, value in found.items():
+                remember(key, value)
+
+    def _distance(a: Location, b: Location) -> tuple[float, float]:
+        key = store.key_for(key_profile, a, b)
+        with lock:
+            value = memory.get(key)
+            if value is not None:
+                memory.move_to_end(key)
+        if value is not None:
+            store.touch(key)
+            return value
+
+        batch = None
+        value = store.get_many([key]).get(key)
+        if value is None:
+            value = distance_fn(a, b)
+            with lock:
+                pending.append((key, value))
+                if len(pending) >= write_batch_size:
+                    batch = pending[:]
+                    pending.clear()
+        with lock:
+            remember(key, value)
+        if batch:
+            store.put_many(batch)
+        return value
+
+    _distance.flush = flush  # type: ignore[attr-defined]
+    _distance.prefetch = prefetch  # type: ignore[attr-defined]
+    return _distance
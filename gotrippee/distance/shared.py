@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Callable, Sequence
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+from gotrippee._buffers import PathLike, SectionReader
+from gotrippee.domain.models import Location
+from gotrippee.domain.table import _unchecked_table, coordinate_columns
+
+from .matrix import DistanceMatrix
+
+DistanceFn = Callable[[Location, Location], tuple[float, float]]
+
+# magic, version, rows, cols, source names bytes, target names bytes (0 when square)
+_HEADER = struct.Struct("<4sIIIQQ")
+_MAGIC = b"GTSM"
+_VERSION = 1
+
+
+def _encode_names(locs: Sequence[Location]) -> bytes:
+    return json.dumps([loc.name for loc in locs]).encode("utf-8")
+
+
+def _encode(matrix: DistanceMatrix) -> tuple[bytes, list[Any]]:
+    """Header and sections of the shared layout for matrix."""
+    square = matrix.sources is matrix.targets
+    source_names = _encode_names(matrix.sources)
+    target_names = b"" if square else _encode_names(matrix.targets)
+
+    sections: list[Any] = []
+    for locs in (matrix.sources,) if square else (matrix.sources, matrix.targets):
+        sections += [array("d", column) for column in coordinate_columns(locs)]
+    # float32 halves the footprint; ~7 significant digits is ~1 m at 10,000 km
+    sections += [array("f", matrix.km), array("f", matrix.minutes), source_names, target_names]
+    if sys.byteorder != "little":
+        for section in sections:
+            if isinstance(section, array):
+                section.byteswap()
+
+    header = _HEADER.pack(
+        _MAGIC, _VERSION, matrix.n_rows, matrix.n_cols, len(source_names), len(target_names)
+    )
+    return header, sections
+
+
+def _attach_untracked(name: str) -> SharedMemory:
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name, track=False)
+    # Attaching registers the segment with the resource tracker, which unlinks
+    # it when the tracker exits. A tracker inherited from the creator (fork or
+    # spawn) is shared and harmless, but an unrelated process starts its own
+    # that would destroy the segment when this process exits, so undo it there.
+    private = getattr(resource_tracker._resource_tracker, "_fd", None) is None
+    shm = SharedMemory(name)
+    if private and os.name == "posix":
+        resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+    return shm
+
+
+class SharedDistanceMatrix:
+    """
+    Read-only DistanceMatrix kept in shared memory or a memory-mapped file.
+
+    One process builds a DistanceMatrix and publishes it with create(); other
+    processes attach() (shared memory) or open() (file) and read it in place,
+    so a worker fleet holds one copy instead of one per worker. Values are
+    stored as float32. matrix is a regular DistanceMatrix over the shared
+    buffer, and as_distance_fn() looks rows up by coordinates.
+
+    The creator should unlink() a shared-memory segment once every worker is
+    done with it; attached processes only close().
+    """
+
+    def __init__(
+        self,
+        buffer: Any,
+        *,
+        shm: SharedMemory | None = None,
+        path: str | None = None,
+    ) -> None:
+        self._buffer = buffer
+        self._shm = shm
+        self.path = path
+        self._reader = SectionReader(buffer, _HEADER.size)
+        take = self._reader.take
+        try:
+            magic, version, rows, cols, source_bytes, target_bytes = _HEADER.unpack_from(buffer, 0)
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError(f"not a version {_VERSION} shared distance matrix")
+            source_columns = (take("d", rows), take("d", rows))
+            target_columns = (take("d", cols), take("d", cols)) if target_bytes else None
+            km = take("f", rows * cols)
+            minutes = take("f", rows * cols)
+            sources = _unchecked_table(self._names(source_bytes), *source_columns)
+            targets = (
+                sources
+                if target_columns is None
+                else _unchecked_table(self._names(target_bytes), *target_columns)
+            )
+        except BaseException:
+            self.close()
+            raise
+        self.matrix = DistanceMatrix(sources=sources, targets=targets, km=km, minutes=minutes)
+
+    @property
+    def name(self) -> str | None:
+        """Shared-memory segment name to attach() to, or None for a file."""
+        return None if self._shm is None else self._shm.name
+
+    @classmethod
+    def create(
+        cls,
+        matrix: DistanceMatrix,
+        *,
+        name: str | None = None,
+        path: PathLike | None = None,
+    ) -> SharedDistanceMatrix:
+        """
+        Publish matrix in a new shared-memory segment (named `name`, or a
+        generated name), or in a file at `path` when given.
+        """
+        header, sections = _encode(matrix)
+        size = len(header) + sum(len(memoryview(s).cast("B")) for s in sections)
+
+        if path is not None:
+            with open(path, "wb") as f:
+                f.write(header)
+                for section in sections:
+                    f.write(section)
+            return cls.open(path)
+
+        shm = SharedMemory(name, create=True, size=size)
+        try:
+            buf = shm.buf
+            if buf is None:
+                raise ValueError(f"shared memory block {shm.name} is closed")
+            offset = 0
+            for chunk in (header, *sections):
+                raw = memoryview(chunk).cast("B")
+                buf[offset : offset + len(raw)] = raw
+                offset += len(raw)
+            return cls(buf, shm=shm)
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+
+    @classmethod
+    def attach(cls, name: str) -> SharedDistanceMatrix:
+        """Read a matrix another process published with create()."""
+        shm = _attach_untracked(name)
+        try:
+            return cls(shm.buf, shm=shm)
+        except BaseException:
+            shm.close()
+            raise
+
+    @classmethod
+    def open(cls, path: PathLike) -> SharedDistanceMatrix:
+        """Memory-map a matrix written with create(path=...)."""
+        path = os.fspath(path)
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls(buffer, path=path)
+        except BaseException:
+            buffer.close()
+            raise
+
+    def _names(self, size: int) -> list[str]:
+        names: list[str] = json.loads(self._reader.take_bytes(size).decode("utf-8"))
+        return names
+
+    def as_distance_fn(self, fallback: DistanceFn | None = None) -> DistanceFn:
+        """
+        Adapt the matrix to a DistanceFn keyed by (latitude, longitude), so
+        any Location at a stored point hits regardless of its name. Pairs not
+        in the matrix go to fallback, or raise KeyError without one.
+        """
+        matrix = self.matrix
+        rows = _coordinate_index(matrix.sources)
+        cols = rows if matrix.targets is matrix.sources else _coordinate_index(matrix.targets)
+        km, minutes, n = matrix.km, matrix.minutes, matrix.n_cols
+
+        def _distance(a: Location, b: Location) -> tuple[float, float]:
+            i = rows.get((a.latitude, a.longitude))
+            j = cols.get((b.latitude, b.longitude))
+            if i is None or j is None:
+                if fallback is None:
+                    raise KeyError(f"{a.name} -> {b.name} is not in the shared matrix")
+                return fallback(a, b)
+            k = i * n + j
+            return (km[k], minutes[k])
+
+        return _distance
+
+    def close(self) -> None:
+        """Release this process's mapping; the data stays for other processes."""
+        self._reader.release()
+        if self._shm is not None:
+            self._shm.close()
+        elif isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def unlink(self) -> None:
+        """Destroy the shared-memory segment (creator only); a file is left alone."""
+        if self._shm is not None:
+            self._shm.unlink()
+
+    def __enter__(self) -> SharedDistanceMatrix:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def _coordinate_index(locs: Sequence[Location]) -> dict[tuple[float, float], int]:
+    latitudes, longitudes = coordinate_columns(locs)
+    points = zip(latitudes, longitudes, strict=True)
+    return dict(zip(points, range(len(locs)), strict=True))
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from abc import abstractmethod
+from array import array
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from .models import Leg, Location, RoutePlan, _check_totals, _trusted_leg, _trusted_route_plan
+
+
+class _SequenceView(Sequence[Any]):
+    """Read-only sequence that compares equal to any sequence with the same items."""
+
+    __slots__ = ("_plan",)
+
+    def __init__(self, plan: CompactRoutePlan) -> None:
+        self._plan = plan
+
+    @abstractmethod
+    def _item(self, i: int) -> Any: ...
+
+    def __getitem__(self, i: int | slice) -> Any:
+        if isinstance(i, slice):
+            return [self._item(k) for k in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(f"{type(self).__name__} index out of range")
+        return self._item(i)
+
+    def __iter__(self) -> Iterator[Any]:
+        for i in range(len(self)):
+            yield self._item(i)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other, strict=True))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class _Stops(_SequenceView):
+    def __len__(self) -> int:
+        return len(self._plan.stop_indices)
+
+    def _item(self, i: int) -> Location:
+        return self._plan.locations[self._plan.stop_indices[i]]
+
+
+class _Legs(_SequenceView):
+    def __len__(self) -> int:
+        return len(self._plan.km)
+
+    def _item(self, i: int) -> Leg:
+        # Values were checked when the plan was built
+        p = self._plan
+        return _trusted_leg(
+            p.locations[p.stop_indices[i]],
+            p.locations[p.stop_indices[i + 1]],
+            p.km[i],
+            p.minutes[i],
+        )
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class CompactRoutePlan:
+    """
+    RoutePlan stored as stop indices into a shared locations table plus
+    contiguous per-leg km/minute arrays.
+
+    Exposes the same stops / legs / total_distance_km / total_duration_minutes
+    fields as RoutePlan: stops and legs are read-only views, and each Leg is
+    built only when accessed. Totals are summed once at construction. Compares
+    equal to a RoutePlan with the same fields.
+    """
+
+    locations: Sequence[Location]
+    stop_indices: Sequence[int]
+    km: Sequence[float]
+    minutes: Sequence[float]
+    total_distance_km: float = field(init=False)
+    total_duration_minutes: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.stop_indices, array):
+            object.__setattr__(self, "stop_indices", array("l", self.stop_indices))
+        if not isinstance(self.km, array):
+            object.__setattr__(self, "km", array("d", self.km))
+        if not isinstance(self.minutes, array):
+            object.__setattr__(self, "minutes", array("d", self.minutes))
+
+        expected_legs = max(len(self.stop_indices) - 1, 0)
+        if len(self.km) != expected_legs or len(self.minutes) != expected_legs:
+            raise ValueError(
+                f"legs must be exactly stops - 1 (expected {expected_legs}, "
+                f"got {len(self.km)} km and {len(self.minutes)} minutes)"
+            )
+        n = len(self.locations)
+        if self.stop_indices and not (0 <= min(self.stop_indices) and max(self.stop_indices) < n):
+            raise ValueError(f"stop indices must be between 0 and {n - 1}")
+        if self.km and min(self.km) < 0:
+            raise ValueError(f"distance_km must be >= 0, got {min(self.km)}")
+        if self.minutes and min(self.minutes) < 0:
+            raise ValueError(f"duration_minutes must be >= 0, got {min(self.minutes)}")
+
+        total_km, total_minutes = sum(self.km), sum(self.minutes)
+        _check_totals(total_km, total_minutes)
+        object.__setattr__(self, "total_distance_km", total_km)
+        object.__setattr__(self, "total_duration_minutes", total_minutes)
+
+    @property
+    def stops(self) -> Sequence[Location]:
+        return _Stops(self)
+
+    @property
+    def legs(self) -> Sequence[Leg]:
+        return _Legs(self)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CompactRoutePlan | RoutePlan):
+            return NotImplemented
+        return (
+            self.total_distance_km == other.total_distance_km
+            and self.total_duration_minutes == other.total_duration_minutes
+            and self.stops == other.stops
+            and self.legs == other.legs
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def to_plan(self) -> RoutePlan:
+        """Materialize a regular RoutePlan (one Leg object per leg)."""
+        return _trusted_route_plan(
+            list(self.stops), list(self.legs), self.total_distance_km, self.total_duration_minutes
+        )
+
+    @classmethod
+    def from_plan(cls, plan: RoutePlan) -> CompactRoutePlan:
+        """Compact an existing plan; repeated locations are stored once."""
+        index: dict[Location, int] = {}
+        stop_indices = array("l", (index.setdefault(s, len(index)) for s in plan.stops))
+        return cls(
+            locations=list(index),
+            stop_indices=stop_indices,
+            km=array("d", (leg.distance_km for leg in plan.legs)),
+            minutes=array("d", (leg.duration_minutes for leg in plan.legs)),
+        )
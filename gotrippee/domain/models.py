@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import math
 from collections.abc import Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 
 
 @dataclass(frozen=True, slots=True)
@@ -61,3 +61,60 @@ class RoutePlan:
                 f"total_duration_minutes must equal sum of leg durations "
                 f"({sum_duration}), got {self.total_duration_minutes}"
             )
+
+
+
+# Internal fast path: build instances without __init__/__post_init__ for values
+# that are valid by construction (e.g. a planner assembling totals from the legs
+# it just built). Public constructors keep validating untrusted input.
+_new = object.__new__
+_set_name, _set_latitude, _set_longitude = (
+    getattr(Location, f.name).__set__ for f in fields(Location)
+)
+_set_start, _set_end, _set_distance_km, _set_duration_minutes = (
+    getattr(Leg, f.name).__set__ for f in fields(Leg)
+)
+_set_stops, _set_legs, _set_total_distance_km, _set_total_duration_minutes = (
+    getattr(RoutePlan, f.name).__set__ for f in fields(RoutePlan)
+)
+
+
+def _trusted_location(name: str, latitude: float, longitude: float) -> Location:
+    loc = _new(Location)
+    _set_name(loc, name)
+    _set_latitude(loc, latitude)
+    _set_longitude(loc, longitude)
+    return loc
+
+
+def _trusted_leg(
+    start: Location, end: Location, distance_km: float, duration_minutes: float
+) -> Leg:
+    leg = _new(Leg)
+    _set_start(leg, start)
+    _set_end(leg, end)
+    _set_distance_km(leg, distance_km)
+    _set_duration_minutes(leg, duration_minutes)
+    return leg
+
+
+def _trusted_route_plan(
+    stops: Sequence[Location],
+    legs: Sequence[Leg],
+    total_distance_km: float,
+    total_duration_minutes: float,
+) -> RoutePlan:
+    plan = _new(RoutePlan)
+    _set_stops(plan, stops)
+    _set_legs(plan, legs)
+    _set_total_distance_km(plan, total_distance_km)
+    _set_total_duration_minutes(plan, total_duration_minutes)
+    return plan
+
+
+def _check_totals(total_distance_km: float, total_duration_minutes: float) -> None:
+    """NaN legs pass the >= 0 checks but poison the sums, so check those."""
+    if math.isnan(total_distance_km):
+        raise ValueError("distance_km must not be NaN")
+    if math.isnan(total_duration_minutes):
+        raise ValueError("duration_minutes must not be NaN")
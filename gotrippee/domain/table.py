@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+import csv
+import json
+import math
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import IO, Any
+
+from gotrippee._buffers import PathLike
+
+from .models import Location, _trusted_location
+
+
+def _check_range(values: Sequence[float], name: str, limit: float, offset: int) -> None:
+    # min/max/sum run in C over the whole column; NaN poisons the sum
+    if not values:
+        return
+    if min(values) >= -limit and max(values) <= limit and not math.isnan(sum(values)):
+        return
+    for i, v in enumerate(values):
+        if not (-limit <= v <= limit):
+            raise ValueError(
+                f"{name} must be between -{limit:g} and {limit:g}, got {v} (row {offset + i})"
+            )
+
+
+@dataclass(frozen=True, slots=True)
+class LocationTable(Sequence[Location]):
+    """
+    Columnar stops: names plus contiguous latitude/longitude arrays.
+
+    Coordinate ranges are validated once per column rather than per row. The
+    table is a Sequence[Location], so it can be passed wherever locations are
+    expected (e.g. as DistanceMatrix sources); Location objects are only built
+    for the rows actually accessed.
+    """
+
+    names: Sequence[str]
+    latitudes: Sequence[float]
+    longitudes: Sequence[float]
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.latitudes, array):
+            object.__setattr__(self, "latitudes", array("d", self.latitudes))
+        if not isinstance(self.longitudes, array):
+            object.__setattr__(self, "longitudes", array("d", self.longitudes))
+
+        n = len(self.names)
+        if len(self.latitudes) != n or len(self.longitudes) != n:
+            raise ValueError(
+                f"columns must have the same length (names {n}, latitudes "
+                f"{len(self.latitudes)}, longitudes {len(self.longitudes)})"
+            )
+        _check_range(self.latitudes, "latitude", 90.0, 0)
+        _check_range(self.longitudes, "longitude", 180.0, 0)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, i: int | slice) -> Any:
+        if isinstance(i, slice):
+            return LocationTable(
+                names=self.names[i], latitudes=self.latitudes[i], longitudes=self.longitudes[i]
+            )
+        # Rows were validated with their columns
+        return _trusted_location(self.names[i], self.latitudes[i], self.longitudes[i])
+
+    def __iter__(self) -> Iterator[Location]:
+        return map(_trusted_location, self.names, self.latitudes, self.longitudes)
+
+    @classmethod
+    def from_locations(cls, locations: Iterable[Location]) -> LocationTable:
+        locations = list(locations)
+        return cls(
+            names=[loc.name for loc in locations],
+            latitudes=array("d", [loc.latitude for loc in locations]),
+            longitudes=array("d", [loc.longitude for loc in locations]),
+        )
+
+    @classmethod
+    def concat(cls, tables: Iterable[LocationTable]) -> LocationTable:
+        names: list[str] = []
+        latitudes = array("d")
+        longitudes = array("d")
+        for table in tables:
+            names.extend(table.names)
+            latitudes.extend(table.latitudes)
+            longitudes.extend(table.longitudes)
+        # Each table was validated when it was built
+        return _unchecked_table(names, latitudes, longitudes)
+
+    @classmethod
+    def from_csv(cls, path: PathLike, **kwargs: Any) -> LocationTable:
+        """Read a whole CSV file; see iter_csv_chunks for the options."""
+        return cls.concat(iter_csv_chunks(path, **kwargs))
+
+    @classmethod
+    def from_geojson(cls, path: PathLike, **kwargs: Any) -> LocationTable:
+        """Read a whole GeoJSON file; see iter_geojson_chunks for the options."""
+        return cls.concat(iter_geojson_chunks(path, **kwargs))
+
+
+def coordinate_columns(locations: Sequence[Location]) -> tuple[Sequence[float], Sequence[float]]:
+    """(latitudes, longitudes) of locations, without touching rows of a LocationTable."""
+    if isinstance(locations, LocationTable):
+        return locations.latitudes, locations.longitudes
+    return [loc.latitude for loc in locations], [loc.longitude for loc in locations]
+
+
+def snapshot_locations(locations: Iterable[Location]) -> Sequence[Location]:
+    """list(locations), except that a LocationTable is kept as-is instead of expanded."""
+    if isinstance(locations, LocationTable):
+        return locations
+    return list(locations)
+
+
+def _unchecked_table(names: list[str], latitudes: array, longitudes: array) -> LocationTable:
+    table = object.__new__(LocationTable)
+    object.__setattr__(table, "names", names)
+    object.__setattr__(table, "latitudes", latitudes)
+    object.__setattr__(table, "longitudes", longitudes)
+    return table
+
+
+def _chunk_table(
+    names: list[str], lats: list[float], lons: list[float], offset: int
+) -> LocationTable:
+    # Validated here so errors report the row number within the whole file
+    latitudes = array("d", lats)
+    longitudes = array("d", lons)
+    _check_range(latitudes, "latitude", 90.0, offset)
+    _check_range(longitudes, "longitude", 180.0, offset)
+    return _unchecked_table(names, latitudes, longitudes)
+
+
+def iter_csv_chunks(
+    path: PathLike,
+    *,
+    chunk_size: int = 10_000,
+    name_column: str = "name",
+    latitude_column: str = "latitude",
+    longitude_column: str = "longitude",
+    delimiter: str = ",",
+) -> Iterator[LocationTable]:
+    """
+    Stream a CSV file with a header row as LocationTables of up to chunk_size
+    rows, so the whole file never has to be held as Python rows at once.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        header = next(reader, None)
+        if header is None:
+            return
+        try:
+            name_i, lat_i, lon_i = (
+                header.index(c) for c in (name_column, latitude_column, longitude_column)
+            )
+        except ValueError:
+            raise ValueError(
+                f"CSV header must contain {name_column!r}, {latitude_column!r} and "
+                f"{longitude_column!r}, got {header}"
+            ) from None
+
+        offset = 0
+        names: list[str] = []
+        lats: list[float] = []
+        lons: list[float] = []
+        for row in reader:
+            if not row:
+                continue
+            try:
+                lats.append(float(row[lat_i]))
+                lons.append(float(row[lon_i]))
+                names.append(row[name_i])
+            except (IndexError, ValueError) as exc:
+                raise ValueError(f"row {offset + len(names)}: {exc}") from exc
+            if len(names) == chunk_size:
+                yield _chunk_table(names, lats, lons, offset)
+                offset += len(names)
+                names, lats, lons = [], [], []
+        if names:
+            yield _chunk_table(names, lats, lons, offset)
+
+
+class _JSONStream:
+    """Incremental reader for one JSON document, decoding a value at a time."""
+
+    _BLOCK = 1 << 16
+
+    def __init__(self, f: IO[str]) -> None:
+        self._f = f
+        self._buf = ""
+        self._pos = 0
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        block = self._f.read(self._BLOCK)
+        if not block:
+            return False
+        self._buf = self._buf[self._pos :] + block
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character, or "" at end of input."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos].isspace():
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise ValueError(f"invalid GeoJSON: expected {char!r}, got {self.peek()!r}")
+        self._pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number at the end of the buffer may continue in the next block
+            if end == len(self._buf) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+
+def iter_geojson_chunks(
+    path: PathLike,
+    *,
+    chunk_size: int = 10_000,
+    name_property: str = "name",
+) -> Iterator[LocationTable]:
+    """
+    Stream the Point features of a GeoJSON FeatureCollection as LocationTables
+    of up to chunk_size rows. Features are decoded one at a time, so memory
+    does not grow with the file. Names come from properties[name_property],
+    falling back to the feature id.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+
+    with open(path, encoding="utf-8") as f:
+        stream = _JSONStream(f)
+        stream.expect("{")
+        offset = 0
+        while stream.peek() != "}":
+            key = stream.value()
+            stream.expect(":")
+            if key != "features":
+                stream.value()
+            else:
+                for chunk in _features(stream, chunk_size, name_property):
+                    yield _chunk_table(*chunk, offset)
+                    offset += len(chunk[0])
+            if stream.peek() == ",":
+                stream.expect(",")
+
+
+def _features(
+    stream: _JSONStream, chunk_size: int, name_property: str
+) -> Iterator[tuple[list[str], list[float], list[float]]]:
+    names: list[str] = []
+    lats: list[float] = []
+    lons: list[float] = []
+    stream.expect("[")
+    i = 0
+    while stream.peek() != "]":
+        feature = stream.value()
+        try:
+            geometry = feature["geometry"]
+            if geometry["type"] != "Point":
+                raise ValueError(f"geometry must be a Point, got {geometry['type']}")
+            lon, lat = geometry["coordinates"][:2]
+            name = (feature.get("properties") or {}).get(name_property, feature.get("id"))
+            if name is None:
+                raise ValueError(f"missing {name_property!r} property")
+        except (KeyError, TypeError, ValueError) as exc:
+            raise ValueError(f"feature {i}: {exc}") from exc
+        names.append(str(name))
+        lats.append(float(lat))
+        lons.append(float(lon))
+        i += 1
+        if len(names) == chunk_size:
+            yield names, lats, lons
+            names, lats, lons = [], [], []
+        if stream.peek() == ",":
+            stream.expect(",")
+    stream.expect("]")
+    if names:
+        yield names, lats, lons
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import bisect
+import json
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Any, Protocol
+
+from gotrippee.domain.models import Location
+
+DistanceFn = Callable[[Location, Location], tuple[float, float]]
+
+# Upper bounds (seconds) of the latency histogram buckets; the last is open
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, float("inf")
+)
+
+
+class Instrumentation(Protocol):
+    """What the planners and providers report to; see MetricsRecorder."""
+
+    def phase(self, name: str) -> AbstractContextManager[None]: ...
+
+    def count(self, name: str, n: int = 1) -> None: ...
+
+    def observe(self, name: str, seconds: float) -> None: ...
+
+
+class MetricsRecorder:
+    """
+    Thread-safe Instrumentation that aggregates in memory:
+    - phases: call count, total and max wall time per phase name
+    - counters: plain event counts (cache hits, OSRM retries, ...)
+    - histograms: latency distributions (one observation per provider call)
+    snapshot() / to_json() export everything as plain data.
+    """
+
+    def __init__(self, *, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        if list(buckets) != sorted(buckets) or not buckets:
+            raise ValueError("buckets must be a non-empty ascending sequence")
+        self._bounds = list(buckets)
+        if self._bounds[-1] != float("inf"):
+            self._bounds.append(float("inf"))
+        self._lock = threading.Lock()
+        # name -> [count, total seconds, max seconds]
+        self._phases: dict[str, list[float]] = {}
+        self._counters: dict[str, int] = {}
+        self._histograms: dict[str, list[float]] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                stats = self._phases.setdefault(name, [0, 0.0, 0.0])
+                stats[0] += 1
+                stats[1] += elapsed
+                stats[2] = max(stats[2], elapsed)
+
+    def count(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + n
+
+    def observe(self, name: str, seconds: float) -> None:
+        i = bisect.bisect_left(self._bounds, seconds)
+        with self._lock:
+            # [count, sum of seconds, per-bucket counts...]
+            hist = self._histograms.get(name)
+            if hist is None:
+                hist = self._histograms[name] = [0, 0.0] + [0] * len(self._bounds)
+            hist[0] += 1
+            hist[1] += seconds
+            hist[2 + i] += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._phases.clear()
+            self._counters.clear()
+            self._histograms.clear()
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+            snapshot: dict[str, Any] = {
+                "phases": {
+                    name: {"count": int(c), "total_seconds": total, "max_seconds": longest}
+                    for name, (c, total, longest) in self._phases.items()
+                },
+                "counters": counters,
+                "histograms": {
+                    name: {
+                        "count": int(hist[0]),
+                        "sum_seconds": hist[1],
+                        "buckets": [
+                            {"le": "+Inf" if b == float("inf") else b, "count": int(c)}
+                            for b, c in zip(self._bounds, hist[2:], strict=True)
+                        ],
+                    }
+                    for name, hist in self._histograms.items()
+                },
+            }
+        hits = counters.get("cache.hits", 0) + counters.get("cache.coalesced", 0)
+        lookups = hits + counters.get("cache.misses", 0)
+        if lookups:
+            snapshot["cache"] = {"hit_ratio": hits / lookups}
+        return snapshot
+
+    def to_json(self, **kwargs: Any) -> str:
+        return json.dumps(self.snapshot(), **kwargs)
+
+
+_current: ContextVar[Instrumentation | None] = ContextVar("gotrippee_instrumentation", default=None)
+_NO_PHASE = nullcontext()
+
+
+@contextmanager
+def instrumented(recorder: Instrumentation | None = None) -> Iterator[Instrumentation]:
+    """
+    Install recorder (a new MetricsRecorder by default) for the block.
+
+    The hook is a context variable, so it follows asyncio tasks and
+    asyncio.to_thread but not plain worker threads. With nothing installed,
+    every hook below is a single context-variable read.
+    """
+    recorder = recorder if recorder is not None else MetricsRecorder()
+    token = _current.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _current.reset(token)
+
+
+# The installed recorder or None; a bound C method, cheap enough for hot paths
+current_instrumentation: Callable[[], Instrumentation | None] = _current.get
+
+
+def phase(name: str) -> AbstractContextManager[None]:
+    recorder = _current.get()
+    return _NO_PHASE if recorder is None else recorder.phase(name)
+
+
+def timed_distance_fn(distance_fn: DistanceFn, name: str = "distance_fn") -> DistanceFn:
+    """
+    distance_fn unchanged when nothing is installed; otherwise a wrapper
+    recording each call's latency in the `name` histogram.
+    """
+    recorder = _current.get()
+    if recorder is None:
+        return distance_fn
+    perf_counter = time.perf_counter
+
+    def _timed(a: Location, b: Location) -> tuple[float, float]:
+        started = perf_counter()
+        try:
+            return distance_fn(a, b)
+        finally:
+            recorder.observe(name, perf_counter() - started)
+
+    return _timed
@@ -1,12 +1,44 @@
 from __future__ import annotations
 
+import asyncio
+from array import array
 from collections.abc import Callable, Sequence
 
-from gotrippee.domain.models import Leg, Location, RoutePlan
+from gotrippee.distance.aio import AsyncDistanceFn
+from gotrippee.distance.matrix import DistanceMatrix, SymmetricDistanceMatrix
+from gotrippee.domain.compact import CompactRoutePlan
+from gotrippee.domain.models import (
+    Location,
+    RoutePlan,
+    _check_totals,
+    _trusted_leg,
+    _trusted_route_plan,
+)
+from gotrippee.instrumentation import phase, timed_distance_fn
 
 DistanceFn = Callable[[Location, Location], tuple[float, float]]
 
 
+def _build_plan(
+    stops: list[Location], km: Sequence[float], minutes: Sequence[float]
+) -> RoutePlan:
+    """
+    Assemble a plan from per-leg values. Only the values are checked (in bulk);
+    legs and totals are consistent by construction, so the model validation is
+    skipped.
+    """
+    if km and min(km) < 0:
+        raise ValueError(f"distance_km must be >= 0, got {min(km)}")
+    if minutes and min(minutes) < 0:
+        raise ValueError(f"duration_minutes must be >= 0, got {min(minutes)}")
+
+    total_km, total_minutes = sum(km), sum(minutes)
+    _check_totals(total_km, total_minutes)
+
+    legs = list(map(_trusted_leg, stops, stops[1:], km, minutes))
+    return _trusted_route_plan(stops, legs, total_km, total_minutes)
+
+
 def plan_route(*, stops: Sequence[Location], distance_fn: DistanceFn | None = None) -> RoutePlan:
     if len(stops) < 2:
         raise ValueError("stops must contain at least 2 locations")
@@ -17,26 +49,68 @@ def plan_route(*, stops: Sequence[Location], distance_fn: DistanceFn | None = No
 
     distance_fn = distance_fn or default_distance_fn
 
-    legs: list[Leg] = []
-    total_distance = 0.0
-    total_duration = 0.0
-
-    for start, end in zip(stops, stops[1:], strict=False):
-        distance_km, duration_minutes = distance_fn(start, end)
-        legs.append(
-            Leg(
-                start=start,
-                end=end,
-                distance_km=distance_km,
-                duration_minutes=duration_minutes,
-            )
-        )
-        total_distance += distance_km
-        total_duration += duration_minutes
-
-    return RoutePlan(
-        stops=list(stops),
-        legs=legs,
-        total_distance_km=total_distance,
-        total_duration_minutes=total_duration,
+    km: list[float] = []
+    minutes: list[float] = []
+    with phase("plan_route.lookup"):
+        distance_fn = timed_distance_fn(distance_fn)
+        for start, end in zip(stops, stops[1:], strict=False):
+            distance_km, duration_minutes = distance_fn(start, end)
+            km.append(distance_km)
+            minutes.append(duration_minutes)
+
+    with phase("plan_route.build"):
+        return _build_plan(list(stops), km, minutes)
+
+
+def plan_route_indexed(
+    *, stops: Sequence[int], matrix: DistanceMatrix | SymmetricDistanceMatrix
+) -> RoutePlan:
+    """Like plan_route, but stops are indices into a square (or packed symmetric) matrix."""
+    if len(stops) < 2:
+        raise ValueError("stops must contain at least 2 locations")
+
+    locations = matrix.sources
+    km, minutes = matrix.leg_values(stops)
+    return _build_plan([locations[i] for i in stops], km, minutes)
+
+
+def plan_route_compact(
+    *, stops: Sequence[int], matrix: DistanceMatrix | SymmetricDistanceMatrix
+) -> CompactRoutePlan:
+    """
+    Like plan_route_indexed, but returns a CompactRoutePlan that shares
+    matrix.sources and builds Leg objects only on access.
+    """
+    if len(stops) < 2:
+        raise ValueError("stops must contain at least 2 locations")
+
+    km, minutes = matrix.leg_values(stops)
+    return CompactRoutePlan(
+        locations=matrix.sources,
+        stop_indices=stops,
+        km=array("d", km),
+        minutes=array("d", minutes),
     )
+
+
+async def plan_route_async(
+    *,
+    stops: Sequence[Location],
+    distance_fn: AsyncDistanceFn | None = None,
+) -> RoutePlan:
+    """
+    Async plan_route: all legs are independent, so every lookup is started at
+    once and the plan is assembled in stop order.
+    """
+    if len(stops) < 2:
+        raise ValueError("stops must contain at least 2 locations")
+
+    async def default_distance_fn(start: Location, end: Location) -> tuple[float, float]:
+        return (0.0, 0.0)
+
+    distance_fn = distance_fn or default_distance_fn
+
+    pairs = list(zip(stops, stops[1:], strict=False))
+    results = await asyncio.gather(*(distance_fn(start, end) for start, end in pairs))
+
+    return _build_plan(list(stops), [r[0] for r in results], [r[1] for r in results])
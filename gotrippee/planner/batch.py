@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from gotrippee.distance.cache import cached_distance_fn
+from gotrippee.distance.matrix import MatrixFn
+from gotrippee.domain.models import Location, RoutePlan
+
+from .naive import (
+    _validate_start_and_stops,
+    plan_route_naive,
+    plan_route_naive_indexed,
+    plan_route_naive_round_trip,
+    plan_route_naive_round_trip_indexed,
+)
+
+DistanceFn = Callable[[Location, Location], tuple[float, float]]
+
+
+@dataclass(frozen=True, slots=True)
+class TripJob:
+    start: Location
+    stops: Sequence[Location]
+
+
+def plan_routes_batch(
+    jobs: Iterable[TripJob],
+    *,
+    matrix_fn: MatrixFn | None = None,
+    distance_fn: DistanceFn | None = None,
+    round_trip: bool = True,
+    max_workers: int = 8,
+) -> Iterator[RoutePlan]:
+    """
+    Plan many independent trips with the naive planner; plans are yielded in
+    job order as they complete.
+
+    All jobs are validated up front; every job needs at least one stop.
+    Distances come from one shared source:
+    - matrix_fn: each job fetches one block over its own locations and is
+      planned by index into it. Jobs are independent, so a matrix over the
+      union of all jobs would be almost entirely unread.
+    - distance_fn: wrapped in one shared cached_distance_fn, so pairs that
+      several jobs need are fetched once even when requested concurrently.
+
+    Jobs run on a pool of max_workers threads. That overlaps provider I/O
+    (matrix or distance requests) only; the planning itself is CPU-bound and
+    does not run in parallel under the GIL.
+    """
+    if (matrix_fn is None) == (distance_fn is None):
+        raise ValueError("pass exactly one of matrix_fn or distance_fn")
+    if max_workers < 1:
+        raise ValueError(f"max_workers must be >= 1, got {max_workers}")
+
+    jobs = list(jobs)
+    for i, job in enumerate(jobs):
+        if not job.stops:
+            raise ValueError(f"job {i}: stops must not be empty")
+        try:
+            _validate_start_and_stops(start=job.start, stops=job.stops)
+        except ValueError as exc:
+            raise ValueError(f"job {i}: {exc}") from exc
+
+    if matrix_fn is not None:
+        plan_one = _matrix_planner(matrix_fn, round_trip)
+    elif distance_fn is not None:
+        plan_one = _location_planner(cached_distance_fn(distance_fn), round_trip)
+
+    return _stream(jobs, plan_one, max_workers)
+
+
+def _matrix_planner(matrix_fn: MatrixFn, round_trip: bool) -> Callable[[TripJob], RoutePlan]:
+    planner = plan_route_naive_round_trip_indexed if round_trip else plan_route_naive_indexed
+
+    def plan_one(job: TripJob) -> RoutePlan:
+        # Validation ruled out repeated locations, so row i is location i
+        matrix = matrix_fn([job.start, *job.stops])
+        return planner(start=0, stops=list(range(1, len(job.stops) + 1)), matrix=matrix)
+
+    return plan_one
+
+
+def _location_planner(distance_fn: DistanceFn, round_trip: bool) -> Callable[[TripJob], RoutePlan]:
+    planner = plan_route_naive_round_trip if round_trip else plan_route_naive
+
+    def plan_one(job: TripJob) -> RoutePlan:
+        return planner(start=job.start, stops=job.stops, distance_fn=distance_fn)
+
+    return plan_one
+
+
+def _stream(
+    jobs: list[TripJob],
+    plan_one: Callable[[TripJob], RoutePlan],
+    max_workers: int,
+) -> Iterator[RoutePlan]:
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        yield from pool.map(plan_one, jobs)
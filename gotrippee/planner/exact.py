@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from gotrippee.distance.matrix import DistanceMatrix, SymmetricDistanceMatrix
+from gotrippee.domain.models import RoutePlan
+
+from . import plan_route_indexed
+from .local_search import plan_route_local_search, plan_route_local_search_round_trip
+from .naive import _start_only_plan, _validate_start_and_stop_indices
+
+try:  # optional: pip install gotrippee[fast]
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
+
+IndexedPlanner = Callable[..., RoutePlan]
+
+# dp cost (float64) + predecessor (int8) per (subset, last stop) cell
+_BYTES_PER_CELL = 9
+
+
+def held_karp_memory_bytes(n_stops: int) -> int:
+    """Memory the DP tables need for n_stops stops (excluding start)."""
+    return (1 << n_stops) * n_stops * _BYTES_PER_CELL
+
+
+def _held_karp_tables(
+    cost: list[list[float]], from_start: list[float]
+) -> tuple[array[float], array[int]]:
+    """Flat dp and parent tables, cell (mask, j) at mask * m + j."""
+    m = len(from_start)
+    full = (1 << m) - 1
+    inf = float("inf")
+    dp = array("d", [inf]) * ((full + 1) * m)
+    parent = array("b", [-1]) * ((full + 1) * m)
+
+    for j in range(m):
+        dp[(1 << j) * m + j] = from_start[j]
+
+    bits_of = [[k for k in range(m) if mask >> k & 1] for mask in range(1 << min(m, 16))]
+
+    for mask in range(1, full + 1):
+        base = mask * m
+        bits = bits_of[mask] if mask < len(bits_of) else [k for k in range(m) if mask >> k & 1]
+        if len(bits) < 2:
+            continue
+        for j in bits:
+            prev_base = (mask ^ (1 << j)) * m
+            best = inf
+            best_k = -1
+            for k in bits:
+                if k == j:
+                    continue
+                c = dp[prev_base + k] + cost[k][j]
+                if c < best:
+                    best = c
+                    best_k = k
+            dp[base + j] = best
+            parent[base + j] = best_k
+
+    return dp, parent
+
+
+def _held_karp_tables_numpy(cost: list[list[float]], from_start: list[float]) -> tuple[Any, Any]:
+    """
+    _held_karp_tables with the min over predecessors vectorized across every
+    subset of one size at a time. argmin keeps the first minimum, so ties
+    break towards the lowest k exactly like the pure-Python loop.
+    """
+    m = len(from_start)
+    masks = np.arange(1 << m)
+    dp = np.full((1 << m, m), np.inf)
+    parent = np.full((1 << m, m), -1, dtype=np.int8)
+    dp[1 << np.arange(m), np.arange(m)] = from_start
+    costs = np.asarray(cost, dtype=np.float64)
+
+    sizes = np.zeros(1 << m, dtype=np.int8)
+    for k in range(m):
+        sizes += (masks >> k & 1).astype(np.int8)
+
+    for size in range(2, m + 1):
+        layer = masks[sizes == size]
+        for j in range(m):
+            subsets = layer[(layer >> j & 1) == 1]
+            # dp[prev, k] is inf for k outside prev, so only real predecessors win
+            candidates = dp[subsets ^ (1 << j)] + costs[:, j]
+            best = candidates.argmin(axis=1)
+            dp[subsets, j] = candidates[np.arange(len(subsets)), best]
+            parent[subsets, j] = best
+
+    return dp.ravel(), parent.ravel()
+
+
+def held_karp_order(
+    *,
+    start: int,
+    stops: Sequence[int],
+    matrix: DistanceMatrix | SymmetricDistanceMatrix,
+    round_trip: bool = False,
+) -> list[int]:
+    """
+    Optimal visiting order of stops (start excluded) by Held-Karp bitmask DP.
+
+    O(2^n x n^2) time and O(2^n x n) memory, so only for small n; see
+    plan_route_exact for the size guard. With NumPy installed the DP runs
+    vectorized, one subset size at a time.
+    """
+    m = len(stops)
+    if m == 0:
+        return []
+    if m > 127:
+        raise ValueError(f"held_karp_order supports at most 127 stops, got {m}")
+
+    # cost[k][j]: stop k -> stop j; from_start[j], to_start[j]
+    rows = [matrix.row_km(s) for s in stops]
+    cost = [[rows[k][stops[j]] for j in range(m)] for k in range(m)]
+    start_row = matrix.row_km(start)
+    from_start = [start_row[s] for s in stops]
+    to_start = [rows[k][start] for k in range(m)]
+
+    tables = _held_karp_tables if np is None else _held_karp_tables_numpy
+    dp, parent = tables(cost, from_start)
+
+    full = (1 << m) - 1
+    last_base = full * m
+    if round_trip:
+        finals = [float(dp[last_base + j]) + to_start[j] for j in range(m)]
+    else:
+        finals = [float(dp[last_base + j]) for j in range(m)]
+    j = min(range(m), key=finals.__getitem__)
+
+    order: list[int] = []
+    mask = full
+    while j != -1:
+        order.append(stops[j])
+        k = int(parent[mask * m + j])
+        mask ^= 1 << j
+        j = k
+    order.reverse()
+    return order
+
+
+def plan_route_exact(
+    *,
+    start: int,
+    stops: Sequence[int],
+    matrix: DistanceMatrix | SymmetricDistanceMatrix,
+    max_exact_stops: int = 15,
+    memory_limit_bytes: int = 256 * 1024 * 1024,
+    fallback: IndexedPlanner = plan_route_local_search,
+) -> RoutePlan:
+    """
+    Provably shortest open route from start through all stops.
+
+    Above max_exact_stops stops, or when the DP tables would exceed
+    memory_limit_bytes, delegates to `fallback` (local search by default).
+    """
+    _validate_start_and_stop_indices(start=start, stops=stops, matrix=matrix)
+
+    if len(stops) > max_exact_stops or held_karp_memory_bytes(len(stops)) > memory_limit_bytes:
+        return fallback(start=start, stops=stops, matrix=matrix)
+
+    ordered = held_karp_order(start=start, stops=stops, matrix=matrix)
+    return plan_route_indexed(stops=[start, *ordered], matrix=matrix)
+
+
+def plan_route_exact_round_trip(
+    *,
+    start: int,
+    stops: Sequence[int],
+    matrix: DistanceMatrix | SymmetricDistanceMatrix,
+    max_exact_stops: int = 15,
+    memory_limit_bytes: int = 256 * 1024 * 1024,
+    fallback: IndexedPlanner = plan_route_local_search_round_trip,
+) -> RoutePlan:
+    """Round-trip plan_route_exact: shortest tour from start back to start."""
+    _validate_start_and_stop_indices(start=start, stops=stops, matrix=matrix)
+
+    if not stops:
+        return _start_only_plan(matrix.sources[start])
+    if len(stops) > max_exact_stops or held_karp_memory_bytes(len(stops)) > memory_limit_bytes:
+        return fallback(start=start, stops=stops, matrix=matrix)
+
+    ordered = held_karp_order(start=start, stops=stops, matrix=matrix, round_trip=True)
+    return plan_route_indexed(stops=[start, *ordered, start], matrix=matrix)
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import heapq
+from collections.abc import Callable
+
+from gotrippee.distance.haversine import great_circle_km
+from gotrippee.domain.models import Leg, Location, RoutePlan, _trusted_route_plan
+
+DistanceFn = Callable[[Location, Location], tuple[float, float]]
+
+
+def _is_round_trip(plan: RoutePlan) -> bool:
+    return len(plan.stops) > 1 and plan.stops[0] == plan.stops[-1]
+
+
+def _gc(a: Location, b: Location) -> float:
+    return great_circle_km(a.latitude, a.longitude, b.latitude, b.longitude)
+
+
+class _Route:
+    """Mutable stops/legs with totals maintained by deltas."""
+
+    __slots__ = ("stops", "legs", "km", "minutes", "distance_fn", "fixed_end")
+
+    def __init__(self, plan: RoutePlan, distance_fn: DistanceFn) -> None:
+        self.stops = list(plan.stops)
+        self.legs = list(plan.legs)
+        self.km = plan.total_distance_km
+        self.minutes = plan.total_duration_minutes
+        self.distance_fn = distance_fn
+        self.fixed_end = _is_round_trip(plan)
+
+    def leg(self, a: Location, b: Location) -> Leg:
+        km, minutes = self.distance_fn(a, b)
+        return Leg(start=a, end=b, distance_km=km, duration_minutes=minutes)
+
+    def replace(self, first: int, last: int, stops: list[Location], legs: list[Leg]) -> None:
+        """Swap legs[first:last] (and the stops between them) for new ones."""
+        old = self.legs[first:last]
+        self.km += sum(g.distance_km for g in legs) - sum(g.distance_km for g in old)
+        self.minutes += sum(g.duration_minutes for g in legs) - sum(
+            g.duration_minutes for g in old
+        )
+        self.legs[first:last] = legs
+        self.stops[first + 1 : last] = stops
+
+    def try_swap(self, i: int) -> bool:
+        """Swap stops i and i+1 if that shortens the route (3 lookups)."""
+        last = len(self.stops) - 1
+        if i < 1 or i + 1 > last or (self.fixed_end and i + 1 == last):
+            return False
+        x, y = self.stops[i], self.stops[i + 1]
+        w = self.stops[i - 1]
+        z = self.stops[i + 2] if i + 2 <= last else None
+
+        new = [self.leg(w, y), self.leg(y, x)]
+        if z is None:
+            # y is the open end: the swapped route simply ends at x
+            old = self.legs[i - 1 : i + 1]
+            if sum(g.distance_km for g in new) < sum(g.distance_km for g in old):
+                self.replace(i - 1, i + 1, [y], new)
+                self.stops[-1] = x
+                return True
+            return False
+
+        new.append(self.leg(x, z))
+        if sum(g.distance_km for g in new) < sum(g.distance_km for g in self.legs[i - 1 : i + 2]):
+            self.replace(i - 1, i + 2, [y, x], new)
+            return True
+        return False
+
+    def repair(self, position: int) -> None:
+        for i in (position - 1, position):
+            self.try_swap(i)
+
+    def plan(self) -> RoutePlan:
+        # Legs were validated by Leg(...) and the totals kept by deltas, so the
+        # O(n) re-summing in RoutePlan.__post_init__ is skipped
+        return _trusted_route_plan(self.stops, self.legs, self.km, self.minutes)
+
+
+def insert_stop(
+    plan: RoutePlan,
+    stop: Location,
+    *,
+    distance_fn: DistanceFn,
+    candidates: int | None = None,
+    repair: bool = True,
+) -> RoutePlan:
+    """
+    Add one stop to an existing plan by cheapest insertion.
+
+    Existing legs are reused as-is; only distances touching the new stop are
+    queried (two per candidate position). candidates=k only tries the k
+    positions with the cheapest great-circle detour. A round trip keeps its
+    return leg; an open route may also append at the end. With repair, the
+    stops next to the new one are swapped when that shortens the route.
+    """
+    if any(s == stop for s in plan.stops):
+        raise ValueError("stop is already in the plan")
+    if any(s.name == stop.name for s in plan.stops):
+        raise ValueError("duplicate stop names are not allowed")
+    if candidates is not None and candidates < 1:
+        raise ValueError(f"candidates must be >= 1, got {candidates}")
+
+    route = _Route(plan, distance_fn)
+    positions = list(range(len(route.legs)))
+    if candidates is not None and len(positions) > candidates:
+        positions = heapq.nsmallest(
+            candidates,
+            positions,
+            key=lambda i: _gc(route.legs[i].start, stop)
+            + _gc(stop, route.legs[i].end)
+            - _gc(route.legs[i].start, route.legs[i].end),
+        )
+
+    best: tuple[float, int, list[Leg]] | None = None
+    for i in positions:
+        old = route.legs[i]
+        new = [route.leg(old.start, stop), route.leg(stop, old.end)]
+        delta = new[0].distance_km + new[1].distance_km - old.distance_km
+        if best is None or delta < best[0]:
+            best = (delta, i, new)
+
+    if not route.fixed_end:
+        new = [route.leg(route.stops[-1], stop)]
+        if best is None or new[0].distance_km < best[0]:
+            best = (new[0].distance_km, len(route.legs), new)
+
+    _, i, new = best  # type: ignore[misc]
+    route.replace(i, i + 1, [stop], new)
+    if repair:
+        route.repair(i + 1)
+    return route.plan()
+
+
+def remove_stop(
+    plan: RoutePlan,
+    stop: Location,
+    *,
+    distance_fn: DistanceFn,
+    repair: bool = True,
+) -> RoutePlan:
+    """
+    Drop one stop from an existing plan, joining its neighbours with a single
+    new leg (one lookup). The start (and a round trip's end) cannot be removed.
+    """
+    try:
+        i = plan.stops.index(stop)
+    except ValueError:
+        raise ValueError("stop is not in the plan") from None
+
+    route = _Route(plan, distance_fn)
+    last = len(route.stops) - 1
+    if i == 0 or (route.fixed_end and i == last):
+        raise ValueError("start must not be removed")
+
+    if i == last:
+        route.replace(i - 1, i, [], [])
+        route.stops.pop()
+    else:
+        route.replace(i - 1, i + 1, [], [route.leg(route.stops[i - 1], route.stops[i + 1])])
+        if repair:
+            route.repair(i)
+    return route.plan()
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import heapq
+from collections.abc import Sequence
+
+from gotrippee.distance.matrix import DistanceMatrix, SymmetricDistanceMatrix
+from gotrippee.domain.models import RoutePlan
+
+from . import plan_route_indexed
+from .naive import (
+    _start_only_plan,
+    _validate_start_and_stop_indices,
+    order_stop_indices_nearest_neighbour,
+)
+
+# Open routes end at a virtual stop that is free to reach
+_END = -1
+_EPS = 1e-10
+
+Matrix = DistanceMatrix | SymmetricDistanceMatrix
+
+
+class _Tour:
+    """
+    Working copy of a route: fixed first and last positions, km lookups, and
+    forward/backward prefix sums so a reversed segment is costed in O(1)
+    (the matrix may be asymmetric).
+    """
+
+    __slots__ = ("nodes", "pos", "fwd", "bwd", "_km", "_n")
+
+    def __init__(self, nodes: list[int], matrix: Matrix) -> None:
+        self._km = matrix.km
+        self._n = matrix.n_cols
+        self.nodes = nodes
+        self.refresh()
+
+    def d(self, u: int, v: int) -> float:
+        if u == _END or v == _END:
+            return 0.0
+        return self._km[u * self._n + v]
+
+    def refresh(self) -> None:
+        nodes, d = self.nodes, self.d
+        # First occurrence wins, so a round trip's start maps to position 0
+        self.pos = {u: i for i, u in reversed(list(enumerate(nodes)))}
+        fwd = [0.0]
+        bwd = [0.0]
+        for u, v in zip(nodes, nodes[1:], strict=False):
+            fwd.append(fwd[-1] + d(u, v))
+            bwd.append(bwd[-1] + d(v, u))
+        self.fwd = fwd
+        self.bwd = bwd
+
+    def reversal_delta(self, i: int, j: int) -> float:
+        # Internal cost change of reversing nodes[i..j]
+        return (self.bwd[j] - self.bwd[i]) - (self.fwd[j] - self.fwd[i])
+
+
+class _PackedTour(_Tour):
+    """_Tour over a SymmetricDistanceMatrix, whose km is not row-major."""
+
+    __slots__ = ("_distance",)
+
+    def __init__(self, nodes: list[int], matrix: SymmetricDistanceMatrix) -> None:
+        self._distance = matrix.distance_km
+        super().__init__(nodes, matrix)
+
+    def d(self, u: int, v: int) -> float:
+        if u == _END or v == _END:
+            return 0.0
+        return self._distance(u, v)
+
+
+def _neighbour_lists(
+    nodes: Sequence[int], matrix: Matrix, k: int
+) -> dict[int, list[int]]:
+    real = [u for u in nodes if u != _END]
+    unique = list(dict.fromkeys(real))
+    lists: dict[int, list[int]] = {}
+    for u in unique:
+        row = matrix.row_km(u)
+        lists[u] = heapq.nsmallest(k, (v for v in unique if v != u), key=row.__getitem__)
+    return lists
+
+
+def _two_opt_pass(tour: _Tour, neighbours: dict[int, list[int]]) -> bool:
+    nodes, d = tour.nodes, tour.d
+    last = len(nodes) - 1
+    improved = False
+
+    i = 0
+    while i < last - 1:
+        a = nodes[i]
+        for c in neighbours.get(a, ()):
+            j = tour.pos[c]
+            if j > i + 1 and j < last:
+                lo, hi = i, j
+            elif 1 <= j < i - 1:
+                lo, hi = j - 1, i - 1
+            else:
+                continue
+            # Reverse nodes[lo+1..hi]: edges (lo, lo+1), (hi, hi+1) become
+            # (lo, hi), (lo+1, hi+1)
+            p, q, r, s = nodes[lo], nodes[lo + 1], nodes[hi], nodes[hi + 1]
+            delta = (
+                d(p, r) + d(q, s) - d(p, q) - d(r, s) + tour.reversal_delta(lo + 1, hi)
+            )
+            if delta < -_EPS:
+                nodes[lo + 1 : hi + 1] = nodes[lo + 1 : hi + 1][::-1]
+                tour.refresh()
+                improved = True
+                break
+        i += 1
+
+    return improved
+
+
+def _or_opt_pass(tour: _Tour, neighbours: dict[int, list[int]], max_segment: int) -> bool:
+    nodes, d = tour.nodes, tour.d
+    last = len(nodes) - 1
+    improved = False
+
+    for length in range(1, max_segment + 1):
+        s = 1
+        while s + length - 1 < last:
+            e = s + length - 1
+            head, tail = nodes[s], nodes[e]
+            prev, nxt = nodes[s - 1], nodes[e + 1]
+            removed = d(prev, head) + d(tail, nxt) - d(prev, nxt)
+            reversed_internal = tour.reversal_delta(s, e)
+
+            best = (-_EPS, -1, False)
+            for c in (*neighbours.get(head, ()), *neighbours.get(tail, ())):
+                pc = tour.pos[c]
+                for k in (pc, pc - 1):
+                    if k < 0 or k >= last or s - 1 <= k <= e:
+                        continue
+                    u, v = nodes[k], nodes[k + 1]
+                    base = d(u, v)
+                    forward = d(u, head) + d(tail, v) - base - removed
+                    backward = d(u, tail) + d(head, v) - base - removed + reversed_internal
+                    if forward < best[0]:
+                        best = (forward, k, False)
+                    if backward < best[0]:
+                        best = (backward, k, True)
+
+            _, k, flip = best
+            if k != -1:
+                segment = nodes[s : e + 1]
+                if flip:
+                    segment.reverse()
+                del nodes[s : e + 1]
+                at = k + 1 if k < s else k - length + 1
+                nodes[at:at] = segment
+                tour.refresh()
+                improved = True
+            s += 1
+
+    return improved
+
+
+def improve_order(
+    order: Sequence[int],
+    matrix: Matrix,
+    *,
+    round_trip: bool = False,
+    neighbours: int = 10,
+    max_segment: int = 3,
+    max_rounds: int = 100,
+) -> list[int]:
+    """
+    Improve a visiting order with 2-opt and Or-opt moves on a square (or
+    packed symmetric) matrix.
+
+    order[0] is the fixed start; with round_trip the route also returns to
+    it. Moves are found through each stop's `neighbours` nearest stops and
+    costed by delta evaluation, so one pass is O(n x neighbours) plus O(n)
+    per accepted move. Stops after max_rounds passes or at a local optimum.
+    """
+    if neighbours < 1:
+        raise ValueError(f"neighbours must be >= 1, got {neighbours}")
+    if len(order) < 3:
+        return list(order)
+
+    nodes = [*order, order[0] if round_trip else _END]
+    tour = (
+        _PackedTour(nodes, matrix)
+        if isinstance(matrix, SymmetricDistanceMatrix)
+        else _Tour(nodes, matrix)
+    )
+    lists = _neighbour_lists(nodes, matrix, neighbours)
+
+    for _ in range(max_rounds):
+        improved = _two_opt_pass(tour, lists)
+        improved = _or_opt_pass(tour, lists, max_segment) or improved
+        if not improved:
+            break
+
+    return tour.nodes[:-1]
+
+
+def plan_route_local_search(
+    *,
+    start: int,
+    stops: Sequence[int],
+    matrix: Matrix,
+    neighbours: int = 10,
+) -> RoutePlan:
+    """Nearest-neighbour ordering followed by 2-opt/Or-opt; open route from start."""
+    _validate_start_and_stop_indices(start=start, stops=stops, matrix=matrix)
+
+    ordered = order_stop_indices_nearest_neighbour(stops=stops, matrix=matrix)
+    route = improve_order([start, *ordered], matrix, neighbours=neighbours)
+    return plan_route_indexed(stops=route, matrix=matrix)
+
+
+def plan_route_local_search_round_trip(
+    *,
+    start: int,
+    stops: Sequence[int],
+    matrix: Matrix,
+    neighbours: int = 10,
+) -> RoutePlan:
+    """Round-trip plan_route_local_search: returns to start."""
+    _validate_start_and_stop_indices(start=start, stops=stops, matrix=matrix)
+
+    if not stops:
+        return _start_only_plan(matrix.sources[start])
+
+    ordered = order_stop_indices_nearest_neighbour(stops=stops, matrix=matrix)
+    route = improve_order([start, *ordered], matrix, round_trip=True, neighbours=neighbours)
+    return plan_route_indexed(stops=[*route, start], matrix=matrix)
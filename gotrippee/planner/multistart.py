@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import os
+from array import array
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any
+
+from gotrippee.distance.matrix import DistanceMatrix, SymmetricDistanceMatrix
+from gotrippee.domain.models import RoutePlan
+from gotrippee.domain.table import LocationTable
+
+from . import plan_route_indexed
+from .local_search import improve_order
+from .naive import (
+    _start_only_plan,
+    _validate_start_and_stop_indices,
+    order_stop_indices_nearest_neighbour,
+)
+
+# Per-worker state set by _init_worker: the attached matrix and the job
+_worker: dict[str, Any] = {}
+
+
+Matrix = DistanceMatrix | SymmetricDistanceMatrix
+
+
+def _route_km(matrix: Matrix, route: Sequence[int]) -> float:
+    km, _ = matrix.leg_values(route)
+    return sum(km)
+
+
+def _run_seed(
+    matrix: Matrix,
+    start: int,
+    stops: Sequence[int],
+    position: int,
+    round_trip: bool,
+    local_search: bool,
+) -> tuple[float, int, list[int]]:
+    seed = stops[position]
+    others = [s for s in stops if s != seed]
+    route = [start, *order_stop_indices_nearest_neighbour(stops=[seed, *others], matrix=matrix)]
+    if local_search:
+        route = improve_order(route, matrix, round_trip=round_trip)
+    if round_trip:
+        route.append(start)
+    return (_route_km(matrix, route), position, route)
+
+
+def _init_worker(
+    shm_name: str,
+    locations: LocationTable,
+    packed: bool,
+    start: int,
+    stops: Sequence[int],
+    round_trip: bool,
+    local_search: bool,
+) -> None:
+    shm = shared_memory.SharedMemory(name=shm_name)
+    buf = shm.buf
+    if buf is None:
+        raise ValueError(f"shared memory block {shm_name} is closed")
+    n = len(locations)
+    count = n * (n - 1) // 2 if packed else n * n
+    km = buf[: 8 * count].cast("d")
+    # Ordering only reads km, so it doubles as minutes
+    matrix: Matrix = (
+        SymmetricDistanceMatrix(locations=locations, km=km, minutes=km)
+        if packed
+        else DistanceMatrix(sources=locations, targets=locations, km=km, minutes=km)
+    )
+    _worker.update(shm=shm, matrix=matrix, args=(start, stops, round_trip, local_search))
+
+
+def _run_seed_in_worker(position: int) -> tuple[float, int, list[int]]:
+    start, stops, round_trip, local_search = _worker["args"]
+    return _run_seed(_worker["matrix"], start, stops, position, round_trip, local_search)
+
+
+def plan_route_multistart(
+    *,
+    start: int,
+    stops: Sequence[int],
+    matrix: DistanceMatrix | SymmetricDistanceMatrix,
+    round_trip: bool = False,
+    seeds: int | None = None,
+    local_search: bool = False,
+    max_workers: int | None = None,
+) -> RoutePlan:
+    """
+    Run nearest-neighbour (optionally + local search) once per seed stop and
+    keep the shortest route.
+
+    Seed i starts the NN ordering from stops[i]; `seeds` limits this to the
+    first few stops (default: all). Seed 0 is plan_route_naive_indexed's
+    ordering, so the result is never worse than it. With max_workers > 1 the
+    seeds run in a process pool whose workers read the km matrix from one
+    shared-memory block instead of receiving pickled copies. Ties are broken
+    by seed position, so the result does not depend on the worker count.
+    """
+    _validate_start_and_stop_indices(start=start, stops=stops, matrix=matrix)
+
+    stops = list(stops)
+    if not stops:
+        return _start_only_plan(matrix.sources[start])
+
+    positions = range(min(len(stops), seeds if seeds is not None else len(stops)))
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(positions))
+
+    if max_workers <= 1:
+        results = [
+            _run_seed(matrix, start, stops, p, round_trip, local_search) for p in positions
+        ]
+    else:
+        results = _run_in_pool(
+            matrix, start, stops, positions, round_trip, local_search, max_workers
+        )
+
+    _, _, route = min(results, key=lambda r: (r[0], r[1]))
+    return plan_route_indexed(stops=route, matrix=matrix)
+
+
+def _run_in_pool(
+    matrix: Matrix,
+    start: int,
+    stops: list[int],
+    positions: range,
+    round_trip: bool,
+    local_search: bool,
+    max_workers: int,
+) -> list[tuple[float, int, list[int]]]:
+    # Workers always read float64, whatever the matrix stores (e.g. float32);
+    # a packed matrix stays packed
+    km = matrix.km
+    if not (isinstance(km, array) and km.typecode == "d"):
+        km = array("d", km)
+    raw = memoryview(km).cast("B")
+    # Picklable stand-in for the sources (which may be views into shared memory)
+    locations = LocationTable.from_locations(matrix.sources)
+
+    shm = shared_memory.SharedMemory(create=True, size=max(len(raw), 1))
+    try:
+        buf = shm.buf
+        if buf is None:
+            raise ValueError(f"shared memory block {shm.name} is closed")
+        view = buf[: len(raw)]
+        try:
+            view[:] = raw
+        finally:
+            view.release()
+
+        chunksize = max(1, len(positions) // (max_workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(
+                shm.name,
+                locations,
+                isinstance(matrix, SymmetricDistanceMatrix),
+                start,
+                stops,
+                round_trip,
+                local_search,
+            ),
+        ) as pool:
+            return list(pool.map(_run_seed_in_worker, positions, chunksize=chunksize))
+    finally:
+        shm.close()
+        shm.unlink()
@@ -1,10 +1,20 @@
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable, Sequence
+from itertools import compress
 
-from gotrippee.domain.models import Location, RoutePlan
+from gotrippee.distance.aio import AsyncDistanceFn
+from gotrippee.distance.matrix import DistanceMatrix, SymmetricDistanceMatrix
+from gotrippee.domain.models import Location, RoutePlan, _trusted_route_plan
+from gotrippee.instrumentation import phase, timed_distance_fn
 
-from . import plan_route
+from . import plan_route, plan_route_async, plan_route_indexed
+
+try:  # optional: pip install gotrippee[fast]
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
 
 DistanceFn = Callable[[Location, Location], tuple[float, float]]
 
@@ -29,6 +39,11 @@ def order_stops_nearest_neighbour(
     if len(stops) < 2:
         return list(stops)
 
+    with phase("nearest_neighbour.order"):
+        return _order_nearest_neighbour(stops, timed_distance_fn(distance_fn))
+
+
+def _order_nearest_neighbour(stops: Sequence[Location], distance_fn: DistanceFn) -> list[Location]:
     ordered: list[Location] = [stops[0]]
     remaining: list[Location] = list(stops[1:])
 
@@ -56,7 +71,8 @@ def plan_route_naive(
         stops: Sequence[Location],
         distance_fn: DistanceFn,
         ) -> RoutePlan:
-    _validate_start_and_stops(start=start, stops=stops)
+    with phase("validate_start_and_stops"):
+        _validate_start_and_stops(start=start, stops=stops)
     
     ordered_stops = order_stops_nearest_neighbour(
         stops=stops,
@@ -77,10 +93,185 @@ def plan_route_naive_round_trip(
     Naive planner that orders stops using nearest-neighbour and returns to start.
     - If stops is empty, returns a plan with just [start] (0 legs).
     """
-    _validate_start_and_stops(start=start, stops=stops)
+    with phase("validate_start_and_stops"):
+        _validate_start_and_stops(start=start, stops=stops)
     
     if not stops:
         return plan_route(stops=[start], distance_fn=distance_fn)
     
     ordered = order_stops_nearest_neighbour(stops=stops, distance_fn=distance_fn)
-    return plan_route(stops=[start, *ordered, start], distance_fn=distance_fn)
\ No newline at end of file
+    return plan_route(stops=[start, *ordered, start], distance_fn=distance_fn)
+
+
+# --- Index-based variants reading from a precomputed DistanceMatrix ---
+
+def _validate_start_and_stop_indices(
+    *,
+    start: int,
+    stops: Sequence[int],
+    matrix: DistanceMatrix | SymmetricDistanceMatrix,
+) -> None:
+    if not matrix.is_square:
+        raise ValueError("matrix must be square (sources == targets)")
+
+    n = matrix.n_rows
+    if not all(0 <= i < n for i in (start, *stops)):
+        raise ValueError(f"stop indices must be between 0 and {n - 1}")
+
+    if start in stops:
+        raise ValueError("start must not appear in stops")
+
+    if len(set(stops)) != len(stops):
+        raise ValueError("duplicate stops are not allowed")
+
+
+def _start_only_plan(start: Location) -> RoutePlan:
+    """Round trip with no stops: the start location alone, without legs."""
+    return _trusted_route_plan([start], [], 0.0, 0.0)
+
+
+def order_stop_indices_nearest_neighbour(
+    *,
+    stops: Sequence[int],
+    matrix: DistanceMatrix | SymmetricDistanceMatrix,
+) -> list[int]:
+    """
+    Same ordering as order_stops_nearest_neighbour, over matrix indices
+    (which must be distinct). Each step is a single argmin over the current
+    row's unvisited stops, vectorized when NumPy is installed.
+    """
+    if len(stops) < 2:
+        return list(stops)
+    if np is not None:
+        return _order_stop_indices_numpy(stops, matrix)
+
+    ordered: list[int] = [stops[0]]
+    # Unvisited stops in input order; visited ones are flagged off in alive
+    # and compacted away once they are half the list
+    remaining: list[int] = list(stops[1:])
+    alive = bytearray(b"\x01") * len(remaining)
+    position = {stop: p for p, stop in enumerate(remaining)}
+    live = len(remaining)
+
+    while live:
+        row = matrix.row_km(ordered[-1])
+        # min() keeps the first of equal keys => same tie breaker as the list scan
+        best = min(compress(remaining, alive), key=row.__getitem__)
+        alive[position[best]] = 0
+        live -= 1
+        ordered.append(best)
+        if 2 * live < len(remaining):
+            remaining = list(compress(remaining, alive))
+            alive = bytearray(b"\x01") * live
+            position = {stop: p for p, stop in enumerate(remaining)}
+
+    return ordered
+
+
+def _order_stop_indices_numpy(
+    stops: Sequence[int], matrix: DistanceMatrix | SymmetricDistanceMatrix
+) -> list[int]:
+    ordered: list[int] = [stops[0]]
+    # Unvisited stops in input order, so argmin's first minimum breaks ties
+    # like the list scan
+    remaining = np.asarray(stops[1:], dtype=np.intp)
+
+    while len(remaining):
+        row = np.asarray(matrix.row_km(ordered[-1]))
+        k = int(row[remaining].argmin())
+        ordered.append(int(remaining[k]))
+        remaining = np.delete(remaining, k)
+
+    return ordered
+
+
+def plan_route_naive_indexed(
+    *,
+    start: int,
+    stops: Sequence[int],
+    matrix: DistanceMatrix | SymmetricDistanceMatrix,
+) -> RoutePlan:
+    _validate_start_and_stop_indices(start=start, stops=stops, matrix=matrix)
+
+    ordered = order_stop_indices_nearest_neighbour(stops=stops, matrix=matrix)
+    return plan_route_indexed(stops=[start, *ordered], matrix=matrix)
+
+
+def plan_route_naive_round_trip_indexed(
+    *,
+    start: int,
+    stops: Sequence[int],
+    matrix: DistanceMatrix | SymmetricDistanceMatrix,
+) -> RoutePlan:
+    """Index-based plan_route_naive_round_trip."""
+    _validate_start_and_stop_indices(start=start, stops=stops, matrix=matrix)
+
+    if not stops:
+        return _start_only_plan(matrix.sources[start])
+
+    ordered = order_stop_indices_nearest_neighbour(stops=stops, matrix=matrix)
+    return plan_route_indexed(stops=[start, *ordered, start], matrix=matrix)
+
+
+# --- Async variants: each NN step fans out all lookups from the current stop ---
+
+async def order_stops_nearest_neighbour_async(
+    *,
+    stops: Sequence[Location],
+    distance_fn: AsyncDistanceFn,
+) -> list[Location]:
+    if len(stops) < 2:
+        return list(stops)
+
+    ordered: list[Location] = [stops[0]]
+    remaining: list[Location] = list(stops[1:])
+
+    while remaining:
+        current = ordered[-1]
+        results = await asyncio.gather(*(distance_fn(current, s) for s in remaining))
+
+        best_idx = 0
+        best_distance = results[0][0]
+        for idx in range(1, len(remaining)):
+            # Same tie breaker as the sync version: strictly smaller only
+            if results[idx][0] < best_distance:
+                best_distance = results[idx][0]
+                best_idx = idx
+
+        ordered.append(remaining.pop(best_idx))
+
+    return ordered
+
+
+async def plan_route_naive_async(
+    *,
+    start: Location,
+    stops: Sequence[Location],
+    distance_fn: AsyncDistanceFn,
+) -> RoutePlan:
+    _validate_start_and_stops(start=start, stops=stops)
+
+    ordered_stops = await order_stops_nearest_neighbour_async(
+        stops=stops,
+        distance_fn=distance_fn,
+    )
+    return await plan_route_async(
+        stops=[start, *ordered_stops],
+        distance_fn=distance_fn,
+    )
+
+
+async def plan_route_naive_round_trip_async(
+    *,
+    start: Location,
+    stops: Sequence[Location],
+    distance_fn: AsyncDistanceFn,
+) -> RoutePlan:
+    """Async plan_route_naive_round_trip."""
+    _validate_start_and_stops(start=start, stops=stops)
+
+    if not stops:
+        return _start_only_plan(start)
+
+    ordered = await order_stops_nearest_neighbour_async(stops=stops, distance_fn=distance_fn)
+    return await plan_route_async(stops=[start, *ordered, start], distance_fn=distance_fn)
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+
+from gotrippee.domain.models import Location
+from gotrippee.spatial import SpatialIndex
+
+DistanceFn = Callable[[Location, Location], tuple[float, float]]
+
+# Slack for float error between the index's chord maths and the provider
+_BOUND_TOLERANCE = 1e-9
+
+
+def order_stops_nearest_neighbour_spatial(
+    *,
+    stops: Sequence[Location],
+    distance_fn: DistanceFn,
+    lower_bound_scale: float = 1.0,
+) -> list[Location]:
+    """
+    Same result as order_stops_nearest_neighbour, with far fewer distance_fn calls.
+
+    Remaining stops are visited nearest-first through a SpatialIndex, and
+    distance_fn is only called while a candidate's great-circle distance
+    (times lower_bound_scale) can still beat the best road distance found.
+    This relies on distance_fn never returning less than great-circle km x
+    lower_bound_scale; lower the scale if the provider can undercut it
+    (pass 0 to disable pruning entirely).
+    """
+    if lower_bound_scale < 0:
+        raise ValueError(f"lower_bound_scale must be >= 0, got {lower_bound_scale}")
+    if len(stops) < 2:
+        return list(stops)
+
+    index = SpatialIndex([(s.latitude, s.longitude) for s in stops])
+    scale = lower_bound_scale * (1 - _BOUND_TOLERANCE)
+
+    ordered: list[Location] = [stops[0]]
+    index.remove(0)
+
+    while len(index):
+        current = ordered[-1]
+
+        best_idx = -1
+        best_distance = 0.0
+        for bound_km, idx in index.nearest(current.latitude, current.longitude):
+            if best_idx != -1 and bound_km * scale > best_distance:
+                break
+            d, _ = distance_fn(current, stops[idx])
+            # Tie breaker: earliest in input order, as in the full scan
+            if best_idx == -1 or d < best_distance or (d == best_distance and idx < best_idx):
+                best_distance = d
+                best_idx = idx
+
+        index.remove(best_idx)
+        ordered.append(stops[best_idx])
+
+    return ordered
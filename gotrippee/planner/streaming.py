@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+
+from gotrippee.distance.aio import AsyncDistanceFn
+from gotrippee.domain.models import Leg, Location, RoutePlan, _check_totals, _trusted_route_plan
+
+DistanceFn = Callable[[Location, Location], tuple[float, float]]
+
+
+@dataclass(frozen=True, slots=True)
+class LegUpdate:
+    """One resolved leg plus the running totals up to and including it."""
+
+    index: int
+    leg: Leg
+    total_distance_km: float
+    total_duration_minutes: float
+
+
+class _LegAccumulator:
+    """Collects legs in order with running totals and builds the final plan."""
+
+    def __init__(self, stops: Sequence[Location]) -> None:
+        if len(stops) < 2:
+            raise ValueError("stops must contain at least 2 locations")
+        self._stops = list(stops)
+        self._legs: list[Leg] = []
+        self._total_distance = 0.0
+        self._total_duration = 0.0
+
+    def _append(
+        self, start: Location, end: Location, distance_km: float, duration_minutes: float
+    ) -> LegUpdate:
+        leg = Leg(start=start, end=end, distance_km=distance_km, duration_minutes=duration_minutes)
+        self._legs.append(leg)
+        self._total_distance += distance_km
+        self._total_duration += duration_minutes
+        return LegUpdate(
+            index=len(self._legs) - 1,
+            leg=leg,
+            total_distance_km=self._total_distance,
+            total_duration_minutes=self._total_duration,
+        )
+
+    def _finish(self) -> RoutePlan:
+        # Each leg was validated as it was added and the totals summed alongside
+        _check_totals(self._total_distance, self._total_duration)
+        return _trusted_route_plan(
+            self._stops, self._legs, self._total_distance, self._total_duration
+        )
+
+
+class RouteStream(_LegAccumulator):
+    """
+    Resolves legs one at a time: iterate for LegUpdates as soon as each leg is
+    known, then call plan() for the validated RoutePlan (plan() also resolves
+    any legs not iterated yet).
+    """
+
+    def __init__(self, *, stops: Sequence[Location], distance_fn: DistanceFn) -> None:
+        super().__init__(stops)
+        self._distance_fn = distance_fn
+
+    def __iter__(self) -> RouteStream:
+        return self
+
+    def __next__(self) -> LegUpdate:
+        i = len(self._legs)
+        if i >= len(self._stops) - 1:
+            raise StopIteration
+        start, end = self._stops[i], self._stops[i + 1]
+        distance_km, duration_minutes = self._distance_fn(start, end)
+        return self._append(start, end, distance_km, duration_minutes)
+
+    def plan(self) -> RoutePlan:
+        for _ in self:
+            pass
+        return self._finish()
+
+
+class AsyncRouteStream(_LegAccumulator):
+    """
+    Async RouteStream. All lookups are started on first use and run
+    concurrently; updates are still yielded in stop order, each as soon as
+    it and every earlier leg have resolved.
+    """
+
+    def __init__(self, *, stops: Sequence[Location], distance_fn: AsyncDistanceFn) -> None:
+        super().__init__(stops)
+        self._distance_fn = distance_fn
+        self._tasks: list[asyncio.Task[tuple[float, float]]] | None = None
+
+    def __aiter__(self) -> AsyncRouteStream:
+        return self
+
+    async def __anext__(self) -> LegUpdate:
+        if self._tasks is None:
+            self._tasks = [
+                asyncio.ensure_future(self._distance_fn(a, b))
+                for a, b in zip(self._stops, self._stops[1:], strict=False)
+            ]
+        i = len(self._legs)
+        if i >= len(self._tasks):
+            raise StopAsyncIteration
+        try:
+            distance_km, duration_minutes = await self._tasks[i]
+        except BaseException:
+            for task in self._tasks[i + 1 :]:
+                task.cancel()
+            raise
+        return self._append(self._stops[i], self._stops[i + 1], distance_km, duration_minutes)
+
+    async def plan(self) -> RoutePlan:
+        async for _ in self:
+            pass
+        return self._finish()
+
+
+def stream_route(
+    *,
+    stops: Sequence[Location],
+    distance_fn: DistanceFn | None = None,
+) -> RouteStream:
+    """Streaming plan_route: yields each leg as soon as it is looked up."""
+
+    def default_distance_fn(start: Location, end: Location) -> tuple[float, float]:
+        return (0.0, 0.0)
+
+    return RouteStream(stops=stops, distance_fn=distance_fn or default_distance_fn)
+
+
+def stream_route_async(
+    *,
+    stops: Sequence[Location],
+    distance_fn: AsyncDistanceFn | None = None,
+) -> AsyncRouteStream:
+    """Streaming plan_route_async: `async for` over legs, then `await stream.plan()`."""
+
+    async def default_distance_fn(start: Location, end: Location) -> tuple[float, float]:
+        return (0.0, 0.0)
+
+    return AsyncRouteStream(stops=stops, distance_fn=distance_fn or default_distance_fn)
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import heapq
+import math
+from collections.abc import Iterator, Sequence
+
+from gotrippee.distance.haversine import EARTH_RADIUS_KM
+
+_LEAF_SIZE = 8
+
+
+def _unit_vector(lat: float, lon: float) -> tuple[float, float, float]:
+    phi = math.radians(lat)
+    lam = math.radians(lon)
+    cos_phi = math.cos(phi)
+    return (cos_phi * math.cos(lam), cos_phi * math.sin(lam), math.sin(phi))
+
+
+def _chord_to_km(chord: float) -> float:
+    return 2 * EARTH_RADIUS_KM * math.asin(min(chord / 2, 1.0))
+
+
+class SpatialIndex:
+    """
+    KD-tree over (lat, lon) points embedded on the unit sphere.
+
+    Points can be removed, and nearest() walks the remaining points in
+    increasing great-circle distance, best-first, so callers can stop as soon
+    as a distance bound rules out everything further away.
+    """
+
+    __slots__ = ("_xyz", "_perm", "_nodes", "_leaf_of", "_alive", "_removed")
+
+    def __init__(self, points: Sequence[tuple[float, float]]) -> None:
+        self._xyz = [_unit_vector(lat, lon) for lat, lon in points]
+        self._perm = list(range(len(points)))
+        # node: [start, end, left, right, parent, mins, maxs]
+        self._nodes: list[list] = []
+        self._leaf_of = [0] * len(points)
+        self._alive: list[int] = []
+        self._removed = [False] * len(points)
+        if points:
+            self._build(0, len(points), -1)
+
+    def _build(self, start: int, end: int, parent: int) -> int:
+        xyz = self._xyz
+        idx = self._perm[start:end]
+        mins = tuple(min(xyz[i][d] for i in idx) for d in range(3))
+        maxs = tuple(max(xyz[i][d] for i in idx) for d in range(3))
+
+        node_id = len(self._nodes)
+        self._nodes.append([start, end, -1, -1, parent, mins, maxs])
+        self._alive.append(end - start)
+
+        if end - start <= _LEAF_SIZE:
+            for i in idx:
+                self._leaf_of[i] = node_id
+            return node_id
+
+        axis = max(range(3), key=lambda d: maxs[d] - mins[d])
+        idx.sort(key=lambda i: xyz[i][axis])
+        self._perm[start:end] = idx
+        mid = (start + end) // 2
+        self._nodes[node_id][2] = self._build(start, mid, node_id)
+        self._nodes[node_id][3] = self._build(mid, end, node_id)
+        return node_id
+
+    def __len__(self) -> int:
+        return self._alive[0] if self._alive else 0
+
+    def remove(self, i: int) -> None:
+        if self._removed[i]:
+            return
+        self._removed[i] = True
+        node = self._leaf_of[i]
+        while node != -1:
+            self._alive[node] -= 1
+            node = self._nodes[node][4]
+
+    def nearest(self, lat: float, lon: float) -> Iterator[tuple[float, int]]:
+        """Yield (great-circle km, index) for remaining points, nearest first."""
+        if not len(self):
+            return
+        q = _unit_vector(lat, lon)
+        xyz, nodes, alive, removed, perm = (
+            self._xyz, self._nodes, self._alive, self._removed, self._perm
+        )
+
+        def box_dist2(node: list) -> float:
+            mins, maxs = node[5], node[6]
+            total = 0.0
+            for d in range(3):
+                if q[d] < mins[d]:
+                    total += (mins[d] - q[d]) ** 2
+                elif q[d] > maxs[d]:
+                    total += (q[d] - maxs[d]) ** 2
+            return total
+
+        # (squared chord lower bound, tie, is_point, id); points sort after
+        # nodes at equal distance so a point is only yielded once nothing
+        # unexplored can be closer
+        heap: list[tuple[float, int, int, int]] = [(0.0, 0, 0, 0)]
+        while heap:
+            d2, _, is_point, ident = heapq.heappop(heap)
+            if is_point:
+                if not removed[ident]:
+                    yield _chord_to_km(math.sqrt(d2)), ident
+                continue
+            if not alive[ident]:
+                continue
+            start, end, left, right = nodes[ident][:4]
+            if left == -1:
+                for i in perm[start:end]:
+                    if not removed[i]:
+                        p = xyz[i]
+                        dist2 = (p[0] - q[0]) ** 2 + (p[1] - q[1]) ** 2 + (p[2] - q[2]) ** 2
+                        heapq.heappush(heap, (dist2, i, 1, i))
+            else:
+                for child in (left, right):
+                    if alive[child]:
+                        heapq.heappush(heap, (box_dist2(nodes[child]), -1, 0, child))
@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+import pytest
+
+from benchmarks.osrm_stub import serve_osrm_stub
+
+
+@pytest.fixture
+def osrm_stub():
+    """Local OSRM stand-in serving /route/v1 and /table/v1 with Manhattan distances."""
+    with serve_osrm_stub() as server:
+        yield server
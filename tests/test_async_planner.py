@@ -0,0 +1,133 @@
+import asyncio
+import random
+import threading
+import time
+
+import pytest
+
+from gotrippee.distance.aio import async_distance_fn
+from gotrippee.domain.models import Location
+from gotrippee.planner import plan_route, plan_route_async
+from gotrippee.planner.naive import (
+    plan_route_naive,
+    plan_route_naive_async,
+    plan_route_naive_round_trip,
+    plan_route_naive_round_trip_async,
+)
+
+
+def _trip(n, seed=11):
+    rng = random.Random(seed)
+    locs = [
+        Location(name=f"L{i}", latitude=rng.uniform(0, 5), longitude=rng.uniform(0, 5))
+        for i in range(n)
+    ]
+
+    def distance_fn(a, b):
+        d = round(abs(a.latitude - b.latitude) + abs(a.longitude - b.longitude), 1)
+        return (d, d * 3)
+
+    return locs, distance_fn
+
+
+def test_async_planners_match_sync_planners():
+    locs, distance_fn = _trip(12)
+    afn = async_distance_fn(distance_fn, max_concurrency=4)
+    start, stops = locs[0], locs[1:]
+
+    async def run():
+        return (
+            await plan_route_async(stops=locs, distance_fn=afn),
+            await plan_route_naive_async(start=start, stops=stops, distance_fn=afn),
+            await plan_route_naive_round_trip_async(start=start, stops=stops, distance_fn=afn),
+        )
+
+    route, naive, round_trip = asyncio.run(run())
+
+    assert route == plan_route(stops=locs, distance_fn=distance_fn)
+    assert naive == plan_route_naive(start=start, stops=stops, distance_fn=distance_fn)
+    assert round_trip == plan_route_naive_round_trip(
+        start=start, stops=stops, distance_fn=distance_fn
+    )
+
+
+def test_plan_route_async_fans_out_with_bounded_concurrency():
+    locs, distance_fn = _trip(21)
+    state = {"in_flight": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def slow_distance_fn(a, b):
+        with lock:
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+        time.sleep(0.05)
+        with lock:
+            state["in_flight"] -= 1
+        return distance_fn(a, b)
+
+    afn = async_distance_fn(slow_distance_fn, max_concurrency=5)
+
+    t0 = time.perf_counter()
+    plan = asyncio.run(plan_route_async(stops=locs, distance_fn=afn))
+    elapsed = time.perf_counter() - t0
+
+    assert len(plan.legs) == 20
+    assert state["peak"] <= 5
+    # 20 legs x 50 ms serially would be 1 s; 4 waves of 5 is ~0.2 s
+    assert elapsed < 0.8
+
+
+def test_plan_route_naive_async_validates_like_sync():
+    locs, distance_fn = _trip(3)
+    afn = async_distance_fn(distance_fn)
+
+    with pytest.raises(ValueError, match="start must not appear"):
+        asyncio.run(plan_route_naive_async(start=locs[0], stops=locs, distance_fn=afn))
+
+
+def test_plan_route_naive_round_trip_async_with_no_stops_plans_just_start():
+    locs, distance_fn = _trip(1)
+
+    plan = asyncio.run(
+        plan_route_naive_round_trip_async(
+            start=locs[0], stops=[], distance_fn=async_distance_fn(distance_fn)
+        )
+    )
+
+    assert list(plan.stops) == [locs[0]]
+    assert list(plan.legs) == []
+    assert plan.total_distance_km == 0.0 and plan.total_duration_minutes == 0.0
+
+
+def test_async_osrm_distance_fn_against_stub(osrm_stub):
+    from gotrippee.distance.osrm import async_osrm_distance_fn
+
+    osrm_stub.latency_seconds = 0.05
+    locs = [Location(name=f"L{i}", latitude=0.0, longitude=i * 0.1) for i in range(9)]
+    afn = async_osrm_distance_fn(base_url=osrm_stub.base_url, max_concurrency=8)
+
+    t0 = time.perf_counter()
+    plan = asyncio.run(plan_route_async(stops=locs, distance_fn=afn))
+    elapsed = time.perf_counter() - t0
+
+    assert plan.total_distance_km == pytest.approx(0.8)
+    assert len(osrm_stub.requests) == 8
+    assert elapsed < 8 * 0.05
+
+
+def test_async_distance_fn_runs_max_concurrency_calls_at_once():
+    # More than the default executor's min(32, cpu_count + 4) threads
+    n = 40
+    barrier = threading.Barrier(n, timeout=5)
+
+    def distance_fn(a, b):
+        barrier.wait()
+        return (1.0, 2.0)
+
+    afn = async_distance_fn(distance_fn, max_concurrency=n)
+    loc = Location(name="A", latitude=0.0, longitude=0.0)
+
+    async def _run():
+        return await asyncio.gather(*(afn(loc, loc) for _ in range(n)))
+
+    assert asyncio.run(_run()) == [(1.0, 2.0)] * n
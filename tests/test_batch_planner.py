@@ -0,0 +1,94 @@
+import random
+
+import pytest
+
+from benchmarks.synthetic import synthetic_stops
+from gotrippee.distance.haversine import haversine_distance_fn, haversine_matrix_fn
+from gotrippee.planner.batch import TripJob, plan_routes_batch
+from gotrippee.planner.naive import plan_route_naive, plan_route_naive_round_trip
+
+
+def _jobs(n_jobs, seed=6):
+    rng = random.Random(seed)
+    pool = synthetic_stops(30, seed=seed)
+    jobs = []
+    for _ in range(n_jobs):
+        picked = rng.sample(pool, 6)
+        jobs.append(TripJob(start=picked[0], stops=picked[1:]))
+    return pool, jobs
+
+
+def test_batch_with_matrix_fn_fetches_one_block_per_job():
+    pool, jobs = _jobs(20)
+    calls = []
+    matrix_fn = haversine_matrix_fn()
+
+    def counting_matrix_fn(sources, targets=None):
+        calls.append(len(sources))
+        return matrix_fn(sources, targets)
+
+    plans = list(plan_routes_batch(jobs, matrix_fn=counting_matrix_fn))
+
+    # Each job reads only its own 6 x 6 block, not a matrix over all 30 locations
+    assert calls == [6] * len(jobs)
+    distance_fn = haversine_distance_fn()
+    for job, plan in zip(jobs, plans, strict=True):
+        expected = plan_route_naive_round_trip(
+            start=job.start, stops=job.stops, distance_fn=distance_fn
+        )
+        assert plan.stops == expected.stops
+        assert plan.total_distance_km == pytest.approx(expected.total_distance_km)
+
+
+def test_batch_with_distance_fn_shares_one_cache_and_keeps_order():
+    pool, jobs = _jobs(15, seed=2)
+    base = haversine_distance_fn()
+    seen = []
+
+    def counting_distance_fn(a, b):
+        seen.append((a, b))
+        return base(a, b)
+
+    plans = list(
+        plan_routes_batch(jobs, distance_fn=counting_distance_fn, round_trip=False, max_workers=4)
+    )
+
+    assert [p.stops[0] for p in plans] == [job.start for job in jobs]
+    assert len(seen) == len(set(seen))
+    for job, plan in zip(jobs, plans, strict=True):
+        assert plan == plan_route_naive(start=job.start, stops=job.stops, distance_fn=base)
+
+
+def test_batch_validates_every_job_up_front():
+    pool, jobs = _jobs(3)
+    bad = TripJob(start=pool[0], stops=[pool[0], pool[1]])
+
+    with pytest.raises(ValueError, match="job 1: start must not appear"):
+        plan_routes_batch([jobs[0], bad, jobs[2]], matrix_fn=haversine_matrix_fn())
+
+
+@pytest.mark.parametrize("round_trip", [True, False])
+def test_batch_with_matrix_fn_rejects_job_without_stops(round_trip):
+    pool, jobs = _jobs(3)
+    empty = TripJob(start=pool[0], stops=[])
+
+    with pytest.raises(ValueError, match="job 2: stops must not be empty"):
+        plan_routes_batch(
+            [*jobs[:2], empty], matrix_fn=haversine_matrix_fn(), round_trip=round_trip
+        )
+
+
+@pytest.mark.parametrize("round_trip", [True, False])
+def test_batch_with_distance_fn_rejects_job_without_stops(round_trip):
+    pool, jobs = _jobs(3)
+    empty = TripJob(start=pool[0], stops=[])
+
+    with pytest.raises(ValueError, match="job 2: stops must not be empty"):
+        plan_routes_batch(
+            [*jobs[:2], empty], distance_fn=haversine_distance_fn(), round_trip=round_trip
+        )
+
+
+def test_batch_requires_exactly_one_distance_source():
+    with pytest.raises(ValueError, match="exactly one"):
+        plan_routes_batch([])
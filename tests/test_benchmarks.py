@@ -0,0 +1,52 @@
+import json
+
+from benchmarks.run import find_regressions, main, run_benchmarks
+from benchmarks.synthetic import synthetic_stops
+
+
+def test_synthetic_stops_are_seeded():
+    a = synthetic_stops(50, seed=3, clustered=True)
+    b = synthetic_stops(50, seed=3, clustered=True)
+    assert list(a) == list(b)
+    assert list(a) != list(synthetic_stops(50, seed=4, clustered=True))
+    assert len(synthetic_stops(0)) == 0
+
+
+def test_run_benchmarks_reports_time_calls_and_memory():
+    report = run_benchmarks(
+        scenarios=["nn_order", "osrm_matrix", "exact_round_trip"], sizes=[10, 20], repeat=1
+    )
+
+    results = {(r["scenario"], r["n"]): r for r in report["results"]}
+    # exact_round_trip stops at its max_n
+    assert set(results) == {
+        ("nn_order", 10),
+        ("nn_order", 20),
+        ("osrm_matrix", 10),
+        ("osrm_matrix", 20),
+        ("exact_round_trip", 10),
+    }
+    assert results[("nn_order", 10)]["calls"] == 45
+    assert results[("osrm_matrix", 20)]["calls"] == 1
+    assert all(r["seconds"] >= 0 and r["peak_bytes"] > 0 for r in results.values())
+    json.dumps(report)
+
+
+def test_find_regressions_flags_slowdowns_and_extra_calls():
+    baseline = {"results": [{"scenario": "s", "n": 10, "seconds": 1.0, "calls": 5}]}
+    same = {"results": [{"scenario": "s", "n": 10, "seconds": 1.1, "calls": 5}]}
+    worse = {"results": [{"scenario": "s", "n": 10, "seconds": 2.0, "calls": 6}]}
+
+    assert find_regressions(same, baseline) == []
+    assert len(find_regressions(worse, baseline)) == 2
+
+
+def test_main_compares_against_a_baseline(tmp_path):
+    out = tmp_path / "results.json"
+    args = ["--scenario", "plan_route", "--sizes", "10", "--repeat", "1", "--no-memory"]
+    assert main([*args, "--output", str(out)]) == 0
+
+    baseline = json.loads(out.read_text())
+    baseline["results"][0]["calls"] -= 1
+    out.write_text(json.dumps(baseline))
+    assert main([*args, "--output", str(tmp_path / "new.json"), "--baseline", str(out)]) == 1
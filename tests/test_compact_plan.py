@@ -0,0 +1,81 @@
+import math
+import random
+
+import pytest
+
+from gotrippee.distance.matrix import DistanceMatrix
+from gotrippee.domain.compact import CompactRoutePlan
+from gotrippee.domain.models import Leg, Location
+from gotrippee.planner import plan_route, plan_route_compact, plan_route_indexed
+
+
+def _random_trip(n, seed=3):
+    rng = random.Random(seed)
+    locs = [
+        Location(name=f"L{i}", latitude=rng.uniform(-10, 10), longitude=rng.uniform(-10, 10))
+        for i in range(n)
+    ]
+
+    def distance_fn(a, b):
+        d = abs(a.latitude - b.latitude) + abs(a.longitude - b.longitude)
+        return (d, d * 2)
+
+    return locs, distance_fn
+
+
+def test_compact_plan_matches_indexed_plan():
+    locs, distance_fn = _random_trip(12)
+    matrix = DistanceMatrix.from_distance_fn(locs, distance_fn=distance_fn)
+    order = [0, 5, 3, 11, 1, 0]
+
+    compact = plan_route_compact(stops=order, matrix=matrix)
+    plan = plan_route_indexed(stops=order, matrix=matrix)
+
+    assert compact == plan
+    assert plan == compact
+    assert compact.locations is matrix.sources
+    assert compact.stops == plan.stops
+    assert compact.legs == plan.legs
+    assert compact.total_distance_km == plan.total_distance_km
+    assert compact.total_duration_minutes == plan.total_duration_minutes
+
+
+def test_legs_are_built_on_access():
+    locs, distance_fn = _random_trip(5)
+    compact = CompactRoutePlan.from_plan(plan_route(stops=locs, distance_fn=distance_fn))
+
+    leg = compact.legs[-1]
+    assert isinstance(leg, Leg)
+    assert (leg.start, leg.end) == (locs[3], locs[4])
+    assert compact.legs[1:3] == [compact.legs[1], compact.legs[2]]
+    assert compact.stops[0] == locs[0]
+    assert len(compact.legs) == 4 and len(compact.stops) == 5
+    with pytest.raises(IndexError):
+        compact.legs[4]
+
+
+def test_round_trip_round_trips_through_from_plan():
+    locs, distance_fn = _random_trip(6)
+    plan = plan_route(stops=[*locs, locs[0]], distance_fn=distance_fn)
+
+    compact = CompactRoutePlan.from_plan(plan)
+
+    assert len(compact.locations) == 6
+    assert list(compact.stop_indices) == [0, 1, 2, 3, 4, 5, 0]
+    assert compact.to_plan() == plan
+
+
+def test_compact_plan_validation():
+    locs, _ = _random_trip(3)
+    with pytest.raises(ValueError):
+        CompactRoutePlan(locations=locs, stop_indices=[0, 1, 2], km=[1.0], minutes=[1.0])
+    with pytest.raises(ValueError):
+        CompactRoutePlan(locations=locs, stop_indices=[0, 3], km=[1.0], minutes=[1.0])
+    with pytest.raises(ValueError):
+        CompactRoutePlan(locations=locs, stop_indices=[0, 1], km=[-1.0], minutes=[1.0])
+    with pytest.raises(ValueError):
+        CompactRoutePlan(locations=locs, stop_indices=[0, 1], km=[1.0], minutes=[-1.0])
+    with pytest.raises(ValueError, match="NaN"):
+        CompactRoutePlan(locations=locs, stop_indices=[0, 1], km=[math.nan], minutes=[1.0])
+    with pytest.raises(ValueError, match="NaN"):
+        CompactRoutePlan(locations=locs, stop_indices=[0, 1], km=[1.0], minutes=[math.nan])
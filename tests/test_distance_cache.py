@@ -1,7 +1,15 @@
-def test_cached_distance_fn_caches_repeated_calls_for_the_same_pair():
-    from gotrippee.domain.models import Location
-    from gotrippee.distance.cache import cached_distance_fn
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from gotrippee.distance.cache import cached_distance_fn, quantization_error_km
+from gotrippee.distance.haversine import haversine_distance_fn
+from gotrippee.distance.osrm import osrm_distance_fn
+from gotrippee.domain.models import Location
+
 
+def test_cached_distance_fn_caches_repeated_calls_for_the_same_pair():
     calls = {"n": 0}
 
     def base_distance_fn(a, b):
@@ -19,9 +27,6 @@ def test_cached_distance_fn_caches_repeated_calls_for_the_same_pair():
 
 
 def test_cached_distance_fn_treats_reverese_pair_as_same_key():
-    from gotrippee.domain.models import Location
-    from gotrippee.distance.cache import cached_distance_fn
-
     calls = {"n": 0}
 
     def base_distance_fn(a, b):
@@ -39,9 +44,6 @@ def test_cached_distance_fn_treats_reverese_pair_as_same_key():
 
 
 def test_cached_distance_fn_does_not_mix_different_pairs():
-    from gotrippee.domain.models import Location
-    from gotrippee.distance.cache import cached_distance_fn
-
     calls = {"n": 0}
 
     def base_distance_fn(a, b):
@@ -57,4 +59,244 @@ def test_cached_distance_fn_does_not_mix_different_pairs():
 
     assert cached(a, b)[0] == 1.0
     assert cached(a, c)[0] == 2.0
-    assert calls["n"] == 2
\ No newline at end of file
+    assert calls["n"] == 2
+
+def test_cached_distance_fn_evicts_least_recently_used_entry():
+    calls = []
+
+    def base_distance_fn(a, b):
+        calls.append((a.name, b.name))
+        return (1.0, 1.0)
+
+    a = Location(name="A", latitude=0.0, longitude=0.0)
+    b = Location(name="B", latitude=1.0, longitude=1.0)
+    c = Location(name="C", latitude=2.0, longitude=2.0)
+
+    cached = cached_distance_fn(base_distance_fn, max_entries=2)
+
+    cached(a, b)
+    cached(a, c)
+    cached(a, b)  # refresh (a, b) => (a, c) is now least recently used
+    cached(b, c)  # evicts (a, c)
+    cached(a, b)
+    cached(a, c)
+
+    assert calls == [("A", "B"), ("A", "C"), ("B", "C"), ("A", "C")]
+    info = cached.cache_info()
+    assert info.size == 2
+    assert info.evictions == 2
+    assert (info.hits, info.misses) == (2, 4)
+
+
+def test_cached_distance_fn_expires_entries_after_ttl():
+    now = {"t": 0.0}
+    calls = {"n": 0}
+
+    def base_distance_fn(a, b):
+        calls["n"] += 1
+        return (float(calls["n"]), 0.0)
+
+    a = Location(name="A", latitude=0.0, longitude=0.0)
+    b = Location(name="B", latitude=1.0, longitude=1.0)
+
+    cached = cached_distance_fn(base_distance_fn, ttl_seconds=60, clock=lambda: now["t"])
+
+    assert cached(a, b)[0] == 1.0
+    now["t"] = 59.0
+    assert cached(a, b)[0] == 1.0
+    now["t"] = 60.0
+    assert cached(a, b)[0] == 2.0
+    assert cached.cache_info().expirations == 1
+
+
+def test_cache_info_reports_size_bytes_and_hit_ratio():
+    a = Location(name="A", latitude=0.0, longitude=0.0)
+    b = Location(name="B", latitude=1.0, longitude=1.0)
+
+    cached = cached_distance_fn(lambda x, y: (1.0, 2.0))
+    assert cached.cache_info().approx_bytes == 0
+
+    cached(a, b)
+    cached(a, b)
+    info = cached.cache_info()
+
+    assert info.size == 1
+    assert info.approx_bytes > 0
+    assert info.hit_ratio == 0.5
+
+    cached.cache_clear()
+    assert cached.cache_info().size == 0
+    assert cached.cache_info().hits == 0
+
+
+def test_cached_distance_fn_is_directional_by_default():
+    a = Location(name="A", latitude=0.0, longitude=0.0)
+    b = Location(name="B", latitude=1.0, longitude=1.0)
+
+    # One-way streets: a -> b is shorter than b -> a
+    def base_distance_fn(x, y):
+        return (1.0, 1.0) if x == a else (3.0, 3.0)
+
+    cached = cached_distance_fn(base_distance_fn)
+
+    assert cached(a, b) == (1.0, 1.0)
+    assert cached(b, a) == (3.0, 3.0)
+    assert cached.cache_info().misses == 2
+
+
+def test_cached_distance_fn_symmetric_sharing_is_opt_in():
+    a = Location(name="A", latitude=0.0, longitude=0.0)
+    b = Location(name="B", latitude=1.0, longitude=1.0)
+
+    cached = cached_distance_fn(lambda x, y: (1.0, 1.0), symmetric=True)
+    cached(a, b)
+    cached(b, a)
+    assert cached.cache_info().hits == 1
+
+    # Providers that declare themselves symmetric share entries automatically
+    cached = cached_distance_fn(haversine_distance_fn())
+    cached(a, b)
+    cached(b, a)
+    assert cached.cache_info().hits == 1
+
+
+def test_cached_distance_fn_namespaces_entries_per_provider():
+    assert osrm_distance_fn(profile="driving").cache_namespace != osrm_distance_fn(
+        profile="walking"
+    ).cache_namespace
+
+    a = Location(name="A", latitude=0.0, longitude=0.0)
+    b = Location(name="B", latitude=1.0, longitude=1.0)
+
+    driving = cached_distance_fn(lambda x, y: (1.0, 1.0), namespace="osrm:driving")
+    driving(a, b)
+    walking = cached_distance_fn(lambda x, y: (1.0, 12.0), namespace="osrm:walking")
+    walking(a, b)
+
+    assert driving.cache_info().misses == 1
+    assert walking.cache_info().misses == 1
+
+
+def test_cached_distance_fn_reverse_estimates():
+    calls = {"n": 0}
+
+    def base_distance_fn(x, y):
+        calls["n"] += 1
+        return (5.0, 6.0)
+
+    a = Location(name="A", latitude=0.0, longitude=0.0)
+    b = Location(name="B", latitude=1.0, longitude=1.0)
+
+    cached = cached_distance_fn(base_distance_fn, reverse_estimates=True)
+
+    assert cached(a, b) == (5.0, 6.0)
+    assert cached(b, a) == (5.0, 6.0)
+    assert calls["n"] == 1
+    assert cached.cache_info().estimates == 1
+
+
+def test_cached_distance_fn_coalesces_concurrent_misses():
+    calls = {"n": 0}
+    release = threading.Event()
+
+    def slow_distance_fn(a, b):
+        calls["n"] += 1
+        release.wait(timeout=5)
+        return (2.0, 3.0)
+
+    a = Location(name="A", latitude=0.0, longitude=0.0)
+    b = Location(name="B", latitude=1.0, longitude=1.0)
+    cached = cached_distance_fn(slow_distance_fn)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(cached, a, b) for _ in range(8)]
+        # Let every thread reach the cache before the provider answers
+        while cached.cache_info().coalesced < 7:
+            threading.Event().wait(0.001)
+        release.set()
+        results = [f.result() for f in futures]
+
+    assert results == [(2.0, 3.0)] * 8
+    assert calls["n"] == 1
+    info = cached.cache_info()
+    assert (info.misses, info.coalesced) == (1, 7)
+
+
+def test_cached_distance_fn_propagates_errors_to_waiters_and_retries_later():
+    calls = {"n": 0}
+
+    def flaky_distance_fn(a, b):
+        calls["n"] += 1
+        if calls["n"] == 1:
+            raise ConnectionError("boom")
+        return (1.0, 1.0)
+
+    a = Location(name="A", latitude=0.0, longitude=0.0)
+    b = Location(name="B", latitude=1.0, longitude=1.0)
+    cached = cached_distance_fn(flaky_distance_fn)
+
+    with pytest.raises(ConnectionError):
+        cached(a, b)
+    assert cached(a, b) == (1.0, 1.0)
+    assert cached.cache_info().size == 1
+
+
+def test_cached_distance_fn_quantized_keys_share_entries_within_error_bound():
+    haversine = haversine_distance_fn()
+    calls = []
+
+    def provider(a, b):
+        calls.append((a, b))
+        return haversine(a, b)
+
+    a = Location(name="A", latitude=51.5, longitude=-0.12)
+    b = Location(name="B", latitude=51.6, longitude=-0.2)
+    a2 = Location(name="A2", latitude=51.5 + 3e-6, longitude=-0.12 - 2e-6)
+    b2 = Location(name="B2", latitude=51.6 - 4e-6, longitude=-0.2 + 1e-6)
+
+    exact = cached_distance_fn(provider)
+    exact(a, b)
+    exact(a2, b2)
+    assert len(calls) == 2
+    assert exact.cache_info().max_error_km == 0.0
+
+    calls.clear()
+    quantized = cached_distance_fn(provider, precision=5)
+    quantized(a, b)
+    km, _ = quantized(a2, b2)
+    assert len(calls) == 1
+    assert quantized.cache_info().hits == 1
+    assert quantized.cache_info().max_error_km == quantization_error_km(5)
+    assert abs(km - haversine(a2, b2)[0]) <= quantization_error_km(5)
+
+
+def test_quantization_error_km():
+    assert quantization_error_km(5) == pytest.approx(0.00314, rel=0.01)
+    assert quantization_error_km(3) == pytest.approx(100 * quantization_error_km(5))
+    with pytest.raises(ValueError):
+        quantization_error_km(-1)
+    with pytest.raises(ValueError):
+        cached_distance_fn(lambda a, b: (0.0, 0.0), precision=-1)
+
+
+def test_quantization_error_bound_holds_at_opposite_cell_corners():
+    haversine = haversine_distance_fn()
+    cached = cached_distance_fn(haversine, precision=5)
+    h = 0.49999e-5  # just inside half a cell
+
+    # Same two cells, first queried from their inner corners, then the outer ones
+    inner = (
+        Location(name="A1", latitude=h, longitude=h),
+        Location(name="B1", latitude=0.01 - h, longitude=0.01 - h),
+    )
+    outer = (
+        Location(name="A2", latitude=-h, longitude=-h),
+        Location(name="B2", latitude=0.01 + h, longitude=0.01 + h),
+    )
+    cached(*inner)
+    km, _ = cached(*outer)
+
+    assert cached.cache_info().hits == 1
+    error = haversine(*outer)[0] - km
+    assert error > quantization_error_km(5) / 2 * 0.99
+    assert error <= quantization_error_km(5)
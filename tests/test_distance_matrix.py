@@ -0,0 +1,103 @@
+import pytest
+
+from gotrippee.distance.matrix import DistanceMatrix
+from gotrippee.domain.models import Location
+
+
+def _locations(n):
+    return [Location(name=f"L{i}", latitude=float(i), longitude=float(i)) for i in range(n)]
+
+
+def test_from_distance_fn_fills_row_major_arrays():
+    locs = _locations(3)
+
+    def distance_fn(a, b):
+        return (a.latitude * 10 + b.latitude, 1.0)
+
+    matrix = DistanceMatrix.from_distance_fn(locs, distance_fn=distance_fn)
+
+    assert matrix.is_square
+    assert list(matrix.km) == [0.0, 1.0, 2.0, 10.0, 11.0, 12.0, 20.0, 21.0, 22.0]
+    assert matrix.get(2, 1) == (21.0, 1.0)
+    assert list(matrix.row_km(1)) == [10.0, 11.0, 12.0]
+
+
+def test_distance_matrix_coerces_lists_to_contiguous_arrays():
+    from array import array
+
+    locs = _locations(2)
+    matrix = DistanceMatrix(sources=locs, targets=locs, km=[0, 1, 2, 0], minutes=[0, 3, 4, 0])
+
+    assert isinstance(matrix.km, array)
+    assert matrix.duration_minutes(1, 0) == 4.0
+
+
+def test_distance_matrix_rejects_wrong_size():
+    locs = _locations(2)
+
+    with pytest.raises(ValueError, match="km must have 4 entries"):
+        DistanceMatrix(sources=locs, targets=locs, km=[0.0], minutes=[0.0] * 4)
+
+
+def _symmetric_fn(a, b):
+    km = abs(a.latitude - b.latitude) * 10 + a.latitude + b.latitude
+    return (km, 1.0 + a.latitude * b.latitude)
+
+
+def test_symmetric_matrix_packs_the_upper_triangle():
+    from gotrippee.distance.matrix import SymmetricDistanceMatrix
+
+    locs = _locations(4)
+    calls = []
+
+    def distance_fn(a, b):
+        calls.append((a.name, b.name))
+        return _symmetric_fn(a, b)
+
+    packed = SymmetricDistanceMatrix.from_distance_fn(locs, distance_fn=distance_fn)
+    dense = DistanceMatrix.from_distance_fn(locs, distance_fn=_symmetric_fn)
+
+    assert len(calls) == 6
+    assert len(packed.km) == 6
+    assert packed.is_square and packed.n_rows == packed.n_cols == 4
+    for i in range(4):
+        expected = [0.0 if i == j else dense.distance_km(i, j) for j in range(4)]
+        assert list(packed.row_km(i)) == expected
+        for j in range(4):
+            if i != j:
+                assert packed.get(i, j) == dense.get(i, j)
+    assert packed.get(2, 2) == (0.0, 0.0)
+    assert packed.leg_values([0, 3, 1, 1]) == ([33.0, 24.0, 0.0], [1.0, 4.0, 0.0])
+
+
+def test_symmetric_matrix_reduced_precision():
+    from gotrippee.distance.matrix import SymmetricDistanceMatrix
+
+    locs = [Location(name=f"L{i}", latitude=i * 0.37, longitude=0.0) for i in range(5)]
+    dense = DistanceMatrix.from_distance_fn(locs, distance_fn=_symmetric_fn)
+
+    for dtype, itemsize, rel in (("float32", 4, 1e-6), ("float16", 2, 1e-3)):
+        packed = SymmetricDistanceMatrix.from_matrix(dense, dtype=dtype)
+        assert packed.km.itemsize == itemsize
+        for i in range(5):
+            for j in range(5):
+                assert packed.distance_km(i, j) == pytest.approx(
+                    0.0 if i == j else dense.distance_km(i, j), rel=rel
+                )
+            assert list(packed.row_minutes(i)) == pytest.approx(
+                [0.0 if i == j else dense.duration_minutes(i, j) for j in range(5)], rel=rel
+            )
+
+    with pytest.raises(ValueError, match="dtype must be one of"):
+        SymmetricDistanceMatrix.from_matrix(dense, dtype="int8")
+
+
+def test_symmetric_matrix_validates_sizes():
+    from gotrippee.distance.matrix import SymmetricDistanceMatrix
+
+    with pytest.raises(ValueError, match="km must have 3 entries"):
+        SymmetricDistanceMatrix(locations=_locations(3), km=[1.0], minutes=[1.0] * 3)
+    with pytest.raises(ValueError, match="must be square"):
+        SymmetricDistanceMatrix.from_matrix(
+            DistanceMatrix(sources=_locations(2), targets=_locations(1), km=[0, 1], minutes=[0, 1])
+        )
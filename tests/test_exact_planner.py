@@ -0,0 +1,110 @@
+import itertools
+import random
+from unittest.mock import Mock
+
+import pytest
+
+from gotrippee.distance.matrix import DistanceMatrix
+from gotrippee.domain.models import Location
+from gotrippee.planner import exact
+from gotrippee.planner.exact import (
+    held_karp_memory_bytes,
+    held_karp_order,
+    plan_route_exact,
+    plan_route_exact_round_trip,
+)
+
+
+def _asymmetric_matrix(n, seed, *, ties=False):
+    rng = random.Random(seed)
+    locs = [Location(name=f"L{i}", latitude=0.0, longitude=float(i)) for i in range(n)]
+    draw = (lambda: float(rng.randint(1, 3))) if ties else (lambda: rng.uniform(1, 50))
+    km = [0.0 if i == j else draw() for i in range(n) for j in range(n)]
+    minutes = [d * 2 for d in km]
+    return DistanceMatrix(sources=locs, targets=locs, km=km, minutes=minutes)
+
+
+def _cost(matrix, route):
+    return sum(matrix.distance_km(a, b) for a, b in zip(route, route[1:], strict=False))
+
+
+@pytest.fixture(params=["numpy", "pure"])
+def dp_path(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(exact, "np", None)
+    return request.param
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_exact_planners_match_brute_force(seed, dp_path):
+    matrix = _asymmetric_matrix(8, seed)
+    stops = [3, 1, 7, 2, 6, 4, 5]
+
+    best_open = min(_cost(matrix, [0, *p]) for p in itertools.permutations(stops))
+    best_round = min(_cost(matrix, [0, *p, 0]) for p in itertools.permutations(stops))
+
+    open_plan = plan_route_exact(start=0, stops=stops, matrix=matrix)
+    round_plan = plan_route_exact_round_trip(start=0, stops=stops, matrix=matrix)
+
+    assert open_plan.total_distance_km == pytest.approx(best_open)
+    assert round_plan.total_distance_km == pytest.approx(best_round)
+    assert round_plan.stops[0] == round_plan.stops[-1] == matrix.sources[0]
+    assert len(open_plan.legs) == 7
+
+
+@pytest.mark.parametrize("round_trip", [False, True])
+def test_held_karp_paths_break_ties_the_same_way(monkeypatch, round_trip):
+    pytest.importorskip("numpy")
+    matrix = _asymmetric_matrix(10, 5, ties=True)
+    stops = [4, 9, 1, 7, 3, 8, 2, 6, 5]
+
+    vectorized = held_karp_order(start=0, stops=stops, matrix=matrix, round_trip=round_trip)
+    monkeypatch.setattr(exact, "np", None)
+    looped = held_karp_order(start=0, stops=stops, matrix=matrix, round_trip=round_trip)
+
+    assert vectorized == looped
+
+
+def test_exact_planner_falls_back_above_size_limit():
+    matrix = _asymmetric_matrix(6, 0)
+    fallback = Mock(return_value="heuristic plan")
+
+    result = plan_route_exact(
+        start=0, stops=[1, 2, 3, 4, 5], matrix=matrix, max_exact_stops=4, fallback=fallback
+    )
+
+    assert result == "heuristic plan"
+    fallback.assert_called_once_with(start=0, stops=[1, 2, 3, 4, 5], matrix=matrix)
+
+
+def test_exact_planner_falls_back_above_memory_limit():
+    matrix = _asymmetric_matrix(6, 0)
+    fallback = Mock(return_value="heuristic plan")
+
+    assert held_karp_memory_bytes(5) == 32 * 5 * 9
+    result = plan_route_exact_round_trip(
+        start=0, stops=[1, 2, 3, 4, 5], matrix=matrix, memory_limit_bytes=1000, fallback=fallback
+    )
+
+    assert result == "heuristic plan"
+
+
+def test_exact_planner_default_fallback_returns_valid_plan():
+    matrix = _asymmetric_matrix(8, 1)
+
+    plan = plan_route_exact_round_trip(
+        start=0, stops=list(range(1, 8)), matrix=matrix, max_exact_stops=3
+    )
+
+    assert len(plan.stops) == 9
+    assert {s.name for s in plan.stops} == {f"L{i}" for i in range(8)}
+
+
+def test_exact_planner_single_stop():
+    matrix = _asymmetric_matrix(2, 0)
+
+    plan = plan_route_exact(start=0, stops=[1], matrix=matrix)
+
+    assert [s.name for s in plan.stops] == ["L0", "L1"]
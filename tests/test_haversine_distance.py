@@ -0,0 +1,80 @@
+import pytest
+
+from gotrippee.distance import haversine
+from gotrippee.distance.haversine import (
+    great_circle_km,
+    haversine_distance_fn,
+    haversine_matrix_fn,
+)
+from gotrippee.domain.models import Location
+
+LONDON = Location(name="London", latitude=51.5074, longitude=-0.1278)
+PARIS = Location(name="Paris", latitude=48.8566, longitude=2.3522)
+BERLIN = Location(name="Berlin", latitude=52.52, longitude=13.405)
+
+
+def test_great_circle_km_london_paris():
+    km = great_circle_km(LONDON.latitude, LONDON.longitude, PARIS.latitude, PARIS.longitude)
+
+    assert km == pytest.approx(343.6, abs=0.5)
+
+
+def test_haversine_distance_fn_estimates_duration_from_speed():
+    distance_fn = haversine_distance_fn(speed_kmh=60.0, detour_factor=1.2)
+
+    km, mins = distance_fn(LONDON, PARIS)
+
+    assert km == pytest.approx(343.6 * 1.2, abs=1.0)
+    assert mins == pytest.approx(km)  # 60 km/h => 1 minute per km
+
+
+def test_haversine_distance_fn_rejects_unknown_profile():
+    with pytest.raises(ValueError, match="unknown profile"):
+        haversine_distance_fn(profile="hovercraft")
+
+
+def test_haversine_matrix_fn_matches_pairwise_distances():
+    locs = [LONDON, PARIS, BERLIN]
+    distance_fn = haversine_distance_fn(profile="cycling")
+
+    matrix = haversine_matrix_fn(profile="cycling")(locs)
+
+    for i, a in enumerate(locs):
+        for j, b in enumerate(locs):
+            km, mins = distance_fn(a, b)
+            assert matrix.distance_km(i, j) == pytest.approx(km)
+            assert matrix.duration_minutes(i, j) == pytest.approx(mins)
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_haversine_matrix_fn_paths_match_pairwise_distances(monkeypatch, use_numpy):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(haversine, "np", None)
+    locs = [
+        Location(name=f"s{i}", latitude=-80.0 + 13.7 * i, longitude=-170.0 + 29.3 * i)
+        for i in range(12)
+    ]
+    distance_fn = haversine_distance_fn(profile="walking", detour_factor=1.3)
+    matrix_fn = haversine_matrix_fn(profile="walking", detour_factor=1.3)
+
+    square = matrix_fn(locs)
+    rectangular = matrix_fn(locs[:5], locs[3:])
+
+    for i, a in enumerate(locs):
+        for j, b in enumerate(locs):
+            km, mins = distance_fn(a, b)
+            assert square.distance_km(i, j) == pytest.approx(km)
+            assert square.duration_minutes(i, j) == pytest.approx(mins)
+            assert square.distance_km(i, j) == square.distance_km(j, i)
+            if i < 5 and j >= 3:
+                assert rectangular.distance_km(i, j - 3) == pytest.approx(km)
+                assert rectangular.duration_minutes(i, j - 3) == pytest.approx(mins)
+
+
+def test_haversine_matrix_fn_rectangular():
+    matrix = haversine_matrix_fn()([LONDON], [PARIS, BERLIN])
+
+    assert matrix.n_rows == 1 and matrix.n_cols == 2
+    assert matrix.distance_km(0, 1) > matrix.distance_km(0, 0)
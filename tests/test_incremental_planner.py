@@ -0,0 +1,112 @@
+
+import pytest
+
+from benchmarks.synthetic import synthetic_stops
+from gotrippee.distance.haversine import haversine_distance_fn
+from gotrippee.domain.models import Location
+from gotrippee.planner import plan_route
+from gotrippee.planner.incremental import insert_stop, remove_stop
+from gotrippee.planner.naive import plan_route_naive, plan_route_naive_round_trip
+
+
+def _counting(distance_fn):
+    calls = []
+
+    def wrapped(a, b):
+        calls.append((a, b))
+        return distance_fn(a, b)
+
+    return wrapped, calls
+
+
+def _assert_consistent(plan, distance_fn):
+    # Legs chain the stops and totals match a from-scratch plan of the same order
+    fresh = plan_route(stops=plan.stops, distance_fn=distance_fn)
+    assert plan.total_distance_km == pytest.approx(fresh.total_distance_km)
+    assert plan.total_duration_minutes == pytest.approx(fresh.total_duration_minutes)
+    for leg, a, b in zip(plan.legs, plan.stops, plan.stops[1:], strict=False):
+        assert (leg.start, leg.end) == (a, b)
+
+
+def test_insert_stop_only_queries_distances_to_the_new_stop():
+    locs = synthetic_stops(12, seed=3)
+    base = haversine_distance_fn()
+    plan = plan_route_naive_round_trip(start=locs[0], stops=locs[1:11], distance_fn=base)
+    distance_fn, calls = _counting(base)
+
+    updated = insert_stop(plan, locs[11], distance_fn=distance_fn, repair=False)
+
+    assert locs[11] in updated.stops
+    assert updated.stops[0] == updated.stops[-1] == locs[0]
+    assert len(calls) == 2 * len(plan.legs)
+    assert all(locs[11] in pair for pair in calls)
+    _assert_consistent(updated, base)
+
+
+def test_insert_stop_picks_cheapest_position():
+    a = Location(name="A", latitude=0.0, longitude=0.0)
+    b = Location(name="B", latitude=0.0, longitude=1.0)
+    c = Location(name="C", latitude=0.0, longitude=2.0)
+    mid = Location(name="M", latitude=0.0, longitude=1.5)
+    base = haversine_distance_fn()
+    plan = plan_route(stops=[a, b, c], distance_fn=base)
+
+    updated = insert_stop(plan, mid, distance_fn=base)
+
+    assert updated.stops == [a, b, mid, c]
+    _assert_consistent(updated, base)
+
+
+def test_insert_stop_with_candidates_limits_queries():
+    locs = synthetic_stops(30, seed=3)
+    base = haversine_distance_fn()
+    plan = plan_route_naive(start=locs[0], stops=locs[1:29], distance_fn=base)
+    distance_fn, calls = _counting(base)
+
+    updated = insert_stop(plan, locs[29], distance_fn=distance_fn, candidates=3, repair=False)
+
+    # 3 candidate legs x 2 lookups + appending at the open end
+    assert len(calls) == 7
+    _assert_consistent(updated, base)
+
+
+def test_remove_stop_queries_one_leg_and_keeps_totals():
+    locs = synthetic_stops(10, seed=3)
+    base = haversine_distance_fn()
+    plan = plan_route_naive_round_trip(start=locs[0], stops=locs[1:], distance_fn=base)
+    victim = plan.stops[4]
+    distance_fn, calls = _counting(base)
+
+    updated = remove_stop(plan, victim, distance_fn=distance_fn, repair=False)
+
+    assert victim not in updated.stops
+    assert len(updated.stops) == len(plan.stops) - 1
+    assert calls == [(plan.stops[3], plan.stops[5])]
+    _assert_consistent(updated, base)
+
+
+def test_repair_never_makes_the_route_longer():
+    locs = synthetic_stops(25, seed=9)
+    base = haversine_distance_fn()
+    plan = plan_route_naive(start=locs[0], stops=locs[1:24], distance_fn=base)
+
+    plain = insert_stop(plan, locs[24], distance_fn=base, repair=False)
+    repaired = insert_stop(plan, locs[24], distance_fn=base)
+
+    assert repaired.total_distance_km <= plain.total_distance_km + 1e-9
+    _assert_consistent(repaired, base)
+    for stop in plan.stops[1:]:
+        _assert_consistent(remove_stop(plan, stop, distance_fn=base), base)
+
+
+def test_remove_stop_rejects_start_and_unknown_stops():
+    locs = synthetic_stops(4, seed=3)
+    base = haversine_distance_fn()
+    plan = plan_route_naive_round_trip(start=locs[0], stops=locs[1:3], distance_fn=base)
+
+    with pytest.raises(ValueError, match="start"):
+        remove_stop(plan, locs[0], distance_fn=base)
+    with pytest.raises(ValueError, match="not in the plan"):
+        remove_stop(plan, locs[3], distance_fn=base)
+    with pytest.raises(ValueError, match="already in the plan"):
+        insert_stop(plan, locs[1], distance_fn=base)
@@ -0,0 +1,122 @@
+import random
+
+import pytest
+
+from gotrippee.distance.matrix import DistanceMatrix
+from gotrippee.domain.models import Location
+from gotrippee.planner import naive
+from gotrippee.planner.naive import (
+    order_stop_indices_nearest_neighbour,
+    order_stops_nearest_neighbour,
+    plan_route_naive,
+    plan_route_naive_indexed,
+    plan_route_naive_round_trip,
+    plan_route_naive_round_trip_indexed,
+)
+
+
+def _random_trip(n, seed=7):
+    rng = random.Random(seed)
+    locs = [
+        Location(name=f"L{i}", latitude=rng.uniform(-10, 10), longitude=rng.uniform(-10, 10))
+        for i in range(n)
+    ]
+
+    def distance_fn(a, b):
+        # Rounded so that ties actually happen
+        d = round(abs(a.latitude - b.latitude) + abs(a.longitude - b.longitude))
+        return (float(d), float(d) * 2)
+
+    return locs, distance_fn
+
+
+@pytest.fixture(params=["numpy", "pure"])
+def nn_path(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(naive, "np", None)
+    return request.param
+
+
+def test_indexed_nearest_neighbour_matches_location_based_ordering(nn_path):
+    locs, distance_fn = _random_trip(40)
+    matrix = DistanceMatrix.from_distance_fn(locs, distance_fn=distance_fn)
+
+    expected = order_stops_nearest_neighbour(stops=locs, distance_fn=distance_fn)
+    ordered = order_stop_indices_nearest_neighbour(stops=range(40), matrix=matrix)
+
+    assert [locs[i] for i in ordered] == expected
+
+
+def test_indexed_planners_match_location_based_planners(nn_path):
+    locs, distance_fn = _random_trip(25, seed=3)
+    matrix = DistanceMatrix.from_distance_fn(locs, distance_fn=distance_fn)
+    stops = list(range(1, 25))
+
+    open_plan = plan_route_naive_indexed(start=0, stops=stops, matrix=matrix)
+    round_plan = plan_route_naive_round_trip_indexed(start=0, stops=stops, matrix=matrix)
+
+    assert open_plan == plan_route_naive(start=locs[0], stops=locs[1:], distance_fn=distance_fn)
+    assert round_plan == plan_route_naive_round_trip(
+        start=locs[0], stops=locs[1:], distance_fn=distance_fn
+    )
+    assert round_plan.legs[-1].end == locs[0]
+
+
+def test_indexed_planner_validates_indices():
+    locs, distance_fn = _random_trip(3)
+    matrix = DistanceMatrix.from_distance_fn(locs, distance_fn=distance_fn)
+
+    with pytest.raises(ValueError, match="start.*stops"):
+        plan_route_naive_indexed(start=0, stops=[0, 1], matrix=matrix)
+    with pytest.raises(ValueError, match="duplicate"):
+        plan_route_naive_indexed(start=0, stops=[1, 1], matrix=matrix)
+    with pytest.raises(ValueError, match="between"):
+        plan_route_naive_indexed(start=0, stops=[1, 5], matrix=matrix)
+
+
+def test_indexed_planner_requires_square_matrix():
+    locs, distance_fn = _random_trip(3)
+    matrix = DistanceMatrix.from_distance_fn(locs[:1], locs, distance_fn=distance_fn)
+
+    with pytest.raises(ValueError, match="square"):
+        plan_route_naive_indexed(start=0, stops=[1], matrix=matrix)
+
+
+def test_naive_indexed_planners_read_packed_symmetric_matrices(nn_path):
+    from gotrippee.distance.matrix import SymmetricDistanceMatrix
+
+    locs, distance_fn = _random_trip(30, seed=3)
+    dense = DistanceMatrix.from_distance_fn(locs, distance_fn=distance_fn)
+
+    for dtype in ("float64", "float32"):
+        packed = SymmetricDistanceMatrix.from_distance_fn(
+            locs, distance_fn=distance_fn, dtype=dtype
+        )
+        for planner in (plan_route_naive_indexed, plan_route_naive_round_trip_indexed):
+            assert planner(start=0, stops=range(1, 30), matrix=packed) == planner(
+                start=0, stops=range(1, 30), matrix=dense
+            )
+
+
+def test_round_trip_planners_with_no_stops_plan_just_start():
+    from gotrippee.distance.matrix import SymmetricDistanceMatrix
+    from gotrippee.planner.exact import plan_route_exact_round_trip
+    from gotrippee.planner.local_search import plan_route_local_search_round_trip
+    from gotrippee.planner.multistart import plan_route_multistart
+
+    locs, distance_fn = _random_trip(3)
+    dense = DistanceMatrix.from_distance_fn(locs, distance_fn=distance_fn)
+    packed = SymmetricDistanceMatrix.from_distance_fn(locs, distance_fn=distance_fn)
+
+    for matrix in (dense, packed):
+        for plan in (
+            plan_route_naive_round_trip_indexed(start=1, stops=[], matrix=matrix),
+            plan_route_local_search_round_trip(start=1, stops=[], matrix=matrix),
+            plan_route_exact_round_trip(start=1, stops=[], matrix=matrix),
+            plan_route_multistart(start=1, stops=[], matrix=matrix, round_trip=True),
+        ):
+            assert list(plan.stops) == [locs[1]]
+            assert list(plan.legs) == []
+            assert plan.total_distance_km == 0.0 and plan.total_duration_minutes == 0.0
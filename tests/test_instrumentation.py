@@ -0,0 +1,93 @@
+import json
+
+import pytest
+
+from gotrippee.distance.cache import cached_distance_fn
+from gotrippee.distance.osrm import RetryPolicy, osrm_distance_fn
+from gotrippee.domain.models import Location
+from gotrippee.instrumentation import (
+    MetricsRecorder,
+    current_instrumentation,
+    instrumented,
+    timed_distance_fn,
+)
+from gotrippee.planner.naive import plan_route_naive_round_trip
+
+
+def _locations(n):
+    return [Location(name=f"L{i}", latitude=i * 0.1, longitude=(i * 7 % 5) * 0.1) for i in range(n)]
+
+
+def _manhattan(a, b):
+    d = abs(a.latitude - b.latitude) + abs(a.longitude - b.longitude)
+    return (d, d)
+
+
+def test_naive_planner_reports_phases_calls_and_cache_ratio():
+    locs = _locations(8)
+    cached = cached_distance_fn(_manhattan)
+
+    with instrumented() as recorder:
+        plan_route_naive_round_trip(start=locs[0], stops=locs[1:], distance_fn=cached)
+    snapshot = recorder.snapshot()
+
+    assert set(snapshot["phases"]) == {
+        "validate_start_and_stops",
+        "nearest_neighbour.order",
+        "plan_route.lookup",
+        "plan_route.build",
+    }
+    assert all(p["count"] == 1 for p in snapshot["phases"].values())
+    # NN scan over 7 stops (21 lookups) plus 8 legs
+    assert snapshot["histograms"]["distance_fn"]["count"] == 21 + 8
+    info = cached.cache_info()
+    assert snapshot["counters"]["cache.hits"] == info.hits
+    assert snapshot["counters"]["cache.misses"] == info.misses
+    assert snapshot["cache"]["hit_ratio"] == pytest.approx(info.hit_ratio)
+    assert json.loads(recorder.to_json()) == snapshot
+
+
+def test_osrm_requests_are_timed_with_retries_and_errors(osrm_stub):
+    osrm_stub.fail_next = [503]
+    fn = osrm_distance_fn(
+        base_url=osrm_stub.base_url, retry=RetryPolicy(max_retries=2, backoff_seconds=0)
+    )
+    a, b = _locations(2)
+
+    with instrumented() as recorder:
+        fn(a, b)
+    snapshot = recorder.snapshot()
+
+    assert snapshot["histograms"]["osrm.route"]["count"] == 2
+    assert snapshot["counters"]["osrm.route.retries"] == 1
+    assert snapshot["counters"]["osrm.route.errors"] == 1
+
+
+def test_histogram_buckets_and_reset():
+    recorder = MetricsRecorder(buckets=[0.001, 0.01])
+    recorder.observe("x", 0.0005)
+    recorder.observe("x", 0.005)
+    recorder.observe("x", 3.0)
+
+    hist = recorder.snapshot()["histograms"]["x"]
+    assert hist["count"] == 3
+    assert hist["sum_seconds"] == pytest.approx(3.0055)
+    assert [(b["le"], b["count"]) for b in hist["buckets"]] == [
+        (0.001, 1),
+        (0.01, 1),
+        ("+Inf", 1),
+    ]
+
+    recorder.reset()
+    assert recorder.snapshot() == {"phases": {}, "counters": {}, "histograms": {}}
+    with pytest.raises(ValueError):
+        MetricsRecorder(buckets=[1.0, 0.5])
+
+
+def test_hooks_are_inert_without_a_recorder():
+    assert current_instrumentation() is None
+    assert timed_distance_fn(_manhattan) is _manhattan
+    with instrumented() as recorder:
+        assert current_instrumentation() is recorder
+        assert timed_distance_fn(_manhattan) is not _manhattan
+    assert current_instrumentation() is None
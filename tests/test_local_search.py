@@ -0,0 +1,98 @@
+import itertools
+import random
+
+import pytest
+
+from benchmarks.synthetic import synthetic_stops
+from gotrippee.distance.haversine import haversine_matrix_fn
+from gotrippee.distance.matrix import DistanceMatrix
+from gotrippee.domain.models import RoutePlan
+from gotrippee.planner.local_search import (
+    improve_order,
+    plan_route_local_search,
+    plan_route_local_search_round_trip,
+)
+from gotrippee.planner.naive import plan_route_naive_indexed, plan_route_naive_round_trip_indexed
+
+
+def _asymmetric_matrix(n, seed):
+    rng = random.Random(seed)
+    locs = synthetic_stops(n, seed=seed)
+    km = [0.0 if i == j else rng.uniform(1, 100) for i in range(n) for j in range(n)]
+    return DistanceMatrix(sources=locs, targets=locs, km=km, minutes=km)
+
+
+def _cost(matrix, route):
+    return sum(matrix.distance_km(a, b) for a, b in zip(route, route[1:], strict=False))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_local_search_never_worse_than_nn_and_finds_optimum_on_small_trips(seed):
+    matrix = _asymmetric_matrix(7, seed)
+    stops = list(range(1, 7))
+
+    nn = plan_route_naive_round_trip_indexed(start=0, stops=stops, matrix=matrix)
+    improved = plan_route_local_search_round_trip(start=0, stops=stops, matrix=matrix)
+    best = min(_cost(matrix, [0, *p, 0]) for p in itertools.permutations(stops))
+
+    assert isinstance(improved, RoutePlan)
+    assert improved.total_distance_km <= nn.total_distance_km + 1e-9
+    assert improved.total_distance_km >= best - 1e-9
+    assert improved.stops[0] == improved.stops[-1] == matrix.sources[0]
+    names = sorted(s.name for s in improved.stops[1:-1])
+    assert names == sorted(matrix.sources[i].name for i in stops)
+
+
+def test_local_search_improves_nearest_neighbour_on_larger_trips():
+    locs = synthetic_stops(300, seed=1)
+    matrix = haversine_matrix_fn()(locs)
+    stops = list(range(1, 300))
+
+    nn = plan_route_naive_round_trip_indexed(start=0, stops=stops, matrix=matrix)
+    improved = plan_route_local_search_round_trip(start=0, stops=stops, matrix=matrix)
+
+    assert improved.total_distance_km < nn.total_distance_km * 0.95
+
+
+def test_local_search_open_route_keeps_start_and_improves():
+    locs = synthetic_stops(120, seed=2)
+    matrix = haversine_matrix_fn()(locs)
+    stops = list(range(1, 120))
+
+    nn = plan_route_naive_indexed(start=0, stops=stops, matrix=matrix)
+    improved = plan_route_local_search(start=0, stops=stops, matrix=matrix)
+
+    assert improved.stops[0] == locs[0]
+    assert len(improved.stops) == 120
+    assert improved.total_distance_km <= nn.total_distance_km
+
+
+def test_improve_order_delta_evaluation_matches_recomputed_cost():
+    matrix = _asymmetric_matrix(40, seed=3)
+    order = list(range(40))
+
+    improved = improve_order(order, matrix)
+
+    assert sorted(improved) == order
+    assert improved[0] == 0
+    assert _cost(matrix, improved) <= _cost(matrix, order)
+
+
+def test_local_search_validates_like_naive_planner():
+    matrix = _asymmetric_matrix(3, seed=0)
+
+    with pytest.raises(ValueError, match="duplicate"):
+        plan_route_local_search(start=0, stops=[1, 1], matrix=matrix)
+
+
+def test_local_search_reads_packed_symmetric_matrices():
+    from gotrippee.distance.matrix import SymmetricDistanceMatrix
+
+    dense = haversine_matrix_fn()(synthetic_stops(12, seed=9))
+    packed = SymmetricDistanceMatrix.from_matrix(dense)
+
+    for planner in (plan_route_local_search, plan_route_local_search_round_trip):
+        for stops in ([1, 2, 3, 4, 5], list(range(1, 12))):
+            assert planner(start=0, stops=stops, matrix=packed) == planner(
+                start=0, stops=stops, matrix=dense
+            )
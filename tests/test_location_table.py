@@ -0,0 +1,121 @@
+import json
+
+import pytest
+
+from gotrippee.distance.haversine import haversine_matrix_fn
+from gotrippee.distance.osrm import osrm_matrix_fn
+from gotrippee.domain import table as table_mod
+from gotrippee.domain.models import Location
+from gotrippee.domain.table import LocationTable, iter_csv_chunks, iter_geojson_chunks
+from gotrippee.planner import plan_route_compact, plan_route_indexed
+
+
+def _locations(n):
+    return [Location(name=f"L{i}", latitude=i * 0.1, longitude=i * 0.2) for i in range(n)]
+
+
+def _write_csv(path, rows, header="name,latitude,longitude"):
+    path.write_text(header + "\n" + "".join(f"{n},{lat},{lon}\n" for n, lat, lon in rows))
+
+
+def _write_geojson(path, rows):
+    features = [
+        {
+            "type": "Feature",
+            "properties": {"name": name, "note": "x" * 50},
+            "geometry": {"type": "Point", "coordinates": [lon, lat]},
+        }
+        for name, lat, lon in rows
+    ]
+    path.write_text(json.dumps({"type": "FeatureCollection", "features": features, "bbox": []}))
+
+
+def test_table_behaves_like_a_sequence_of_locations():
+    locs = _locations(5)
+    table = LocationTable.from_locations(locs)
+
+    assert len(table) == 5
+    assert list(table) == locs
+    assert table[-1] == locs[-1]
+    assert list(table[1:3]) == locs[1:3]
+    assert locs[2] in table
+
+
+def test_table_validates_coordinate_columns():
+    with pytest.raises(ValueError, match=r"latitude .* \(row 1\)"):
+        LocationTable(names=["a", "b"], latitudes=[0.0, 91.0], longitudes=[0.0, 0.0])
+    with pytest.raises(ValueError, match="longitude"):
+        LocationTable(names=["a"], latitudes=[0.0], longitudes=[float("nan")])
+    with pytest.raises(ValueError):
+        LocationTable(names=["a", "b"], latitudes=[0.0], longitudes=[0.0, 0.0])
+
+
+def test_csv_is_read_in_chunks(tmp_path):
+    rows = [(f"P{i}", i * 0.01, -i * 0.02) for i in range(25)]
+    path = tmp_path / "stops.csv"
+    _write_csv(path, rows)
+
+    chunks = list(iter_csv_chunks(path, chunk_size=10))
+
+    assert [len(c) for c in chunks] == [10, 10, 5]
+    table = LocationTable.from_csv(path, chunk_size=10)
+    assert list(table.names) == [r[0] for r in rows]
+    assert table[24] == Location(name="P24", latitude=0.24, longitude=-0.48)
+
+
+def test_csv_errors_report_the_row(tmp_path):
+    path = tmp_path / "stops.csv"
+    _write_csv(path, [("a", 0, 0), ("b", 0, 0), ("c", 100, 0)])
+    with pytest.raises(ValueError, match=r"row 2"):
+        LocationTable.from_csv(path, chunk_size=2)
+
+    _write_csv(path, [("a", 0, 0)], header="id,lat,lon")
+    with pytest.raises(ValueError, match="header"):
+        LocationTable.from_csv(path)
+    table = LocationTable.from_csv(
+        path, name_column="id", latitude_column="lat", longitude_column="lon"
+    )
+    assert list(table.names) == ["a"]
+
+
+def test_geojson_is_streamed_feature_by_feature(tmp_path, monkeypatch):
+    # Tiny read blocks force values to straddle buffer boundaries
+    monkeypatch.setattr(table_mod._JSONStream, "_BLOCK", 7)
+    rows = [(f"P{i}", i * 0.5, i * 1.25) for i in range(12)]
+    path = tmp_path / "stops.geojson"
+    _write_geojson(path, rows)
+
+    chunks = list(iter_geojson_chunks(path, chunk_size=5))
+
+    assert [len(c) for c in chunks] == [5, 5, 2]
+    table = LocationTable.concat(chunks)
+    assert list(table) == [Location(name=n, latitude=lat, longitude=lon) for n, lat, lon in rows]
+
+
+def test_geojson_rejects_non_point_features(tmp_path):
+    path = tmp_path / "stops.geojson"
+    path.write_text(json.dumps({
+        "type": "FeatureCollection",
+        "features": [{"type": "Feature", "properties": {"name": "x"},
+                      "geometry": {"type": "LineString", "coordinates": [[0, 0], [1, 1]]}}],
+    }))
+    with pytest.raises(ValueError, match="feature 0"):
+        LocationTable.from_geojson(path)
+
+
+def test_matrix_providers_read_table_columns(osrm_stub):
+    locs = _locations(6)
+    table = LocationTable.from_locations(locs)
+
+    matrix = haversine_matrix_fn()(table)
+    assert matrix.sources is table
+    assert list(matrix.km) == list(haversine_matrix_fn()(locs).km)
+
+    osrm = osrm_matrix_fn(base_url=osrm_stub.base_url)(table)
+    assert osrm.sources is table
+    assert list(osrm.km) == list(osrm_matrix_fn(base_url=osrm_stub.base_url)(locs).km)
+
+    order = [0, 3, 1, 5]
+    assert plan_route_compact(stops=order, matrix=matrix) == plan_route_indexed(
+        stops=order, matrix=matrix
+    )
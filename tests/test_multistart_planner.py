@@ -0,0 +1,83 @@
+from benchmarks.synthetic import synthetic_stops
+from gotrippee.distance.haversine import haversine_matrix_fn
+from gotrippee.planner.multistart import plan_route_multistart
+from gotrippee.planner.naive import plan_route_naive_indexed, plan_route_naive_round_trip_indexed
+
+
+def _matrix(n, seed=4):
+    return haversine_matrix_fn()(synthetic_stops(n, seed=seed))
+
+
+def test_multistart_is_never_worse_than_single_nn():
+    matrix = _matrix(40)
+    stops = list(range(1, 40))
+
+    single = plan_route_naive_round_trip_indexed(start=0, stops=stops, matrix=matrix)
+    multi = plan_route_multistart(
+        start=0, stops=stops, matrix=matrix, round_trip=True, max_workers=1
+    )
+
+    assert multi.total_distance_km <= single.total_distance_km
+    assert multi.stops[0] == multi.stops[-1] == matrix.sources[0]
+
+
+def test_multistart_with_one_seed_is_plain_nn():
+    matrix = _matrix(25)
+    stops = list(range(1, 25))
+
+    multi = plan_route_multistart(start=0, stops=stops, matrix=matrix, seeds=1, max_workers=1)
+
+    assert multi == plan_route_naive_indexed(start=0, stops=stops, matrix=matrix)
+
+
+def test_multistart_result_does_not_depend_on_worker_count():
+    matrix = _matrix(30, seed=8)
+    stops = list(range(1, 30))
+
+    serial = plan_route_multistart(
+        start=0, stops=stops, matrix=matrix, local_search=True, max_workers=1
+    )
+    parallel = plan_route_multistart(
+        start=0, stops=stops, matrix=matrix, local_search=True, max_workers=3
+    )
+
+    assert parallel == serial
+
+
+def test_multistart_pool_accepts_float32_matrices():
+    from array import array
+
+    from gotrippee.distance.matrix import DistanceMatrix
+
+    dense = _matrix(15)
+    matrix = DistanceMatrix(
+        sources=dense.sources,
+        targets=dense.targets,
+        km=array("f", dense.km),
+        minutes=array("f", dense.minutes),
+    )
+    stops = list(range(1, 15))
+
+    serial = plan_route_multistart(start=0, stops=stops, matrix=matrix, max_workers=1)
+    pooled = plan_route_multistart(start=0, stops=stops, matrix=matrix, max_workers=2)
+
+    assert pooled == serial
+
+
+def test_multistart_reads_packed_symmetric_matrices():
+    from gotrippee.distance.matrix import SymmetricDistanceMatrix
+
+    dense = _matrix(14)
+    packed = SymmetricDistanceMatrix.from_matrix(dense)
+    stops = list(range(1, 14))
+
+    expected = plan_route_multistart(
+        start=0, stops=stops, matrix=dense, local_search=True, max_workers=1
+    )
+    for workers in (1, 2):
+        assert (
+            plan_route_multistart(
+                start=0, stops=stops, matrix=packed, local_search=True, max_workers=workers
+            )
+            == expected
+        )
@@ -10,6 +10,8 @@ def test_osrm_distance_fn_converts_units_and_calls_expected_url(monkeypatch):
     captured = {}
 
     class FakeResponse:
+        status_code = 200
+
         def raise_for_status(self):
             return None
         
@@ -17,14 +19,14 @@ def test_osrm_distance_fn_converts_units_and_calls_expected_url(monkeypatch):
             # 12,345 meters, 687 seconds
             return {"routes": [{"distance": 12345.0, "duration": 678.0}]}
         
-    def fake_get(url, params=None, timeout=None):
+    def fake_get(self, url, params=None, timeout=None):
         captured["url"] = url
         captured["params"] = params
         captured["timeout"] = timeout
         return FakeResponse()
     
     import gotrippee.distance.osrm as osrm_mod
-    monkeypatch.setattr(osrm_mod.requests, "get", fake_get)
+    monkeypatch.setattr(osrm_mod.requests.Session, "get", fake_get)
 
     distance_fn = osrm_distance_fn(base_url="https://router.project-osrm.org", profile="driving")
     km, mins = distance_fn(a, b)
@@ -45,18 +47,96 @@ def test_osrm_distance_fn_raises_if_no_routes(monkeypatch):
     b = Location(name="B", latitude=1.0, longitude=1.0)
 
     class FakeResponse:
+        status_code = 200
+
         def raise_for_status(self):
             return None
         
         def json(self):
             return {"routes": []}
         
-    def fake_get(url, params=None, timeout=None):
+    def fake_get(self, url, params=None, timeout=None):
         return FakeResponse()
     
     import gotrippee.distance.osrm as osrm_mod
-    monkeypatch.setattr(osrm_mod.requests, "get", fake_get)
+    monkeypatch.setattr(osrm_mod.requests.Session, "get", fake_get)
 
     distance_fn = osrm_distance_fn()
     with pytest.raises(ValueError, match="OSRM.*no routes|no routes"):
-        distance_fn(a, b)
\ No newline at end of file
+        distance_fn(a, b)
+
+def _stub_pair():
+    from gotrippee.domain.models import Location
+
+    return (
+        Location(name="A", latitude=0.0, longitude=0.0),
+        Location(name="B", latitude=0.5, longitude=0.5),
+    )
+
+
+def test_osrm_distance_fn_reuses_one_keep_alive_connection(osrm_stub):
+    from gotrippee.distance.osrm import osrm_distance_fn
+
+    a, b = _stub_pair()
+    distance_fn = osrm_distance_fn(base_url=osrm_stub.base_url)
+
+    for _ in range(10):
+        assert distance_fn(a, b) == pytest.approx((1.0, 100.0 / 60.0))
+
+    assert len(osrm_stub.requests) == 10
+    assert osrm_stub.connections == 1
+
+
+def test_osrm_distance_fn_retries_transient_errors(osrm_stub):
+    from gotrippee.distance.osrm import RetryPolicy, osrm_distance_fn
+
+    a, b = _stub_pair()
+    osrm_stub.fail_next = [503, 502]
+    distance_fn = osrm_distance_fn(
+        base_url=osrm_stub.base_url, retry=RetryPolicy(max_retries=2, backoff_seconds=0.001)
+    )
+
+    assert distance_fn(a, b)[0] == pytest.approx(1.0)
+    assert len(osrm_stub.requests) == 3
+
+
+def test_osrm_distance_fn_gives_up_after_max_retries(osrm_stub):
+    import requests
+
+    from gotrippee.distance.osrm import RetryPolicy, osrm_distance_fn
+
+    a, b = _stub_pair()
+    osrm_stub.fail_next = [503, 503, 503]
+    distance_fn = osrm_distance_fn(
+        base_url=osrm_stub.base_url, retry=RetryPolicy(max_retries=1, backoff_seconds=0.001)
+    )
+
+    with pytest.raises(requests.HTTPError):
+        distance_fn(a, b)
+    assert len(osrm_stub.requests) == 2
+
+
+def test_osrm_distance_fn_does_not_retry_client_errors(osrm_stub):
+    import requests
+
+    from gotrippee.distance.osrm import osrm_distance_fn
+
+    a, b = _stub_pair()
+    osrm_stub.fail_next = [400]
+
+    with pytest.raises(requests.HTTPError):
+        osrm_distance_fn(base_url=osrm_stub.base_url)(a, b)
+    assert len(osrm_stub.requests) == 1
+
+
+def test_osrm_distance_fn_enforces_latency_budget(osrm_stub):
+    import requests
+
+    from gotrippee.distance.osrm import osrm_distance_fn
+
+    a, b = _stub_pair()
+    osrm_stub.latency_seconds = 0.5
+
+    distance_fn = osrm_distance_fn(base_url=osrm_stub.base_url, latency_budget_seconds=0.1)
+    with pytest.raises((TimeoutError, requests.Timeout)):
+        distance_fn(a, b)
@@ -0,0 +1,93 @@
+import pytest
+
+from gotrippee.distance.matrix import DistanceMatrix
+from gotrippee.distance.osrm import osrm_matrix_fn
+from gotrippee.domain.models import Location
+
+
+def _locations(n):
+    return [Location(name=f"L{i}", latitude=i * 0.1, longitude=i * 0.2) for i in range(n)]
+
+
+def test_osrm_matrix_fn_square_matrix_uses_single_table_request(osrm_stub):
+    locs = _locations(4)
+
+    matrix_fn = osrm_matrix_fn(base_url=osrm_stub.base_url, profile="driving")
+    matrix = matrix_fn(locs)
+
+    assert isinstance(matrix, DistanceMatrix)
+    assert matrix.n_rows == 4 and matrix.n_cols == 4
+    assert len(osrm_stub.requests) == 1
+
+    path, query = osrm_stub.requests[0]
+    assert path.startswith("/table/v1/driving/")
+    assert query["annotations"] == "distance,duration"
+
+    # L0 -> L2: (0.2 + 0.4) degrees == 600 m == 60 s
+    km, mins = matrix.get(0, 2)
+    assert km == pytest.approx(0.6)
+    assert mins == pytest.approx(1.0)
+    assert matrix.get(2, 2) == (0.0, 0.0)
+
+
+def test_osrm_matrix_fn_tiles_requests_over_max_coordinates(osrm_stub):
+    osrm_stub.max_table_size = 4
+    locs = _locations(7)
+
+    matrix = osrm_matrix_fn(base_url=osrm_stub.base_url, max_coordinates=4)(locs)
+
+    # 7 sources in tiles of 2 x 7 targets in tiles of 2 => 4 x 4 tiles
+    assert len(osrm_stub.requests) == 16
+    for i in range(7):
+        for j in range(7):
+            expected = (abs(i - j) * 0.1 + abs(i - j) * 0.2)
+            assert matrix.distance_km(i, j) == pytest.approx(expected)
+
+
+def test_osrm_matrix_fn_supports_rectangular_matrices(osrm_stub):
+    sources = _locations(2)
+    targets = _locations(5)[2:]
+
+    matrix = osrm_matrix_fn(base_url=osrm_stub.base_url)(sources, targets)
+
+    assert matrix.n_rows == 2 and matrix.n_cols == 3
+    assert not matrix.is_square
+    assert matrix.distance_km(1, 0) == pytest.approx(0.3)
+    _, query = osrm_stub.requests[0]
+    assert query["sources"] == "0;1"
+    assert query["destinations"] == "2;3;4"
+
+
+def test_osrm_matrix_fn_raises_on_unreachable_pair(monkeypatch):
+    import gotrippee.distance.osrm as osrm_mod
+
+    class FakeResponse:
+        status_code = 200
+
+        def raise_for_status(self):
+            return None
+
+        def json(self):
+            return {"code": "Ok", "distances": [[0.0, None], [None, 0.0]],
+                    "durations": [[0.0, None], [None, 0.0]]}
+
+    monkeypatch.setattr(
+        osrm_mod.requests.Session,
+        "get",
+        lambda self, url, params=None, timeout=None: FakeResponse(),
+    )
+
+    with pytest.raises(ValueError, match="no route"):
+        osrm_matrix_fn()(_locations(2))
+
+
+def test_distance_matrix_adapts_to_distance_fn(osrm_stub):
+    from gotrippee.planner.naive import order_stops_nearest_neighbour
+
+    locs = _locations(5)
+    matrix = osrm_matrix_fn(base_url=osrm_stub.base_url)(locs)
+
+    ordered = order_stops_nearest_neighbour(stops=locs[::-1], distance_fn=matrix.as_distance_fn())
+
+    assert ordered == locs[::-1]
+    assert len(osrm_stub.requests) == 1
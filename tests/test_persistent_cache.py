@@ -0,0 +1,162 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from gotrippee.distance.persistent import SQLiteDistanceStore, persistent_distance_fn
+from gotrippee.domain.models import Location
+
+A = Location(name="A", latitude=51.5, longitude=-0.1)
+B = Location(name="B", latitude=51.6, longitude=-0.12)
+C = Location(name="C", latitude=51.7, longitude=-0.14)
+
+
+def _counting_distance_fn(calls):
+    def distance_fn(a, b):
+        calls.append((a.name, b.name))
+        return (a.latitude + b.latitude, 1.0)
+
+    return distance_fn
+
+
+def test_persistent_distance_fn_survives_process_restart(tmp_path):
+    path = tmp_path / "distances.sqlite"
+    calls = []
+
+    with SQLiteDistanceStore(path) as store:
+        cached = persistent_distance_fn(
+            _counting_distance_fn(calls), store=store, profile="driving"
+        )
+        assert cached(A, B) == (103.1, 1.0)
+        cached.flush()
+
+    # A fresh store on the same file (a new run) must not hit the provider again
+    with SQLiteDistanceStore(path) as store:
+        cached = persistent_distance_fn(
+            _counting_distance_fn(calls), store=store, profile="driving"
+        )
+        assert cached(A, B) == (103.1, 1.0)
+
+    assert calls == [("A", "B")]
+
+
+def test_store_keys_on_profile_and_direction(tmp_path):
+    with SQLiteDistanceStore(tmp_path / "d.sqlite") as store:
+        store.put_many([(store.key_for("driving", A, B), (1.0, 2.0))])
+
+        assert store.get_many([store.key_for("driving", A, B)]) == {
+            store.key_for("driving", A, B): (1.0, 2.0)
+        }
+        assert store.get_many([store.key_for("walking", A, B)]) == {}
+        assert store.get_many([store.key_for("driving", B, A)]) == {}
+
+
+def test_store_quantizes_coordinates(tmp_path):
+    near_a = Location(name="A'", latitude=A.latitude + 1e-8, longitude=A.longitude)
+
+    with SQLiteDistanceStore(tmp_path / "d.sqlite", precision=6) as store:
+        assert store.key_for("driving", A, B) == store.key_for("driving", near_a, B)
+
+
+def test_prefetch_batches_reads_and_warm_start_preloads_hot_entries(tmp_path):
+    path = tmp_path / "d.sqlite"
+    calls = []
+
+    with SQLiteDistanceStore(path) as store:
+        cached = persistent_distance_fn(_counting_distance_fn(calls), store=store)
+        for _ in range(3):
+            cached(A, B)
+        cached(B, C)
+        cached.flush()
+
+    with SQLiteDistanceStore(path) as store:
+        assert list(store.hot_entries(profile="default", limit=1)) == [
+            store.key_for("default", A, B)
+        ]
+
+        cached = persistent_distance_fn(_counting_distance_fn(calls), store=store, warm_start=1)
+        cached.prefetch([(B, C), (A, C)])
+        cached(A, B)
+        cached(B, C)
+
+    assert calls == [("A", "B"), ("B", "C")]
+
+
+def test_memory_is_bounded_and_evicts_least_recently_used(tmp_path):
+    calls = []
+
+    with SQLiteDistanceStore(tmp_path / "d.sqlite") as store:
+        cached = persistent_distance_fn(
+            _counting_distance_fn(calls), store=store, max_entries=2, write_batch_size=1
+        )
+        reads = []
+        get_many = store.get_many
+        store.get_many = lambda keys: reads.append(list(keys)) or get_many(keys)
+
+        cached(A, B)
+        cached(B, C)
+        cached(A, B)  # memory hit, B -> C is now least recently used
+        cached(A, C)  # evicts B -> C
+        n_reads = len(reads)
+        cached(A, B)
+        assert len(reads) == n_reads
+        cached(B, C)  # evicted, so read back from the store
+        assert len(reads) == n_reads + 1
+
+    assert calls == [("A", "B"), ("B", "C"), ("A", "C")]
+
+    with pytest.raises(ValueError, match="max_entries"):
+        persistent_distance_fn(_counting_distance_fn([]), store=store, max_entries=0)
+
+
+def test_profile_defaults_to_provider_cache_namespace(tmp_path):
+    def provider(namespace, value):
+        def distance_fn(a, b):
+            return (value, value)
+
+        distance_fn.cache_namespace = namespace
+        return distance_fn
+
+    with SQLiteDistanceStore(tmp_path / "d.sqlite") as store:
+        first = persistent_distance_fn(provider("osrm:driving", 1.0), store=store)
+        second = persistent_distance_fn(provider("osrm:walking", 2.0), store=store)
+        assert first(A, B) == (1.0, 1.0)
+        first.flush()
+
+        assert second(A, B) == (2.0, 2.0)
+        assert list(store.hot_entries(profile="osrm:driving", limit=5)) == [
+            store.key_for("osrm:driving", A, B)
+        ]
+
+
+def test_concurrent_callers_persist_every_result(tmp_path):
+    locs = [Location(name=f"L{i}", latitude=50 + i * 0.01, longitude=0.0) for i in range(12)]
+    pairs = [(a, b) for a in locs for b in locs]
+
+    with SQLiteDistanceStore(tmp_path / "d.sqlite") as store:
+        cached = persistent_distance_fn(
+            lambda a, b: (a.latitude - b.latitude, 0.0), store=store, write_batch_size=3
+        )
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda pair: cached(*pair), pairs))
+        cached.flush()
+
+        assert len(store) == len(pairs)
+
+
+def _write_entries(path, worker):
+    with SQLiteDistanceStore(path) as store:
+        for i in range(50):
+            a = Location(name="a", latitude=worker, longitude=i * 0.01)
+            store.put_many([(store.key_for("driving", a, a), (float(i), 0.0))])
+    return worker
+
+
+def test_store_is_safe_for_concurrent_writer_processes(tmp_path):
+    path = tmp_path / "d.sqlite"
+    SQLiteDistanceStore(path).close()
+
+    with ProcessPoolExecutor(max_workers=4) as pool:
+        assert sorted(pool.map(_write_entries, [path] * 4, range(4))) == [0, 1, 2, 3]
+
+    with SQLiteDistanceStore(path) as store:
+        assert len(store) == 200
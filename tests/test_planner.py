@@ -1,4 +1,8 @@
-from gotrippee.domain.models import Location, RoutePlan
+import math
+
+import pytest
+
+from gotrippee.domain.models import Leg, Location, RoutePlan
 from gotrippee.planner import plan_route
 
 
@@ -36,3 +40,40 @@ def test_plan_route_uses_distance_fn_and_totals_match():
     assert len(result.legs) == 2
     assert result.total_distance_km == 15.5
     assert result.total_duration_minutes == 30
+
+
+def test_plan_route_builds_the_same_plan_as_the_validating_constructors():
+    a = Location(name="A", latitude=0.0, longitude=0.0)
+    b = Location(name="B", latitude=1.0, longitude=1.0)
+    c = Location(name="C", latitude=2.0, longitude=2.0)
+
+    result = plan_route(stops=[a, b, c], distance_fn=lambda s, e: (1.5, 3.0))
+
+    legs = [
+        Leg(start=a, end=b, distance_km=1.5, duration_minutes=3.0),
+        Leg(start=b, end=c, distance_km=1.5, duration_minutes=3.0),
+    ]
+    assert result == RoutePlan(
+        stops=[a, b, c], legs=legs, total_distance_km=3.0, total_duration_minutes=6.0
+    )
+    assert all(type(leg) is Leg for leg in result.legs)
+
+
+def test_plan_route_still_rejects_negative_distances():
+    a = Location(name="A", latitude=0.0, longitude=0.0)
+    b = Location(name="B", latitude=1.0, longitude=1.0)
+
+    with pytest.raises(ValueError):
+        plan_route(stops=[a, b], distance_fn=lambda s, e: (-1.0, 1.0))
+    with pytest.raises(ValueError):
+        plan_route(stops=[a, b], distance_fn=lambda s, e: (1.0, -1.0))
+
+
+def test_plan_route_rejects_nan_leg_values():
+    a = Location(name="A", latitude=0.0, longitude=0.0)
+    b = Location(name="B", latitude=1.0, longitude=1.0)
+
+    with pytest.raises(ValueError, match="distance_km must not be NaN"):
+        plan_route(stops=[a, b], distance_fn=lambda s, e: (math.nan, 1.0))
+    with pytest.raises(ValueError, match="duration_minutes must not be NaN"):
+        plan_route(stops=[a, b], distance_fn=lambda s, e: (1.0, math.nan))
@@ -0,0 +1,125 @@
+import heapq
+import random
+
+import pytest
+
+from gotrippee.distance.graph import (
+    RoadGraph,
+    road_graph_distance_fn,
+    road_graph_matrix_fn,
+    write_road_graph,
+)
+from gotrippee.domain.models import Location
+
+
+def _grid(tmp_path, width=12, seed=1):
+    rng = random.Random(seed)
+    n = width * width
+    lats = [50 + (i // width) * 0.01 for i in range(n)]
+    lons = [(i % width) * 0.01 for i in range(n)]
+    edges = []
+    for i in range(n):
+        r, c = divmod(i, width)
+        for j in ([i + 1] if c < width - 1 else []) + ([i + width] if r < width - 1 else []):
+            length, speed = rng.uniform(500, 1500), rng.choice([30, 50, 80])
+            edges.append((i, j, length, speed))
+            if rng.random() < 0.8:
+                edges.append((j, i, length, speed))
+    path = tmp_path / "grid.graph"
+    write_road_graph(path, latitudes=lats, longitudes=lons, edges=edges)
+    return path, n, edges
+
+
+def _dijkstra(n, edges, source):
+    adj = [[] for _ in range(n)]
+    for u, v, length, speed in edges:
+        adj[u].append((v, length / (speed / 3.6)))
+    best = {source: 0.0}
+    heap = [(0.0, source)]
+    while heap:
+        d, u = heapq.heappop(heap)
+        if d > best[u]:
+            continue
+        for v, t in adj[u]:
+            if d + t < best.get(v, float("inf")):
+                best[v] = d + t
+                heapq.heappush(heap, (d + t, v))
+    return best
+
+
+def test_bidirectional_and_one_to_many_match_plain_dijkstra(tmp_path):
+    path, n, edges = _grid(tmp_path)
+    rng = random.Random(2)
+
+    with RoadGraph(path) as graph:
+        assert (graph.n_nodes, graph.n_edges) == (n, len(edges))
+        for _ in range(30):
+            source = rng.randrange(n)
+            expected = _dijkstra(n, edges, source)
+            targets = rng.sample(range(n), 10)
+            found = graph.routes_from(source, targets)
+            for t in targets:
+                cost = graph.route(source, t)
+                if t not in expected:
+                    assert cost is None and t not in found
+                    continue
+                assert cost[0] == pytest.approx(expected[t], rel=1e-5)
+                assert found[t][0] == pytest.approx(expected[t], rel=1e-5)
+                assert cost[1] == pytest.approx(found[t][1], rel=1e-5)
+
+
+def test_one_way_streets_and_unreachable_nodes(tmp_path):
+    path = tmp_path / "line.graph"
+    # 0 -> 1 <-> 2, node 3 isolated
+    write_road_graph(
+        path,
+        latitudes=[0.0, 0.0, 0.0, 1.0],
+        longitudes=[0.0, 0.01, 0.02, 1.0],
+        edges=[(0, 1, 1000, 36), (1, 2, 2000, 72), (2, 1, 2000, 72)],
+    )
+    with RoadGraph(path) as graph:
+        assert graph.route(0, 2) == pytest.approx((200.0, 3000.0))
+        assert graph.route(2, 0) is None
+        assert graph.route(0, 3) is None
+        assert graph.snap(0.0001, 0.0199)[0] == 2
+
+
+def test_distance_and_matrix_providers_agree(tmp_path):
+    path, n, _ = _grid(tmp_path)
+    locs = [
+        Location(name=f"P{i}", latitude=50 + 0.011 * i, longitude=0.013 * i + 0.002)
+        for i in range(6)
+    ]
+
+    with RoadGraph(path) as graph:
+        distance_fn = road_graph_distance_fn(graph)
+        matrix = road_graph_matrix_fn(graph)(locs)
+        for i, a in enumerate(locs):
+            for j, b in enumerate(locs):
+                try:
+                    expected = distance_fn(a, b)
+                except ValueError:
+                    continue
+                assert matrix.get(i, j) == pytest.approx(expected)
+        assert matrix.get(0, 0) == (0.0, 0.0)
+
+
+def test_missing_route_and_bad_input_raise(tmp_path):
+    path = tmp_path / "split.graph"
+    write_road_graph(path, latitudes=[0.0, 1.0], longitudes=[0.0, 1.0], edges=[])
+    a = Location(name="A", latitude=0.0, longitude=0.0)
+    b = Location(name="B", latitude=1.0, longitude=1.0)
+    with RoadGraph(path) as graph:
+        with pytest.raises(ValueError, match="no route from A to B"):
+            road_graph_distance_fn(graph)(a, b)
+        with pytest.raises(ValueError, match="no route"):
+            road_graph_matrix_fn(graph)([a, b])
+
+    with pytest.raises(ValueError):
+        write_road_graph(path, latitudes=[0.0], longitudes=[0.0], edges=[(0, 1, 10, 10)])
+    with pytest.raises(ValueError):
+        write_road_graph(path, latitudes=[0.0, 1.0], longitudes=[0.0, 1.0], edges=[(0, 1, 10, 0)])
+    bogus = tmp_path / "bogus.graph"
+    bogus.write_bytes(b"not a graph file at all")
+    with pytest.raises(ValueError):
+        RoadGraph(bogus)
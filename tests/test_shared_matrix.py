@@ -0,0 +1,144 @@
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from gotrippee.distance.haversine import haversine_distance_fn, haversine_matrix_fn
+from gotrippee.distance.matrix import DistanceMatrix
+from gotrippee.distance.shared import SharedDistanceMatrix
+from gotrippee.domain.models import Location
+from gotrippee.planner import plan_route_indexed
+from gotrippee.planner.multistart import plan_route_multistart
+
+STOPS = [
+    Location(name="A", latitude=51.5, longitude=-0.1),
+    Location(name="B", latitude=51.6, longitude=-0.12),
+    Location(name="C", latitude=51.7, longitude=-0.14),
+    Location(name="D", latitude=51.45, longitude=-0.2),
+]
+
+
+def _read_in_worker(name):
+    with SharedDistanceMatrix.attach(name) as shared:
+        distance_fn = shared.as_distance_fn()
+        renamed = Location(name="elsewhere", latitude=51.6, longitude=-0.12)
+        return distance_fn(STOPS[0], renamed), shared.matrix.sources[2].name
+
+
+def test_shared_matrix_is_readable_from_other_processes():
+    matrix = haversine_matrix_fn()(STOPS)
+    shared = SharedDistanceMatrix.create(matrix)
+    try:
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            results = list(pool.map(_read_in_worker, [shared.name] * 3))
+        km, minutes = matrix.get(0, 1)
+        for (got_km, got_minutes), name in results:
+            assert got_km == pytest.approx(km, rel=1e-6)
+            assert got_minutes == pytest.approx(minutes, rel=1e-6)
+            assert name == "C"
+    finally:
+        shared.close()
+        shared.unlink()
+
+
+def test_unrelated_process_exiting_leaves_the_segment_in_place():
+    matrix = haversine_matrix_fn()(STOPS)
+    with SharedDistanceMatrix.create(matrix) as shared:
+        try:
+            code = (
+                "import sys\n"
+                "from gotrippee.distance.shared import SharedDistanceMatrix\n"
+                "with SharedDistanceMatrix.attach(sys.argv[1]) as s:\n"
+                "    print(s.matrix.n_rows)\n"
+            )
+            result = subprocess.run(
+                [sys.executable, "-c", code, shared.name], capture_output=True, text=True
+            )
+            assert result.stdout.strip() == "4"
+            assert "Traceback" not in result.stderr
+
+            with SharedDistanceMatrix.attach(shared.name) as again:
+                assert again.matrix.n_rows == 4
+        finally:
+            shared.unlink()
+
+
+def test_shared_matrix_file_round_trip_matches_matrix(tmp_path):
+    matrix = haversine_matrix_fn()(STOPS, STOPS[:2])
+    path = tmp_path / "matrix.bin"
+    SharedDistanceMatrix.create(matrix, path=path).close()
+
+    with SharedDistanceMatrix.open(path) as shared:
+        assert shared.name is None
+        got = shared.matrix
+        assert (got.n_rows, got.n_cols) == (4, 2)
+        assert list(got.sources) == STOPS
+        assert list(got.targets) == STOPS[:2]
+        assert got.km.itemsize == 4
+        for i in range(4):
+            for j in range(2):
+                assert got.get(i, j) == pytest.approx(matrix.get(i, j), rel=1e-6)
+
+
+def test_shared_matrix_plugs_into_the_planners():
+    matrix = haversine_matrix_fn()(STOPS)
+    with SharedDistanceMatrix.create(matrix) as shared:
+        try:
+            plan = plan_route_indexed(stops=[0, 2, 1], matrix=shared.matrix)
+            expected = plan_route_indexed(stops=[0, 2, 1], matrix=matrix)
+            assert [loc.name for loc in plan.stops] == ["A", "C", "B"]
+            assert plan.total_distance_km == pytest.approx(expected.total_distance_km, rel=1e-6)
+        finally:
+            shared.unlink()
+
+
+def test_shared_matrix_works_with_the_multistart_process_pool():
+    matrix = haversine_matrix_fn()(STOPS)
+    with SharedDistanceMatrix.create(matrix) as shared:
+        try:
+            serial = plan_route_multistart(
+                start=0, stops=[1, 2, 3], matrix=shared.matrix, round_trip=True, max_workers=1
+            )
+            pooled = plan_route_multistart(
+                start=0, stops=[1, 2, 3], matrix=shared.matrix, round_trip=True, max_workers=2
+            )
+            assert pooled == serial
+            assert serial.total_distance_km == pytest.approx(
+                plan_route_multistart(
+                    start=0, stops=[1, 2, 3], matrix=matrix, round_trip=True, max_workers=1
+                ).total_distance_km,
+                rel=1e-6,
+            )
+        finally:
+            shared.unlink()
+
+
+def test_shared_distance_fn_falls_back_for_unknown_points():
+    matrix = DistanceMatrix.from_distance_fn(STOPS[:2], distance_fn=haversine_distance_fn())
+    outside = Location(name="X", latitude=50.0, longitude=0.0)
+    calls = []
+
+    def fallback(a, b):
+        calls.append((a.name, b.name))
+        return (1.0, 2.0)
+
+    with SharedDistanceMatrix.create(matrix) as shared:
+        try:
+            with pytest.raises(KeyError):
+                shared.as_distance_fn()(STOPS[0], outside)
+            distance_fn = shared.as_distance_fn(fallback)
+            assert distance_fn(outside, STOPS[0]) == (1.0, 2.0)
+            assert distance_fn(STOPS[0], STOPS[1])[0] == pytest.approx(
+                matrix.distance_km(0, 1), rel=1e-6
+            )
+            assert calls == [("X", "A")]
+        finally:
+            shared.unlink()
+
+
+def test_open_rejects_other_files(tmp_path):
+    path = tmp_path / "junk.bin"
+    path.write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        SharedDistanceMatrix.open(path)
@@ -0,0 +1,96 @@
+import random
+
+import pytest
+
+from gotrippee.distance.haversine import great_circle_km, haversine_distance_fn
+from gotrippee.domain.models import Location
+from gotrippee.planner.naive import order_stops_nearest_neighbour
+from gotrippee.planner.spatial import order_stops_nearest_neighbour_spatial
+from gotrippee.spatial import SpatialIndex
+
+
+def _random_stops(n, seed=5, spread=2.0):
+    rng = random.Random(seed)
+    return [
+        Location(
+            name=f"S{i}",
+            latitude=51.0 + rng.uniform(-spread, spread),
+            longitude=rng.uniform(-spread, spread),
+        )
+        for i in range(n)
+    ]
+
+
+def _counting(distance_fn):
+    calls = {"n": 0}
+
+    def wrapped(a, b):
+        calls["n"] += 1
+        return distance_fn(a, b)
+
+    return wrapped, calls
+
+
+def test_spatial_index_yields_remaining_points_nearest_first():
+    stops = _random_stops(200)
+    index = SpatialIndex([(s.latitude, s.longitude) for s in stops])
+    for i in range(0, 200, 3):
+        index.remove(i)
+
+    q = stops[1]
+    got = list(index.nearest(q.latitude, q.longitude))
+
+    assert len(got) == len(index) == 200 - 67
+    assert {i for _, i in got} == {i for i in range(200) if i % 3}
+    kms = [km for km, _ in got]
+    assert kms == sorted(kms)
+    for km, i in got:
+        expected = great_circle_km(q.latitude, q.longitude, stops[i].latitude, stops[i].longitude)
+        assert km == pytest.approx(expected, abs=1e-6)
+
+
+def test_spatial_ordering_matches_full_scan_with_fewer_calls():
+    stops = _random_stops(400)
+    # Road distance = great-circle with a per-pair detour, never shorter
+    base = haversine_distance_fn()
+
+    def road_distance_fn(a, b):
+        km, mins = base(a, b)
+        detour = 1.0 + (hash((a.name, b.name)) % 30) / 100
+        return (km * detour, mins * detour)
+
+    full_fn, full_calls = _counting(road_distance_fn)
+    fast_fn, fast_calls = _counting(road_distance_fn)
+
+    expected = order_stops_nearest_neighbour(stops=stops, distance_fn=full_fn)
+    ordered = order_stops_nearest_neighbour_spatial(stops=stops, distance_fn=fast_fn)
+
+    assert ordered == expected
+    assert fast_calls["n"] * 10 < full_calls["n"]
+
+
+def test_spatial_ordering_keeps_input_order_tie_breaker():
+    a = Location(name="A", latitude=0.0, longitude=0.0)
+    b = Location(name="B", latitude=0.0, longitude=0.1)
+    c = Location(name="C", latitude=0.0, longitude=-0.1)
+
+    # b and c are equidistant from a; c comes first in the input
+    ordered = order_stops_nearest_neighbour_spatial(
+        stops=[a, c, b], distance_fn=haversine_distance_fn()
+    )
+
+    assert ordered == order_stops_nearest_neighbour(
+        stops=[a, c, b], distance_fn=haversine_distance_fn()
+    )
+    assert ordered[1] == c
+
+
+def test_spatial_ordering_without_pruning_still_matches():
+    stops = _random_stops(30, seed=9)
+
+    def zero_distance_fn(a, b):
+        return (0.0, 0.0)
+
+    assert order_stops_nearest_neighbour_spatial(
+        stops=stops, distance_fn=zero_distance_fn, lower_bound_scale=0.0
+    ) == order_stops_nearest_neighbour(stops=stops, distance_fn=zero_distance_fn)
@@ -0,0 +1,118 @@
+import asyncio
+import math
+import random
+import time
+
+import pytest
+
+from gotrippee.distance.aio import async_distance_fn
+from gotrippee.domain.models import Location
+from gotrippee.planner import plan_route
+from gotrippee.planner.streaming import LegUpdate, stream_route, stream_route_async
+
+
+def _trip(n, seed=5):
+    rng = random.Random(seed)
+    locs = [
+        Location(name=f"L{i}", latitude=rng.uniform(0, 5), longitude=rng.uniform(0, 5))
+        for i in range(n)
+    ]
+
+    def distance_fn(a, b):
+        d = round(abs(a.latitude - b.latitude) + abs(a.longitude - b.longitude), 1)
+        return (d, d * 3)
+
+    return locs, distance_fn
+
+
+def test_stream_yields_legs_with_running_totals():
+    locs, distance_fn = _trip(6)
+    updates = list(stream_route(stops=locs, distance_fn=distance_fn))
+
+    assert [u.index for u in updates] == [0, 1, 2, 3, 4]
+    assert all(isinstance(u, LegUpdate) for u in updates)
+    running = 0.0
+    for u, (a, b) in zip(updates, zip(locs, locs[1:], strict=False), strict=True):
+        assert (u.leg.start, u.leg.end) == (a, b)
+        running += u.leg.distance_km
+        assert u.total_distance_km == pytest.approx(running)
+
+
+def test_first_leg_needs_a_single_lookup():
+    locs, distance_fn = _trip(8)
+    calls = []
+
+    def counting(a, b):
+        calls.append((a, b))
+        return distance_fn(a, b)
+
+    stream = stream_route(stops=locs, distance_fn=counting)
+    first = next(stream)
+    assert first.index == 0
+    assert len(calls) == 1
+
+    assert stream.plan() == plan_route(stops=locs, distance_fn=distance_fn)
+    assert len(calls) == len(locs) - 1
+
+
+def test_stream_requires_two_stops():
+    locs, distance_fn = _trip(1)
+    with pytest.raises(ValueError):
+        stream_route(stops=locs, distance_fn=distance_fn)
+    with pytest.raises(ValueError):
+        stream_route_async(stops=locs)
+
+
+def test_stream_plan_rejects_nan_leg_values():
+    locs, _ = _trip(3)
+
+    stream = stream_route(stops=locs, distance_fn=lambda a, b: (math.nan, 1.0))
+
+    with pytest.raises(ValueError, match="distance_km must not be NaN"):
+        stream.plan()
+
+
+def test_async_stream_runs_lookups_concurrently_in_order():
+    locs, distance_fn = _trip(10)
+
+    def slow(a, b):
+        time.sleep(0.05)
+        return distance_fn(a, b)
+
+    afn = async_distance_fn(slow, max_concurrency=10)
+
+    async def run():
+        stream = stream_route_async(stops=locs, distance_fn=afn)
+        started = time.perf_counter()
+        indices = [u.index async for u in stream]
+        elapsed = time.perf_counter() - started
+        return indices, elapsed, await stream.plan()
+
+    indices, elapsed, plan = asyncio.run(run())
+    assert indices == list(range(len(locs) - 1))
+    assert elapsed < 0.05 * (len(locs) - 1)
+    assert plan == plan_route(stops=locs, distance_fn=distance_fn)
+
+
+def test_async_stream_cancels_remaining_lookups_on_error():
+    locs, _ = _trip(5)
+    cancelled = []
+
+    async def afn(a, b):
+        if a == locs[1]:
+            raise RuntimeError("backend down")
+        try:
+            await asyncio.sleep(0 if a == locs[0] else 5)
+        except asyncio.CancelledError:
+            cancelled.append(a)
+            raise
+        return (1.0, 1.0)
+
+    async def run():
+        stream = stream_route_async(stops=locs, distance_fn=afn)
+        with pytest.raises(RuntimeError):
+            await stream.plan()
+        await asyncio.sleep(0)
+
+    asyncio.run(run())
+    assert sorted(c.name for c in cancelled) == ["L2", "L3"]